@@ -16,6 +16,15 @@ class Settings(BaseSettings):
     
     # LLM API
     GROQ_API_KEY: Optional[str] = None
+    llm_base_url: Optional[str] = None  # Groq-compatible endpoint (None = Groq)
+    llm_timeout_seconds: float = 20.0   # per call; question generation gets 2x
+    llm_max_retries: int = 1
+    llm_max_concurrency: int = 8        # in-flight LLM calls per process (= pool size)
+    eval_tiering: bool = True           # skip the LLM when the pre-score is decisive
+    eval_local_weak_below: float = 45.0    # confidence band entirely below → local "weak"
+    eval_local_strong_above: float = 75.0  # confidence band entirely above → local "strong"
+    # Surrogate of the LLM score (training/train_surrogate.py); missing = composite anchor
+    surrogate_model_path: Optional[str] = "artifacts/surrogate_scorer.json"
     
     # Server
     host: str = "0.0.0.0"
@@ -25,10 +34,40 @@ class Settings(BaseSettings):
     speech_recognition_mode: Literal["whisper", "browser", "hybrid"] = "hybrid"
     whisper_model_size: Literal["tiny", "base", "small", "medium", "large"] = "base"
     whisper_enabled: bool = True  # Can be disabled if model fails to load
+    transcription_concurrency: int = 1  # Whisper replicas = parallel transcriptions
+    # "chunk": Whisper per audio chunk; "answer": once per answer on the
+    # buffered audio; "segment": per pause-closed segment, in the background
+    transcription_mode: Literal["chunk", "answer", "segment"] = "segment"
+    transcription_session_jobs: int = 2  # deferred Whisper jobs in flight per session
     
     # Performance settings
     max_audio_chunk_size_mb: float = 5.0  # Max audio chunk size for Whisper
     enable_gpu: bool = True  # Try to use GPU if available
+    inference_workers: int = 0  # Shared analysis pool size (0 = os.cpu_count())
+
+    # Cross-session HSEmotion micro-batching
+    emotion_batching_enabled: bool = True
+    emotion_batch_max_size: int = 16        # crops per ONNX run
+    emotion_batch_max_wait_ms: float = 4.0  # max time a crop waits for a batch
+
+    # Face tracking — crop MediaPipe input to the last face box
+    face_roi_tracking: bool = True
+    face_mesh_input_size: int = 320  # longest side fed to FaceMesh (0 = full res)
+
+    # Pitch tracking — "yin": vectorized, speech range, voiced frames only;
+    # "pyin": librosa.pyin C2–C7 (slower, used as the accuracy reference)
+    pitch_engine: Literal["yin", "pyin"] = "yin"
+
+    # Voice-activity gate — silent chunks skip pitch / Whisper entirely
+    vad_energy_db: float = -45.0   # 20 ms frame power above this (dBFS) ...
+    vad_zcr_max: float = 0.30      # ... and zero-crossing rate below this = voiced
+    vad_hangover_ms: float = 200.0 # voiced frames widened by this on each side
+
+    # Per-session media ingestion (video is always latest-frame-wins)
+    ingest_audio_ring_size: int = 8  # audio chunks buffered before dropping oldest
+
+    # Hot-path timing — stage timings attached to every Nth analytics message
+    timing_sample_every: int = 30  # 0 = never attach
     
     class Config:
         env_file = ".env"
@@ -2,6 +2,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .config import settings
 from .database import connect_to_mongo, close_mongo_connection
+from .services.inference_engine import get_inference_engine, shutdown_inference_engine
 from .routers import auth, sessions, analytics, websocket
 
 # Create FastAPI app
@@ -32,12 +33,15 @@ async def startup_db_client():
     """Connect to MongoDB on startup."""
     await connect_to_mongo()
     print("✅ Connected to MongoDB")
+    # Load shared models once so the first interview doesn't pay for it
+    get_inference_engine()
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
     """Close MongoDB connection on shutdown."""
     await close_mongo_connection()
     print("❌ Closed MongoDB connection")
+    await shutdown_inference_engine()
 
 # Include routers
 app.include_router(auth.router)
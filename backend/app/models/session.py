@@ -34,6 +34,8 @@ class VideoSnapshot(BaseModel):
     issue_counts:             Dict[str, int] = {}     # {poor_eye_contact:3, ...}
     eye_closed_count:         int   = 0
     emotion_model:            str   = "HSEmotion EfficientNet-B2 (AffectNet)"
+    emotion_inferences:       int   = 0   # HSEmotion runs actually performed
+    emotion_inferences_skipped: int = 0   # frames that reused the last result
 
 
 # ─────────────────────────── Per-answer audio snapshot ───────────────────────
@@ -92,6 +94,7 @@ class InterviewResponse(BaseModel):
     llm_score:          Optional[float] = None   # 0-100, anchored by pre_score
     llm_feedback:       str = ""                  # short per-answer feedback
     llm_decision:       str = "next_question"     # next_question / follow_up / end
+    evaluation_tier:    str = "llm"               # llm / local_weak / local_strong / fallback
 
     # Analytics per answer
     video_analytics:    Optional[VideoSnapshot] = None
@@ -9,7 +9,7 @@ from ..schemas.session import (
     SessionCompare,
 )
 from ..routers.auth import get_current_user
-from ..services.llm_service import LLMService
+from ..services.inference_engine import get_inference_engine
 from ..utils.session_naming import generate_session_name, get_next_session_number
 import PyPDF2
 import json
@@ -131,7 +131,7 @@ async def create_session(
         )
 
     # Generate questions
-    llm_service = LLMService()
+    llm_service = get_inference_engine().llm_service
     try:
         questions = await llm_service.generate_interview_questions(
             job_description=session_create.job_description,
@@ -227,6 +227,7 @@ async def get_session_detail(
             "pre_score":       resp.get("pre_score", {}),
             "llm_score":       resp.get("llm_score"),
             "llm_feedback":    resp.get("llm_feedback", ""),
+            "evaluation_tier": resp.get("evaluation_tier", "llm"),
             "video_analytics": resp.get("video_analytics", {}),
             "audio_analytics": resp.get("audio_analytics", {}),
             "warnings_shown":  resp.get("warnings_shown", []),
@@ -11,28 +11,43 @@ Changes from original:
   - answer handler: tracks follow_ups_given per question
   - answer handler: saves question_number, pre_score, llm_score to MongoDB
   - end_session: saves AnalyticsModel to analytics collection
+  - socket reads happen in a dedicated reader task: media goes to a
+    per-session MediaIngest (latest-wins video, small audio ring) drained
+    by worker tasks, control messages go to the main loop's queue
+  - answer handler: evaluation and follow-up generation overlap when the
+    rules already require a follow-up (services/answer_pipeline.py)
+  - answer handler: the first follow-up is the question's stored follow_up
+    (no LLM call); a tailored one is generated only when it is missing
   - All other logic kept exactly as original
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException
 from typing import Dict, Optional
 import json
+import time
 import asyncio
 from datetime import datetime
 from bson import ObjectId
 
+from ..config import settings
 from ..database import get_database
 from ..services.real_time_monitor import RealTimeMonitor
-from ..services.llm_service import LLMService
+from ..services.inference_engine import get_inference_engine
 from ..services.feedback_generator import FeedbackGenerator
 from ..services.answer_scorer import AnswerScorer
+from ..services.answer_pipeline import run_answer_llm
+from ..services.transcript_scanner import COMMON_WORDS, scan_transcript
+from ..services.media_ingest import MediaIngest
 from ..utils.auth import decode_access_token
+from ..utils.media_protocol import parse_media_packet, MediaProtocolError, PCM_CODECS
+from ..utils.timing import answer_timings
 
 router = APIRouter()
 
 # Store active WebSocket connections and monitors
 active_connections: Dict[str, WebSocket] = {}
 session_monitors:   Dict[str, RealTimeMonitor] = {}
+session_ingest:     Dict[str, MediaIngest] = {}
 
 
 # ─────────────────────────── Connection manager ──────────────────────────────
@@ -62,11 +77,12 @@ class ConnectionManager:
         print(f"WebSocket connected for session: {session_id}")
 
     def disconnect(self, session_id: str):
-        """Remove WebSocket connection."""
+        """Remove WebSocket connection and drop the session's analysis state."""
         if session_id in self.active_connections:
             del self.active_connections[session_id]
-        if session_id in session_monitors:
-            del session_monitors[session_id]
+        # Monitors only hold per-session state — shared models stay loaded
+        session_monitors.pop(session_id, None)
+        session_ingest.pop(session_id, None)
         print(f"WebSocket disconnected for session: {session_id}")
 
     async def send_message(self, session_id: str, message: dict):
@@ -111,15 +127,20 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
       {"type": "auth",        "token": "jwt_token"}
       {"type": "video_frame", "data": "base64_image",  "timestamp": 123}
       {"type": "audio_chunk", "data": "base64_audio",  "transcript": "...", "timestamp": 123}
+      {"type": "audio_chunk", "data": "base64_pcm", "format": "pcm_s16le" | "pcm_f32le",
+                              "sample_rate": 16000, "channels": 1, "transcript": "..."}
       {"type": "answer",      "question": "...",        "answer": "...", "duration": 30.5}
       {"type": "end_session"}
       {"type": "ping"}
+      <binary frame>  24-byte header + raw JPEG / PCM / WebM-Opus payload
+                      (see utils/media_protocol.py) — preferred media path
 
     Server → Client messages:
       {"type": "auth_success",          "user": "Name"}
       {"type": "session_started",       "total_questions": N}
       {"type": "next_question",         "question": {...}, "question_number": N, "total_questions": N}
-      {"type": "analytics",             "data": {"video": {...}, "timestamp": "..."}}
+      {"type": "analytics",             "data": {"video": {...}, "timestamp": "...",
+                                                 "timings_ms": {...}  ← every Nth frame}}
       {"type": "intervention",          "intervention": {...}, "should_interrupt": bool}
       {"type": "answer_feedback",       "feedback": "...", "score": N, "pre_score": N, "action": "..."}
       {"type": "all_questions_complete","message": "..."}
@@ -156,12 +177,175 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
             except:
                 break
 
-    asyncio.create_task(heartbeat())
+    heartbeat_task = asyncio.create_task(heartbeat())
+
+    def first_name() -> str:
+        return current_user.get("full_name", "there").split()[0] \
+               if current_user else "there"
+
+    # ── Media handlers (shared by JSON and binary frames) ────────────────────
+    video_frames_sent = 0
+
+    async def handle_video_frame(frame_data, seq: Optional[int] = None):
+        nonlocal video_frames_sent
+        monitor = session_monitors.get(session_id)
+        if monitor is None or not frame_data:
+            return
+
+        analysis = await monitor.analyze_frame_realtime(
+            video_frame=frame_data,
+            user_name=first_name(),
+        )
+        # video_frame handler — send consistent shape
+        payload = {
+            "video":     analysis.get("video_analysis", {}),
+            "audio":     {},
+            "warnings":  analysis.get("warnings", []),
+            "timestamp": analysis["timestamp"],
+        }
+        if seq is not None:
+            payload["seq"] = seq
+
+        # Sampled per-stage timings of the last analysed frame (debugging)
+        video_frames_sent += 1
+        every = settings.timing_sample_every
+        if every and video_frames_sent % every == 0:
+            payload["timings_ms"] = {
+                stage: round(ms, 2)
+                for stage, ms in monitor.video_state.last_timings.items()
+            }
+        await manager.send_message(session_id, {"type": "analytics", "data": payload})
+
+        if analysis.get("intervention"):
+            await manager.send_message(session_id, {
+                "type":             "intervention",
+                "intervention":     analysis["intervention"],
+                "should_interrupt": analysis.get("should_interrupt", False),
+            })
+
+    async def handle_audio_chunk(
+        audio_data,
+        transcript:  Optional[str] = None,
+        codec:       Optional[str] = None,
+        sample_rate: int = 0,
+        channels:    int = 1,
+        seq:         Optional[int] = None,
+    ):
+        monitor = session_monitors.get(session_id)
+        if monitor is None or not audio_data:
+            return
+
+        analysis = await monitor.analyze_frame_realtime(
+            video_frame=None,
+            audio_chunk=audio_data,
+            transcript=transcript,
+            user_name=first_name(),
+            audio_codec=codec,
+            audio_rate=sample_rate,
+            audio_channels=channels,
+        )
+
+        if analysis.get("audio_analysis"):
+            payload = {
+                "video":     analysis.get("video_analysis", {}),
+                "audio":     analysis["audio_analysis"],
+                "warnings":  analysis.get("warnings", []),
+                "timestamp": analysis["timestamp"],
+            }
+            if seq is not None:
+                payload["seq"] = seq
+            await manager.send_message(session_id, {"type": "analytics", "data": payload})
+
+        if analysis.get("intervention"):
+            await manager.send_message(session_id, {
+                "type":             "intervention",
+                "intervention":     analysis["intervention"],
+                "should_interrupt": analysis.get("should_interrupt", False),
+            })
+
+    def handle_audio_gap():
+        monitor = session_monitors.get(session_id)
+        if monitor is not None:
+            monitor.audio_analyzer.mark_gap(monitor.audio_state)
+
+    # ── Bounded media ingestion: workers run the handlers above ──────────────
+    ingest = MediaIngest(
+        on_video=handle_video_frame,
+        on_audio=handle_audio_chunk,
+        on_audio_gap=handle_audio_gap,
+    )
+    session_ingest[session_id] = ingest
+
+    def offer_media_packet(raw: bytes):
+        """Binary media frame: fixed header + raw JPEG / PCM / Opus bytes."""
+        try:
+            packet = parse_media_packet(raw)
+        except MediaProtocolError as e:
+            print(f"[WebSocket] Bad media frame for {session_id}: {e}")
+            return
+
+        if packet.is_video:
+            ingest.offer_video(packet.payload, seq=packet.seq)
+        else:
+            ingest.offer_audio(
+                packet.payload,
+                transcript=packet.transcript,
+                codec=packet.codec,
+                sample_rate=packet.sample_rate,
+                channels=packet.channels,
+                seq=packet.seq,
+            )
+
+    # ── Socket reader: media → ingest, everything else → control_queue ───────
+    control_queue: asyncio.Queue = asyncio.Queue()
+
+    async def reader():
+        try:
+            while True:
+                raw = await websocket.receive()
+                if raw["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(raw.get("code", 1000))
+
+                # Binary media frame
+                if raw.get("bytes") is not None:
+                    if is_authenticated:
+                        offer_media_packet(raw["bytes"])
+                    continue
+
+                message      = json.loads(raw.get("text") or "")
+                message_type = message.get("type")
+
+                # Legacy base64 JSON media
+                if message_type == "video_frame":
+                    if is_authenticated and message.get("data"):
+                        ingest.offer_video(message["data"])
+                    continue
+                if message_type == "audio_chunk":
+                    if is_authenticated and message.get("data"):
+                        # Optional raw PCM declaration: base64 int16 / float32
+                        # samples skip container decoding entirely
+                        codec = message.get("format")
+                        ingest.offer_audio(
+                            message["data"],
+                            transcript=message.get("transcript"),
+                            codec=codec if codec in PCM_CODECS else None,
+                            sample_rate=int(message.get("sample_rate") or 0),
+                            channels=int(message.get("channels") or 1),
+                        )
+                    continue
+
+                await control_queue.put(message)
+        except Exception as e:
+            # Disconnects and bad frames are re-raised by the main loop
+            await control_queue.put(e)
+
+    reader_task          = None
+    prefetched_follow_up = None     # tailored follow-up for the current question
 
     try:
-        # Services
-        llm_service        = LLMService()
-        feedback_generator = FeedbackGenerator()
+        # Services (LLM client shared process-wide via the inference engine)
+        llm_service        = get_inference_engine().llm_service
+        feedback_generator = FeedbackGenerator(llm_service)
         answer_scorer      = AnswerScorer()
 
         # Session state
@@ -179,11 +363,13 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                 position=session["position"],
             )
 
-        # ── Main message loop ─────────────────────────────────────────────────
+        reader_task = asyncio.create_task(reader())
+
+        # ── Main message loop (control messages only) ─────────────────────────
         while True:
-            data         = await websocket.receive_text()
-            print(f"[DEBUG] Raw message received, length: {len(data)}, starts with: {data[:50]}")
-            message      = json.loads(data)
+            message = await control_queue.get()
+            if isinstance(message, Exception):
+                raise message
             message_type = message.get("type")
 
             # ── Auth ──────────────────────────────────────────────────────────
@@ -238,85 +424,9 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                     })
                 continue
 
-            # ── Video frame ───────────────────────────────────────────────────
-            if message_type == "video_frame":
-                print(f"[DEBUG] video_frame received")   # ← ADD
-                if session_id not in session_monitors:
-                    print(f"[DEBUG] no monitor found!")  # ← ADD
-                    continue
-
-                monitor    = session_monitors[session_id]
-                frame_data = message.get("data")
-                print(f"[DEBUG] frame_data length: {len(frame_data) if frame_data else 0}")  # ← ADD
-                user_first = current_user.get("full_name", "there").split()[0] \
-                             if current_user else "there"
-
-                analysis = await monitor.analyze_frame_realtime(
-                    video_frame=frame_data,
-                    user_name=user_first,
-                )
-                # Temporarily add this before BOTH send_message calls:
-                print(f"[ANALYTICS SEND] video keys: {list(analysis.get('video_analysis', {}).keys())}, warnings: {analysis.get('warnings', [])}")
-                # video_frame handler — send consistent shape
-                await manager.send_message(session_id, {
-                    "type": "analytics",
-                    "data": {
-                        "video":     analysis.get("video_analysis", {}),
-                        "audio":     {},                              # ← add empty audio
-                        "warnings":  analysis.get("warnings", []),   # ← add warnings
-                        "timestamp": analysis["timestamp"],
-                    },
-                })
-
-                if analysis.get("intervention"):
-                    await manager.send_message(session_id, {
-                        "type":             "intervention",
-                        "intervention":     analysis["intervention"],
-                        "should_interrupt": analysis.get("should_interrupt", False),
-                    })
-
-            # ── Audio chunk ───────────────────────────────────────────────────
-            elif message_type == "audio_chunk":
-                print(f"[DEBUG] audio_chunk received")  # ← ADD
-                if session_id not in session_monitors:
-                    continue
-
-                monitor    = session_monitors[session_id]
-                audio_data = message.get("data")
-                transcript = message.get("transcript")
-                user_first = current_user.get("full_name", "there").split()[0] \
-                             if current_user else "there"
-
-                analysis = await monitor.analyze_frame_realtime(
-                    video_frame=None,
-                    audio_chunk=audio_data,
-                    transcript=transcript,
-                    user_name=user_first,
-                )
-                
-                # Temporarily add this before BOTH send_message calls:
-                print(f"[ANALYTICS SEND] video keys: {list(analysis.get('video_analysis', {}).keys())}, warnings: {analysis.get('warnings', [])}")
-
-                if analysis.get("audio_analysis"):
-                     await manager.send_message(session_id, {
-                        "type": "analytics",
-                        "data": {
-                            "video":    analysis.get("video_analysis", {}),
-                            "audio":    analysis["audio_analysis"],
-                            "warnings": analysis.get("warnings", []),
-                            "timestamp": analysis["timestamp"],
-                        },
-                     })
-
-                if analysis.get("intervention"):
-                    await manager.send_message(session_id, {
-                        "type":             "intervention",
-                        "intervention":     analysis["intervention"],
-                        "should_interrupt": analysis.get("should_interrupt", False),
-                    })
-
             # ── Answer submitted ──────────────────────────────────────────────
-            elif message_type == "answer":
+            if message_type == "answer":
+                answer_received = time.perf_counter()
                 question_text = message.get("question", "")
                 answer_text   = message.get("answer", "").strip()
                 duration      = message.get("duration", 0)
@@ -341,6 +451,11 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                     # Move to next question
                     question_index += 1
                     follow_ups_given = 0
+                    if prefetched_follow_up is not None:
+                        prefetched_follow_up.cancel()
+                        prefetched_follow_up = None
+                    if monitor:
+                        monitor.reset_answer()
                     
                     # Skip LLM evaluation entirely
                     if question_index < len(questions):
@@ -359,13 +474,9 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                     continue 
                 
                 # Check 2: Off-topic answer (very few question keywords in answer)
-                question_words = set(question_text.lower().split())
-                answer_words = set(answer_text.lower().split())
-                
-                # Remove common words (a, the, is, etc)
-                common_words = {'a', 'the', 'is', 'are', 'an', 'and', 'or', 'but', 'in', 'at', 'to', 'for', 'of', 'with', 'by'}
-                question_keywords = question_words - common_words
-                answer_keywords = answer_words - common_words
+                # (same cached scan AnswerScorer reuses; common words removed)
+                question_keywords = scan_transcript(question_text).keywords(COMMON_WORDS)
+                answer_keywords = scan_transcript(answer_text).keywords(COMMON_WORDS)
                 
                 # Calculate relevance: how many question keywords appear in answer
                 keyword_overlap = len(question_keywords & answer_keywords)
@@ -384,6 +495,11 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                     
                     question_index += 1
                     follow_ups_given = 0
+                    if prefetched_follow_up is not None:
+                        prefetched_follow_up.cancel()
+                        prefetched_follow_up = None
+                    if monitor:
+                        monitor.reset_answer()
                     
                     if question_index < len(questions):
                         await manager.send_message(session_id, {
@@ -400,6 +516,9 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                     continue
 
                 # ── Step 1: Get per-answer snapshot from analyzers ────────────
+                # (deferred Whisper transcript of the whole answer first)
+                if monitor:
+                    await monitor.finalize_answer_transcript()
                 answer_snapshot = monitor.get_answer_snapshot() if monitor else {
                     "video": {}, "audio": {}, "warnings_shown": []
                 }
@@ -415,22 +534,28 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                     word_count=audio_snap.get("word_count", 0),
                 )
 
-                # ── Step 3: LLM evaluation anchored by pre_score ──────────────
-                evaluation = await llm_service.evaluate_answer_quality(
+                # ── Steps 3-4: LLM evaluation anchored by pre_score, then the
+                # server-side decision; the first follow-up is the question's
+                # stored one, else one the rules already require is generated
+                # alongside the evaluation
+                stored_follow_up = questions[question_index].get("follow_up", "") \
+                                   if question_index < len(questions) else ""
+                answer_llm = await run_answer_llm(
+                    llm_service,
                     question=question_text,
                     answer=answer_text,
-                    expected_type=question_type,
-                    pre_score=pre_score,
-                )
-
-                # ── Step 4: Decide next action (server-side logic) ────────────
-                decision = await llm_service.decide_next_action(
-                    evaluation=evaluation,
+                    question_type=question_type,
                     pre_score=pre_score,
                     question_number=question_index + 1,
                     total_questions=len(questions),
                     follow_ups_given=follow_ups_given,
+                    context=session.get("job_description", ""),
+                    stored_follow_up=stored_follow_up,
+                    prefetched=prefetched_follow_up,
                 )
+                evaluation           = answer_llm["evaluation"]
+                decision             = answer_llm["decision"]
+                prefetched_follow_up = answer_llm["prefetch_task"]
 
                 # ── Step 5: Build response record for MongoDB ─────────────────
                 response_data = {
@@ -449,6 +574,7 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                     "llm_score":        evaluation.get("overall_score"),
                     "llm_feedback":     evaluation.get("feedback", ""),
                     "llm_decision":     decision["action"],
+                    "evaluation_tier":  evaluation.get("evaluation_tier", "llm"),
 
                     # Analytics snapshots
                     "video_analytics":  video_snap,
@@ -486,11 +612,7 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                 if decision["action"] == "follow_up":
                     follow_ups_given += 1
 
-                    followup_q = await llm_service.generate_follow_up_question(
-                        previous_question=question_text,
-                        user_answer=answer_text,
-                        context=session.get("job_description", ""),
-                    )
+                    followup_q = await answer_llm["follow_up_task"]
 
                     await manager.send_message(session_id, {
                         "type":            "next_question",
@@ -532,8 +654,15 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                                        "Generating your feedback report...",
                         })
 
+                # Answer received → next prompt sent (what the candidate waits)
+                answer_timings.record_frame({
+                    "answer_to_next": (time.perf_counter() - answer_received) * 1000.0,
+                })
+
             # ── End session ───────────────────────────────────────────────────
             elif message_type == "end_session":
+                # Stop analysis so the summary below is final
+                await ingest.close()
                 session_end_time = datetime.utcnow()
                 session_duration = (
                     (session_end_time - session_start_time).total_seconds() / 60
@@ -578,6 +707,7 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                         "total_distraction_frames":  session_summary["video_summary"].get("frames_analyzed", 0),
                         "emotion_model_used":        session_summary["video_summary"].get("emotion_model", "HSEmotion EfficientNet-B2"),
                         "issue_frequency":           session_summary.get("issue_history", {}),
+                        "media_ingest":              ingest.stats(),
 
                         # Audio
                         "avg_speaking_pace_wpm":     session_summary["audio_summary"].get("average_speaking_pace", 0),
@@ -586,6 +716,8 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                         "pitch_variation":           session_summary["audio_summary"].get("pitch_variation", 0),
                         "total_filler_words":        session_summary["audio_summary"].get("total_filler_words", 0),
                         "total_speaking_time_seconds":session_summary["audio_summary"].get("total_speaking_time_seconds", 0),
+                        "transcript_sources":        monitor.transcripts.stats(),
+                        "audio_stage_share":         session_summary["audio_summary"].get("stage_share", {}),
 
                         # Content
                         "total_questions_answered":  len(responses),
@@ -641,6 +773,7 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
                 })
 
                 await websocket.close(code=1000, reason="Session completed")
+                manager.disconnect(session_id)
                 break
 
             # ── Ping ──────────────────────────────────────────────────────────
@@ -671,6 +804,19 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
         except:
             pass
 
+    finally:
+        heartbeat_task.cancel()
+        if prefetched_follow_up is not None:
+            prefetched_follow_up.cancel()
+        if reader_task is not None:
+            reader_task.cancel()
+        await ingest.close()
+        stats = ingest.stats()
+        if stats["video"]["dropped"] or stats["audio"]["dropped"]:
+            print(f"[WebSocket] Session {session_id} dropped "
+                  f"{stats['video']['dropped']} video / "
+                  f"{stats['audio']['dropped']} audio under load")
+
 
 # ─────────────────────────── Status endpoint ─────────────────────────────────
 
@@ -681,4 +827,37 @@ async def get_websocket_status(session_id: str):
         "session_id":               session_id,
         "is_connected":             session_id in manager.active_connections,
         "active_connections_count": len(manager.active_connections),
-    }
\ No newline at end of file
+        "media_ingest":             session_ingest[session_id].stats()
+                                    if session_id in session_ingest else None,
+        "transcript_sources":       session_monitors[session_id].transcripts.stats()
+                                    if session_id in session_monitors else None,
+    }
+
+
+# ─────────────────────────── Pipeline timings ────────────────────────────────
+
+@router.get("/ws/timings")
+async def get_pipeline_timings():
+    """Process-wide per-stage pipeline latency (all sessions)."""
+    engine = get_inference_engine()
+    return {
+        "video":         engine.video_analyzer.get_timings(),
+        "audio":         engine.audio_analyzer.get_timings(),
+        "transcription": engine.transcription.get_timings(),
+        "llm":           engine.llm_service.get_timings(),
+        "answers":       answer_timings.snapshot(),
+    }
+
+
+@router.get("/ws/timings/{session_id}")
+async def get_session_timings(session_id: str):
+    """Per-stage video + audio pipeline latency for one live session."""
+    monitor = session_monitors.get(session_id)
+    if monitor is None:
+        raise HTTPException(status_code=404, detail="No active session")
+    return {
+        "session_id": session_id,
+        "video":      monitor.video_analyzer.get_timings(monitor.video_state),
+        "face_roi":   monitor.video_analyzer.get_roi_stats(monitor.video_state),
+        "audio":      monitor.audio_analyzer.get_timings(monitor.audio_state),
+    }
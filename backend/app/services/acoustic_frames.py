@@ -0,0 +1,68 @@
+"""
+acoustic_frames.py
+==================
+One framing pass per audio chunk, shared by the acoustic features.
+
+Previously every chunk was framed three times: _analyze_volume called
+librosa.feature.rms, librosa.effects.split called it again internally for
+the silence mask, and the energy was a third pass over the squared signal.
+AcousticFrames frames the squared signal once (librosa's rms geometry:
+2048 / 512, centred, zero-padded) and derives from that:
+
+  - rms        : per-frame RMS          → volume level / consistency
+  - energy     : mean power of the chunk → energy_level
+  - nonsilent  : frames within top_db of the loudest → speech / pause
+                 intervals (same edges as librosa.effects.split)
+
+The numbers are the ones librosa produced before — same frames, same dB
+reference — so the analysis dict is unchanged.
+
+Pitch keeps its own framing: both engines need lag-sized windows, and YIN
+runs on audio decimated to 8 kHz (see pitch_tracker.py).
+
+Used by:
+  - audio_analyzer.py : analyze_samples() → volume + pauses
+"""
+
+import librosa
+import numpy as np
+
+FRAME_LENGTH = 2048
+HOP_LENGTH   = 512
+SILENCE_DB   = 30.0
+
+
+class AcousticFrames:
+    """Shared frame-level features of ONE chunk of mono float audio."""
+
+    __slots__ = ("n_samples", "sr", "energy", "rms", "nonsilent")
+
+    def __init__(self, y: np.ndarray, sr: int, top_db: float = SILENCE_DB):
+        self.n_samples = len(y)
+        self.sr        = sr
+
+        self.energy = float(np.sum(y ** 2) / len(y)) if len(y) else 0.0
+
+        # Squared before framing (librosa.util.abs2's float32 power) — the
+        # frames overlap 4x, so this is a quarter of rms()'s squaring work
+        squares = np.power(y, 2, dtype=np.float32)
+
+        pad    = FRAME_LENGTH // 2
+        frames = librosa.util.frame(np.pad(squares, (pad, pad), mode="constant"),
+                                    frame_length=FRAME_LENGTH, hop_length=HOP_LENGTH)
+        # Column-major copy → per-frame sums in the same order as librosa.rms
+        self.rms = np.sqrt(np.mean(np.asfortranarray(frames), axis=0))
+
+        db = librosa.amplitude_to_db(self.rms, ref=np.max, top_db=None)
+        self.nonsilent = db > -top_db
+
+    def intervals(self) -> np.ndarray:
+        """(start, end) sample pairs of non-silent audio, like effects.split."""
+        mask  = self.nonsilent
+        edges = [np.flatnonzero(np.diff(mask.astype(int))) + 1]
+        if mask[0]:
+            edges.insert(0, np.array([0]))
+        if mask[-1]:
+            edges.append(np.array([len(mask)]))
+        edges = np.concatenate(edges) * HOP_LENGTH
+        return np.minimum(edges, self.n_samples).reshape((-1, 2))
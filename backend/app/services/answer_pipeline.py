@@ -0,0 +1,157 @@
+"""
+answer_pipeline.py
+==================
+The LLM half of the answer handler: evaluation → decision → follow-up.
+
+websocket.py used to await these strictly in sequence, so a follow-up
+cost two serial LLM round-trips before the candidate saw the next prompt.
+Rules 1-3 of LLMService.decide_next_action() only need the pre-score and
+the counters. When they already settle on a follow-up (rule 3: weak
+answer), generation of the follow-up starts together with the evaluation.
+A speculative call that turns out to be unneeded is cancelled.
+
+Follow-up resolution, cheapest first:
+  1. stored     : the question's pre-generated "follow_up" (from
+                  generate_interview_questions) — first follow-up only,
+                  served with no LLM call
+  2. prefetched : a tailored follow-up generated in the background while
+                  the previous follow-up was being answered
+  3. llm        : generate_follow_up_question() now (or the speculative
+                  call already running)
+After a follow-up is served, the tailored one for the next round starts in
+the background — but only when the rules could still ask for another
+follow-up on this question (LLMService.can_follow_up).
+
+The follow-up comes back as a task, so the handler can save the response
+and send answer_feedback while it finishes.
+
+Stage timings go into the process-wide answer_timings, shown at
+/ws/timings: evaluation, evaluation_<tier> (local_weak / local_strong /
+llm / fallback — the counts show how much LLM traffic the local tiers
+save) and follow_up; answer_to_next is recorded by the handler.
+
+Used by:
+  - routers/websocket.py              : answer handler
+  - benchmarks/bench_answer_latency.py : sequential vs overlapped vs stored
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from .llm_service import LLMService
+from ..utils.timing import answer_timings
+
+
+async def run_answer_llm(
+    llm_service:      LLMService,
+    question:         str,
+    answer:           str,
+    question_type:    str,
+    pre_score:        Dict[str, Any],
+    question_number:  int,
+    total_questions:  int,
+    follow_ups_given: int,
+    context:          str = "",
+    stored_follow_up: str = "",
+    prefetched:       Optional[asyncio.Task] = None,
+    speculative:      bool = True,
+) -> Dict[str, Any]:
+    """
+    Evaluate one answer and decide what comes next.
+
+    Args:
+        stored_follow_up: the question's pre-generated follow-up ("" if none)
+        prefetched      : tailored follow-up started after the previous
+                          answer to this question (consumed or cancelled)
+
+    Returns:
+        {"evaluation": dict, "decision": dict,
+         "follow_up_task": awaitable → str, or None,
+         "follow_up_source": "stored" | "prefetched" | "llm" | None,
+         "prefetch_task": tailored follow-up for the next round, or None,
+         "speculative": bool — follow-up started before the evaluation}
+    """
+    use_stored = bool(stored_follow_up) and follow_ups_given == 0
+
+    follow_up_task: Optional[asyncio.Future] = None
+    if (speculative and not use_stored and prefetched is None
+            and llm_service.predicts_follow_up(
+                pre_score, question_number, total_questions, follow_ups_given)):
+        follow_up_task = _start_follow_up(llm_service, question, answer, context)
+    started_early = follow_up_task is not None
+
+    t = time.perf_counter()
+    try:
+        evaluation = await llm_service.evaluate_answer_quality(
+            question=question,
+            answer=answer,
+            expected_type=question_type,
+            pre_score=pre_score,
+        )
+    except BaseException:
+        for task in (follow_up_task, prefetched):
+            if task is not None:
+                task.cancel()
+        raise
+    evaluation_ms = (time.perf_counter() - t) * 1000.0
+    answer_timings.record_frame({
+        "evaluation": evaluation_ms,
+        f"evaluation_{evaluation.get('evaluation_tier', 'llm')}": evaluation_ms,
+    })
+
+    decision = await llm_service.decide_next_action(
+        evaluation=evaluation,
+        pre_score=pre_score,
+        question_number=question_number,
+        total_questions=total_questions,
+        follow_ups_given=follow_ups_given,
+    )
+
+    source        = None
+    prefetch_task = None
+    if decision["action"] == "follow_up":
+        if use_stored:
+            follow_up_task = asyncio.get_running_loop().create_future()
+            follow_up_task.set_result(stored_follow_up)
+            source = "stored"
+        elif prefetched is not None:
+            follow_up_task, prefetched = prefetched, None
+            source = "prefetched"
+        else:
+            if follow_up_task is None:
+                follow_up_task = _start_follow_up(llm_service, question, answer, context)
+            source = "llm"
+
+        if llm_service.can_follow_up(follow_ups_given + 1):
+            prefetch_task = _start_follow_up(llm_service, question, answer, context)
+    elif follow_up_task is not None:
+        follow_up_task.cancel()
+        follow_up_task = None
+
+    if prefetched is not None:
+        prefetched.cancel()
+
+    return {
+        "evaluation":       evaluation,
+        "decision":         decision,
+        "follow_up_task":   follow_up_task,
+        "follow_up_source": source,
+        "prefetch_task":    prefetch_task,
+        "speculative":      started_early,
+    }
+
+
+def _start_follow_up(llm_service: LLMService, question: str, answer: str,
+                     context: str) -> asyncio.Task:
+    async def generate() -> str:
+        t = time.perf_counter()
+        text = await llm_service.generate_follow_up_question(
+            previous_question=question,
+            user_answer=answer,
+            context=context,
+        )
+        answer_timings.record_frame({"follow_up": (time.perf_counter() - t) * 1000.0})
+        return text
+
+    return asyncio.create_task(generate())
@@ -19,46 +19,46 @@ Metrics calculated:
   - relevance_score      : keyword overlap between question and answer
   - sentence_clarity_score: avg sentence length (too long = rambling)
 
+Evaluation tiers:
+  confidence_band() turns the component spread into a range for the true
+  score. When that range is clearly weak or clearly strong, llm_service.py
+  skips the LLM and builds the evaluation locally from
+  summarize_pre_score().
+
 Used by:
-  - llm_service.py       : receives pre_score to anchor LLM evaluation
+  - llm_service.py       : receives pre_score to anchor LLM evaluation,
+                           decides the evaluation tier
   - websocket.py         : calls this before LLM evaluation
   - models/session.py    : PreScore saved per InterviewResponse
 """
 
+import math
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+from .transcript_scanner import STOPWORDS, TranscriptScan, scan_transcript
 
 
 # ─────────────────────────── STAR keywords ───────────────────────────────────
-# Grouped by STAR component — detecting these shows structured thinking
-
-STAR_KEYWORDS = {
-    "situation": [
-        "situation", "context", "background", "at the time", "when i was",
-        "i was working", "we were", "the project", "the team", "the company",
-        "in my previous", "at my last", "during my", "while i was",
-    ],
-    "task": [
-        "task", "responsibility", "my role", "i was responsible", "i needed to",
-        "i had to", "my goal", "the objective", "i was asked", "i was assigned",
-        "challenge", "problem to solve", "requirement",
-    ],
-    "action": [
-        "i did", "i decided", "i took", "i implemented", "i developed",
-        "i created", "i led", "i managed", "i worked with", "i collaborated",
-        "i reached out", "i built", "i designed", "i analysed", "i analyzed",
-        "my approach", "i first", "i then", "i started", "i resolved",
-        "i communicated", "i presented", "i proposed", "specifically i",
-    ],
-    "result": [
-        "result", "outcome", "impact", "achieved", "increased", "decreased",
-        "reduced", "improved", "saved", "delivered", "completed", "successfully",
-        "as a result", "which led to", "this resulted in", "we saw",
-        "the team", "the project", "percent", "%", "by the end",
-        "feedback was", "it was successful",
-    ],
+# STAR_KEYWORDS (grouped by component) and the relevance STOPWORDS live in
+# transcript_scanner.py, which matches them all in one pass over the answer
+
+# ─────────────────────────── Composite weights ───────────────────────────────
+# Weights reflect what matters most in a behavioral interview
+
+COMPOSITE_WEIGHTS = {
+    "word_count_score":       0.15,   # length matters but not most
+    "filler_word_score":      0.15,   # fluency
+    "star_keyword_score":     0.25,   # structure — most important
+    "specificity_score":      0.20,   # concrete examples
+    "relevance_score":        0.20,   # answered the question
+    "sentence_clarity_score": 0.05,   # sentence clarity
 }
 
+# The LLM score is clamped to composite ±15, so no band is wider than that
+MAX_BAND_HALF_WIDTH = 15.0
+MIN_BAND_HALF_WIDTH = 5.0
+
 # ─────────────────────────── Specificity patterns ────────────────────────────
 # Numbers, percentages, dates, proper nouns — signal concrete answers
 
@@ -122,11 +122,11 @@ class AnswerScorer:
             return self._empty_score()
 
         answer_clean = answer.strip()
-        answer_lower = answer_clean.lower()
+        scan         = scan_transcript(answer_clean)
 
         # Use word count from AudioAnalyzer if provided, else count from text
         if word_count == 0:
-            word_count = len(re.findall(r"\b\w+\b", answer_lower))
+            word_count = scan.word_count
 
         # ── 1. Word count score ───────────────────────────────────────────────
         wc_score = self._score_word_count(word_count)
@@ -135,27 +135,25 @@ class AnswerScorer:
         filler_score = self._score_filler_words(filler_count, word_count)
 
         # ── 3. STAR keyword score ─────────────────────────────────────────────
-        star_score, star_components = self._score_star_keywords(answer_lower)
+        star_score, star_components = self._score_star_keywords(scan)
 
         # ── 4. Specificity score ──────────────────────────────────────────────
         specificity_score, specificity_matches = self._score_specificity(answer_clean)
 
         # ── 5. Relevance score ────────────────────────────────────────────────
-        relevance_score, keywords_matched = self._score_relevance(
-            question.lower(), answer_lower)
+        relevance_score, keywords_matched = self._score_relevance(question, scan)
 
         # ── 6. Sentence clarity score ─────────────────────────────────────────
         clarity_score = self._score_sentence_clarity(answer_clean)
 
-        # ── Composite (weighted) ──────────────────────────────────────────────
-        # Weights reflect what matters most in a behavioral interview
+        # ── Composite (weighted, see COMPOSITE_WEIGHTS) ───────────────────────
         composite = (
-            wc_score          * 0.15 +   # length matters but not most
-            filler_score      * 0.15 +   # fluency
-            star_score        * 0.25 +   # structure — most important
-            specificity_score * 0.20 +   # concrete examples
-            relevance_score   * 0.20 +   # answered the question
-            clarity_score     * 0.05     # sentence clarity
+            wc_score          * COMPOSITE_WEIGHTS["word_count_score"] +
+            filler_score      * COMPOSITE_WEIGHTS["filler_word_score"] +
+            star_score        * COMPOSITE_WEIGHTS["star_keyword_score"] +
+            specificity_score * COMPOSITE_WEIGHTS["specificity_score"] +
+            relevance_score   * COMPOSITE_WEIGHTS["relevance_score"] +
+            clarity_score     * COMPOSITE_WEIGHTS["sentence_clarity_score"]
         )
 
         return {
@@ -223,16 +221,13 @@ class AnswerScorer:
         else:
             return max(0.0, 60.0 - (rate - 5) * 5)
 
-    def _score_star_keywords(self, answer_lower: str):
+    def _score_star_keywords(self, scan: TranscriptScan):
         """
         Detect which STAR components are present.
         4 components = 100, 3 = 75, 2 = 50, 1 = 25, 0 = 0
         Returns (score, list_of_found_components)
         """
-        found = []
-        for component, keywords in STAR_KEYWORDS.items():
-            if any(kw in answer_lower for kw in keywords):
-                found.append(component)
+        found = list(scan.star_components)
 
         score = (len(found) / 4) * 100
         return round(score, 1), found
@@ -255,24 +250,14 @@ class AnswerScorer:
         elif match_count == 3: return 80.0, match_count
         else:                  return 100.0, match_count
 
-    def _score_relevance(self, question_lower: str, answer_lower: str):
+    def _score_relevance(self, question: str, scan: TranscriptScan):
         """
         Keyword overlap between question and answer.
         Strips stopwords, checks how many question keywords appear in answer.
         Returns (score, matched_keyword_count)
         """
-        stopwords = {
-            "a","an","the","and","or","but","in","on","at","to","for",
-            "of","with","by","from","is","was","are","were","be","been",
-            "have","has","had","do","does","did","will","would","could",
-            "should","may","might","can","your","you","me","my","we",
-            "our","us","i","it","its","this","that","these","those",
-            "what","how","why","when","where","who","which","tell","describe",
-            "give","example","time","situation","please",
-        }
-
-        q_words = set(re.findall(r"\b\w+\b", question_lower)) - stopwords
-        a_words = set(re.findall(r"\b\w+\b", answer_lower))
+        q_words = scan_transcript(question).keywords(STOPWORDS)
+        a_words = scan.vocabulary
 
         if not q_words:
             return 50.0, 0   # can't score relevance without question keywords
@@ -329,17 +314,104 @@ class AnswerScorer:
         }
 
 
+# ─────────────────────────── Evaluation tier helpers ─────────────────────────
+
+def confidence_band(
+    pre_score: Dict[str, Any],
+    centre:    Optional[float] = None,
+) -> Tuple[float, float]:
+    """
+    Range the answer's true score most likely falls in.
+
+    Centred on centre (the score anchor — llm_service passes the surrogate
+    estimate when one is trained), else on composite_pre_score. The
+    half-width is half the weighted spread of the six components around
+    the composite, between 5 and 15. Components that agree (all high, all
+    low) give a narrow band; mixed signals widen it up to the LLM's own
+    ±15 clamp.
+    """
+    composite = pre_score.get("composite_pre_score", 0.0)
+    centre    = composite if centre is None else centre
+    spread    = math.sqrt(sum(
+        weight * (pre_score.get(name, 0.0) - composite) ** 2
+        for name, weight in COMPOSITE_WEIGHTS.items()
+    ))
+    half = min(MAX_BAND_HALF_WIDTH, max(MIN_BAND_HALF_WIDTH, spread / 2))
+    return (round(max(0.0, centre - half), 1),
+            round(min(100.0, centre + half), 1))
+
+
+def summarize_pre_score(pre_score: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """
+    Strengths and improvements read off the pre-score components,
+    strongest / weakest first, heavier weight first on ties (at most 3
+    each). Used for evaluations
+    built without the LLM.
+    """
+    words       = pre_score.get("word_count_used", 0)
+    star_found  = pre_score.get("star_components_found", [])
+    star_missing = [c for c in ["situation","task","action","result"]
+                    if c not in star_found]
+
+    # component → (strength, improvement)
+    notes = {
+        "word_count_score": (
+            f"Well-sized answer ({words} words)",
+            f"Answer is too short ({words} words) — aim for 80-300 words"
+            if words < AnswerScorer.MIN_WORDS_GOOD else
+            f"Answer runs long ({words} words) — keep it under 300 words",
+        ),
+        "filler_word_score": (
+            "Fluent delivery with few filler words",
+            "Cut filler words (um, uh, like, you know)",
+        ),
+        "star_keyword_score": (
+            f"Clear STAR structure ({', '.join(star_found)})",
+            f"Structure the answer with STAR — missing: {', '.join(star_missing)}",
+        ),
+        "specificity_score": (
+            "Concrete details — numbers, dates or names",
+            "Add concrete numbers, dates, names or measurable results",
+        ),
+        "relevance_score": (
+            "Stays focused on the question asked",
+            "Address the question more directly — reuse its key terms",
+        ),
+        "sentence_clarity_score": (
+            "Clear, well-paced sentences",
+            "Keep sentences between 10 and 25 words",
+        ),
+    }
+
+    def score(name):
+        return pre_score.get(name, 0.0)
+
+    best_first  = sorted(COMPOSITE_WEIGHTS, key=lambda n: (-score(n), -COMPOSITE_WEIGHTS[n]))
+    worst_first = sorted(COMPOSITE_WEIGHTS, key=lambda n: (score(n), -COMPOSITE_WEIGHTS[n]))
+    strengths    = [notes[n][0] for n in best_first  if score(n) >= 75][:3]
+    improvements = [notes[n][1] for n in worst_first if score(n) < 60][:3]
+    return strengths, improvements
+
+
 # ─────────────────────────── LLM prompt helper ───────────────────────────────
 
-def build_scoring_context(pre_score: Dict[str, Any]) -> str:
+def build_scoring_context(pre_score: Dict[str, Any], anchor: Optional[float] = None) -> str:
     """
     Build the pre-score context string to inject into the LLM prompt.
     This is what anchors the LLM so it can't randomly be too generous/strict.
 
+    anchor: centre of the ±15 range — the surrogate model's estimate when
+    one is trained, else composite_pre_score.
+
     Usage in llm_service.py:
-        context = build_scoring_context(pre_score)
+        context = build_scoring_context(pre_score, anchor)
         prompt = f"...evaluate this answer...\\n\\n{context}"
     """
+    if anchor is None:
+        anchor, anchor_name = pre_score["composite_pre_score"], "composite pre-score"
+    else:
+        anchor_name = "calibrated anchor"
+
     star_found  = pre_score.get("star_components_found", [])
     star_missing = [c for c in ["situation","task","action","result"]
                     if c not in star_found]
@@ -359,11 +431,11 @@ def build_scoring_context(pre_score: Dict[str, Any]) -> str:
         f"({pre_score['question_keywords_matched']} question keywords matched)",
         f"  Sentence clarity      : {pre_score['sentence_clarity_score']}/100",
         "",
-        f"INSTRUCTION: Your final score MUST be within ±15 of the composite "
-        f"pre-score ({pre_score['composite_pre_score']}). "
+        f"INSTRUCTION: Your final score MUST be within ±15 of the "
+        f"{anchor_name} ({anchor}). "
         f"Valid range: "
-        f"{max(0, pre_score['composite_pre_score'] - 15):.0f} – "
-        f"{min(100, pre_score['composite_pre_score'] + 15):.0f}.",
+        f"{max(0, anchor - 15):.0f} – "
+        f"{min(100, anchor + 15):.0f}.",
         "You may adjust within this range based on content quality, depth, "
         "and communication effectiveness.",
         "=================================================================",
@@ -2,7 +2,8 @@
 audio_analyzer.py
 =================
 Analyzes audio recordings for vocal characteristics.
-Transcribes speech using OpenAI Whisper.
+Speech is transcribed by the process-wide TranscriptionService (Whisper);
+the monitor passes the transcript in.
 
 Saves data compatible with:
   - AudioSnapshot (models/session.py) — per-answer summary
@@ -14,59 +15,45 @@ import librosa
 import numpy as np
 import base64
 import io
-import re
 import os
+import time
 import uuid
-from typing import Dict, Any, List, Optional
-import soundfile as sf
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
-# ─────────────────────────── Whisper ─────────────────────────────────────────
-WHISPER_AVAILABLE = False
-whisper = None
-try:
-    import whisper
-    WHISPER_AVAILABLE = True
-    print("✓ Whisper module imported")
-except ImportError:
-    print("⚠ Whisper not available — transcription disabled")
+from .acoustic_frames import AcousticFrames
+from .pitch_tracker import PITCH_ENGINES, summarise_pitch
+from .voice_activity import VoiceActivity, detect_voice
+from .transcript_scanner import scan_transcript
+from .audio_stream_decoder import AV_AVAILABLE, AudioStreamDecoder, av, sniff_container
+from ..utils.pcm_buffer import PCMBuffer
+from ..utils.pcm_resampler import StreamingResampler
+from ..utils.media_protocol import PCM_CODECS
+from ..utils.timing import StageTimings, audio_pipeline_timings, lap
 
+# Chunks shorter than this are returned with duration only — no features,
+# no transcription
+MIN_ANALYSIS_SECONDS = 0.5
 
-class AudioAnalyzer:
+# Deferred transcription segments (settings.transcription_mode = "segment")
+SEGMENT_PAUSE_SECONDS = 0.6   # trailing non-speech that closes a segment
+SEGMENT_MAX_SECONDS  = 25.0   # close anyway — stays inside Whisper's 30 s window
+SEGMENT_MIN_SPEECH   = 0.3    # segments with less speech are not transcribed
+
+
+class AudioSessionState:
     """
-    Analyzes audio for vocal characteristics and transcribes speech.
+    Everything AudioAnalyzer accumulates for ONE interview session.
 
-    Two levels of data saved:
-      1. Per-answer  : call get_answer_snapshot() after each answer
-                       → saved as AudioSnapshot in InterviewResponse
-      2. Per-session : call get_session_statistics() at session end
-                       → saved in AnalyticsModel
+    The analyzer (pitch engine, filler list, targets) is shared
+    process-wide via InferenceEngine; each session only owns this object.
     """
 
     def __init__(self):
-        # Whisper model
-        self.whisper_model    = None
-        self.whisper_available = WHISPER_AVAILABLE
-
-        if WHISPER_AVAILABLE:
-            try:
-                print("Loading Whisper model (tiny)...")
-                self.whisper_model = whisper.load_model("tiny")
-                print("✓ Whisper model loaded")
-            except Exception as e:
-                print(f"⚠ Whisper load failed: {e}")
-                self.whisper_available = False
-
-        # Target speaking metrics
-        self.target_pace_min = 125
-        self.target_pace_max = 170
-
-        # Filler words
-        self.filler_words = [
-            "um", "uh", "like", "you know", "basically", "actually",
-            "sort of", "kind of", "i mean", "you see", "right", "okay"
-        ]
+        self.reset()
 
+    def reset(self):
+        """Reset both session-wide and per-answer accumulators."""
         # ── Session-wide accumulators (reset only on reset()) ─────────────────
         self.total_words          = 0
         self.total_filler_words   = 0
@@ -74,53 +61,176 @@ class AudioAnalyzer:
         self.pitch_history:  List[float] = []
         self.volume_history: List[float] = []
 
+        # Seconds of audio that reached each stage (voice gate → pitch → Whisper)
+        self.audio_seconds       = 0.0
+        self.voiced_seconds      = 0.0
+        self.transcribed_seconds = 0.0
+
+        # MediaRecorder stream decoder — survives answers, since later
+        # chunks only make sense after the stream's header chunk
+        self.stream_decoder: Optional[AudioStreamDecoder] = None
+        # Raw PCM at a different rate — filter state carries across chunks
+        self.pcm_resampler:  Optional[StreamingResampler] = None
+
+        # Per-answer audio for deferred transcription — storage kept across
+        # answers, cleared by reset_answer()
+        self.answer_pcm = PCMBuffer()
+
+        # Per-stage latency (ms) — histograms + the last analysed chunk;
+        # chunk_timings collects decode / vad laps until analyze_samples()
+        self.timings       = StageTimings()
+        self.last_timings:  Dict[str, float] = {}
+        self.chunk_timings: Dict[str, float] = {}
+        # Duration of the chunk as received (decode_chunk → analyze_samples):
+        # the streaming resampler emits in blocks, so len(y) / sr jitters
+        # around it
+        self.chunk_seconds = 0.0
+
         # ── Per-answer accumulators (reset on reset_answer()) ─────────────────
+        self.reset_answer()
+
+    def reset_answer(self):
+        """Reset per-answer accumulators only."""
         self._answer_chunks:    List[Dict] = []   # raw chunk results per answer
         self._answer_transcript = ""
         self._answer_start_time = datetime.utcnow()
 
+        # Deferred transcription: the answer's decoded audio + pause tracking
+        self.answer_pcm.clear()
+        self.answer_sr          = 16000
+        self.segment_start      = 0       # first sample not yet sent to Whisper
+        self.segment_speech     = 0.0     # seconds of speech since segment_start
+        self.trailing_silence   = 0.0     # seconds of non-speech at buffer end
+        self.answer_text: Optional[Dict[str, Any]] = None  # deferred text features
+
+
+class AudioAnalyzer:
+    """
+    Analyzes audio for vocal characteristics (+ the transcript's text
+    features; transcription itself is TranscriptionService's job).
+
+    One instance is shared by every session (see inference_engine.py);
+    all per-session data lives in the AudioSessionState passed in.
+
+    Two levels of data saved:
+      1. Per-answer  : call get_answer_snapshot() after each answer
+                       → saved as AudioSnapshot in InterviewResponse
+      2. Per-session : call get_session_statistics() at session end
+                       → saved in AnalyticsModel
+    """
+
+    def __init__(self, pitch_engine: str = "yin"):
+        # Pitch engine: "yin" (fast, speech range) or "pyin" (accurate, slow)
+        if pitch_engine not in PITCH_ENGINES:
+            print(f"⚠ Unknown pitch engine '{pitch_engine}' — using yin")
+            pitch_engine = "yin"
+        self.pitch_engine = pitch_engine
+        self._pitch_track = PITCH_ENGINES[pitch_engine]
+
+        # Target speaking metrics
+        self.target_pace_min = 125
+        self.target_pace_max = 170
+
     # ─────────────────────────── Public API ──────────────────────────────────
 
-    def analyze_audio_chunk(
+    def decode_chunk(
         self,
-        audio_data: str,
-        transcript: Optional[str] = None,
+        state:       AudioSessionState,
+        audio_data:  Union[str, bytes, memoryview],
         sample_rate: int = 16000,
-    ) -> Dict[str, Any]:
+        codec:       Optional[str] = None,
+        source_rate: int = 0,
+        channels:    int = 1,
+    ):
         """
-        Analyze one audio chunk (called multiple times per answer).
+        Decode one audio chunk to mono float32 at sample_rate.
 
         Args:
-            audio_data : base64-encoded WAV audio
-            transcript : optional pre-provided transcript
-            sample_rate: audio sample rate
+            state      : the calling session's AudioSessionState
+            audio_data : base64-encoded WAV/WebM/PCM audio (JSON path) or
+                         raw payload bytes from a binary media frame
+            sample_rate: target analysis sample rate
+            codec      : binary-frame codec ("pcm_s16le", "pcm_f32le",
+                         "webm_opus", ...) or the JSON message's PCM
+                         "format" — None for base64 containers
+            source_rate: sample rate of raw PCM input
+            channels   : channel count of raw PCM input
 
         Returns:
-            Dict with chunk-level metrics + warnings
+            (samples, sample_rate)
         """
-        try:
+        t = time.perf_counter()
+        if isinstance(audio_data, str):
             if "," in audio_data:
                 audio_data = audio_data.split(",")[1]
             audio_bytes = base64.b64decode(audio_data)
-            try:
-                y, sr = librosa.load(io.BytesIO(audio_bytes), sr=sample_rate)
-            except Exception:
-                # Browser sends WebM/Opus — write to temp file for librosa
-                import tempfile, uuid
-                tmp = f"tmp_audio_{uuid.uuid4().hex}.webm"
-                with open(tmp, 'wb') as f:
-                    f.write(audio_bytes)
-                try:
-                    y, sr = librosa.load(tmp, sr=sample_rate)
-                finally:
-                    try:
-                        os.remove(tmp)
-                    except:
-                        pass
+        else:
+            audio_bytes = audio_data
+
+        if codec in PCM_CODECS:
+            y, sr = self._decode_pcm(
+                state, audio_bytes, codec, source_rate, channels, sample_rate)
+            width = 2 if codec == "pcm_s16le" else 4
+            state.chunk_seconds = len(audio_bytes) / (
+                width * max(1, channels) * (source_rate or sample_rate))
+        else:
+            y, sr = self._decode_container(state, audio_bytes, codec, sample_rate)
+            state.chunk_seconds = len(y) / sr
+        state.chunk_timings = {}
+        lap(state.chunk_timings, "decode", t)
+        return y, sr
+
+    def chunk_duration(self, state: AudioSessionState, y: np.ndarray, sr: int) -> float:
+        """Seconds of audio the decoded chunk stands for (as received)."""
+        return state.chunk_seconds or len(y) / sr
+
+    def gate(self, state: AudioSessionState, y: np.ndarray, sr: int) -> VoiceActivity:
+        """detect_voice() with its time added to the chunk's stage timings."""
+        t     = time.perf_counter()
+        voice = detect_voice(y, sr)
+        lap(state.chunk_timings, "vad", t)
+        return voice
+
+    def analyze_samples(
+        self,
+        state:      AudioSessionState,
+        y:          np.ndarray,
+        sr:         int,
+        transcript: Optional[str] = None,
+        buffer_pcm: bool = False,
+        voice:      Optional[VoiceActivity] = None,
+    ) -> Dict[str, Any]:
+        """
+        Analyze one decoded chunk (called multiple times per answer).
+
+        The voice gate runs first: a chunk without voiced frames only
+        updates the silence accumulators, and pitch is tracked on the
+        voiced spans only.
+
+        Args:
+            state      : the calling session's AudioSessionState
+            y, sr      : mono float32 samples from decode_chunk()
+            transcript : the chunk's transcript (browser-provided or from
+                         TranscriptionService), None / "" if there is none
+            buffer_pcm : also append the samples to the answer buffer for
+                         deferred (answer / segment) transcription
+            voice      : detect_voice() result if the caller already gated
+                         the chunk
+
+        Returns:
+            Dict with chunk-level metrics + warnings
+        """
+        try:
+            voice = voice if voice is not None else self.gate(state, y, sr)
+            timings, state.chunk_timings = state.chunk_timings, {}
+            duration = self.chunk_duration(state, y, sr)
+            state.chunk_seconds = 0.0
+            if buffer_pcm and len(y):
+                self._buffer_answer_audio(state, y, sr, voice)
 
             analysis = {
                 "timestamp":          datetime.utcnow().isoformat(),
-                "duration_seconds":   len(y) / sr,
+                "duration_seconds":   duration,
                 "transcript":         "",
                 "speaking_pace":      0.0,
                 "word_count":         0,
@@ -138,66 +248,122 @@ class AudioAnalyzer:
                 "warnings":           [],
             }
 
-            if len(y) < sr * 0.5:
+            if duration < MIN_ANALYSIS_SECONDS:
+                self._record_timings(state, timings)
                 return analysis
 
-            # Transcribe
-            if transcript is None and self.whisper_available and self.whisper_model:
-                transcript = self._transcribe_with_whisper(audio_bytes)
-            elif transcript is None:
-                transcript = ""
-
+            transcript = transcript or ""
             analysis["transcript"] = transcript
-
-            # Acoustic features
-            vol  = self._analyze_volume(y)
-            pitch = self._analyze_pitch(y, sr)
-            pause = self._analyze_pauses(y, sr)
-
-            analysis["volume_level"]       = vol["level"]
-            analysis["volume_consistency"] = vol["consistency"]
-            analysis["energy_level"]       = vol["energy"]
-            analysis["pitch_hz"]           = pitch["mean_pitch"]
-            analysis["pitch_variation"]    = pitch["variation"]
-            analysis["pause_time"]         = pause["pause_time"]
-            analysis["num_pauses"]         = pause["num_pauses"]
-            analysis["silence_ratio"]      = pause["silence_ratio"]
+            state.audio_seconds += analysis["duration_seconds"]
+
+            silent = not voice.voiced
+            if silent:
+                # Thinking pause — only the silence accumulators move
+                analysis["silent"]        = True
+                analysis["pause_time"]    = round(analysis["duration_seconds"], 2)
+                analysis["silence_ratio"] = 100.0
+            else:
+                # Acoustic features — volume / energy / pauses share one framing
+                t      = time.perf_counter()
+                frames = AcousticFrames(y, sr)
+                t      = lap(timings, "framing", t)
+                vol    = self._analyze_volume(frames)
+                t      = lap(timings, "volume", t)
+                pitch  = self._analyze_pitch(y, sr, voice)
+                t      = lap(timings, "pitch", t)
+                pause  = self._analyze_pauses(frames)
+                lap(timings, "pauses", t)
+                state.voiced_seconds += voice.voiced_seconds
+
+                analysis["volume_level"]       = vol["level"]
+                analysis["volume_consistency"] = vol["consistency"]
+                analysis["energy_level"]       = vol["energy"]
+                analysis["pitch_hz"]           = pitch["mean_pitch"]
+                analysis["pitch_variation"]    = pitch["variation"]
+                analysis["pause_time"]         = pause["pause_time"]
+                analysis["num_pauses"]         = pause["num_pauses"]
+                analysis["silence_ratio"]      = pause["silence_ratio"]
 
             # Text features
             if transcript:
+                t    = time.perf_counter()
                 text = self._analyze_transcript(transcript, analysis["duration_seconds"])
+                lap(timings, "text", t)
                 analysis["speaking_pace"]          = text["pace"]
                 analysis["word_count"]             = text["word_count"]
                 analysis["filler_words_count"]     = text["filler_count"]
                 analysis["filler_words_detected"]  = text["filler_words"]
 
                 # Session accumulators
-                self.total_words         += text["word_count"]
-                self.total_filler_words  += text["filler_count"]
+                state.total_words         += text["word_count"]
+                state.total_filler_words  += text["filler_count"]
                 # Per-answer transcript accumulation
-                self._answer_transcript  += " " + transcript
-
-            # Issues + warnings
-            issues, warnings = self._detect_audio_issues(analysis)
-            analysis["issues"]   = issues
-            analysis["warnings"] = warnings
-
-            # Store for accumulators
-            self.volume_history.append(vol["level"])
-            if pitch["mean_pitch"] > 0:
-                self.pitch_history.append(pitch["mean_pitch"])
-            self.total_speaking_time  += analysis["duration_seconds"]
-            self._answer_chunks.append(analysis)
-
+                state._answer_transcript  += " " + transcript
+
+            # Issues + warnings (none for silence — volume would read "too low")
+            if not silent:
+                issues, warnings = self._detect_audio_issues(analysis)
+                analysis["issues"]   = issues
+                analysis["warnings"] = warnings
+
+                # Store for accumulators
+                state.volume_history.append(vol["level"])
+                if pitch["mean_pitch"] > 0:
+                    state.pitch_history.append(pitch["mean_pitch"])
+            state.total_speaking_time  += analysis["duration_seconds"]
+            state._answer_chunks.append(analysis)
+
+            self._record_timings(state, timings)
             return analysis
 
         except Exception as e:
             print(f"[AudioAnalyzer] Error: {e}")
             import traceback
             traceback.print_exc()
-            return self._empty_result(f"Analysis error: {str(e)}")
+            return self.empty_result(f"Analysis error: {str(e)}")
 
-    def get_answer_snapshot(self) -> Dict[str, Any]:
+    # ─────────────────────────── Deferred transcription ──────────────────────
+
+    def take_closed_segment(self, state: AudioSessionState) -> Optional[np.ndarray]:
+        """
+        The buffered audio since the last segment, once a pause (or the
+        length cap) closes it — else None. Silence-only stretches are
+        skipped without being returned.
+        """
+        open_samples = len(state.answer_pcm) - state.segment_start
+        closed = (state.trailing_silence >= SEGMENT_PAUSE_SECONDS
+                  or open_samples >= SEGMENT_MAX_SECONDS * state.answer_sr)
+        if not closed or not open_samples:
+            return None
+        return self._take_segment(state)
+
+    def take_remaining_audio(self, state: AudioSessionState) -> Optional[np.ndarray]:
+        """Everything not yet returned as a segment (the whole answer in
+        "answer" mode); None if it holds no speech."""
+        if len(state.answer_pcm) == state.segment_start:
+            return None
+        return self._take_segment(state)
+
+    def set_answer_transcript(self, state: AudioSessionState, transcript: str):
+        """
+        Use one transcript for the whole answer: word count, pace and
+        fillers in get_answer_snapshot() come from it instead of the chunks.
+        Words the chunks already counted (browser transcripts it includes)
+        are not added to the session totals twice.
+        """
+        transcript = transcript.strip()
+        chunks     = state._answer_chunks
+        duration   = sum(c["duration_seconds"] for c in chunks)
+        text       = self._analyze_transcript(transcript, duration)
+
+        state.answer_text         = text
+        state._answer_transcript  = transcript
+        state.total_words        += text["word_count"] - sum(
+            c.get("word_count", 0) for c in chunks)
+        state.total_filler_words += text["filler_count"] - sum(
+            c.get("filler_words_count", 0) for c in chunks)
+
+    def get_answer_snapshot(self, state: AudioSessionState) -> Dict[str, Any]:
         """
         Returns aggregated AudioSnapshot dict for the current answer.
         Call this when user submits their answer, BEFORE reset_answer().
@@ -208,18 +374,25 @@ class AudioAnalyzer:
           pitch_variation, total_filler_words, filler_word_breakdown,
           silence_percentage, issues
         """
-        if not self._answer_chunks:
+        if not state._answer_chunks:
             return self._empty_snapshot()
 
-        chunks = self._answer_chunks
+        chunks = state._answer_chunks
 
-        # Aggregate
+        # Aggregate — text metrics from the answer-level transcript if one
+        # was set (deferred transcription), else summed over the chunks
         total_duration  = sum(c["duration_seconds"] for c in chunks)
-        total_words     = sum(c.get("word_count", 0) for c in chunks)
-        total_fillers   = sum(c.get("filler_words_count", 0) for c in chunks)
+        answer_text     = state.answer_text
+        if answer_text is not None:
+            total_words   = answer_text["word_count"]
+            total_fillers = answer_text["filler_count"]
+        else:
+            total_words   = sum(c.get("word_count", 0) for c in chunks)
+            total_fillers = sum(c.get("filler_words_count", 0) for c in chunks)
 
         avg_pace    = (total_words / total_duration * 60) if total_duration > 0 else 0
-        avg_volume  = float(np.mean([c["volume_level"] for c in chunks]))
+        voiced      = [c["volume_level"] for c in chunks if not c.get("silent")]
+        avg_volume  = float(np.mean(voiced)) if voiced else 0.0
         avg_pitch   = float(np.mean([c["pitch_hz"] for c in chunks if c["pitch_hz"] > 0])) \
                       if any(c["pitch_hz"] > 0 for c in chunks) else 0.0
         pitch_var   = float(np.std([c["pitch_hz"] for c in chunks if c["pitch_hz"] > 0])) \
@@ -228,8 +401,10 @@ class AudioAnalyzer:
 
         # Filler breakdown as {word: count}
         filler_breakdown: Dict[str, int] = {}
-        for chunk in chunks:
-            for fw in chunk.get("filler_words_detected", []):
+        filler_lists = ([answer_text["filler_words"]] if answer_text is not None
+                        else [c.get("filler_words_detected", []) for c in chunks])
+        for detected in filler_lists:
+            for fw in detected:
                 word  = fw["word"] if isinstance(fw, dict) else fw
                 count = fw["count"] if isinstance(fw, dict) else 1
                 filler_breakdown[word] = filler_breakdown.get(word, 0) + count
@@ -241,7 +416,7 @@ class AudioAnalyzer:
         unique_issues = list(set(all_issues))
 
         return {
-            "transcript":                self._answer_transcript.strip(),
+            "transcript":                state._answer_transcript.strip(),
             "word_count":                total_words,
             "speaking_duration_seconds": round(total_duration, 2),
             "avg_speaking_pace_wpm":     round(avg_pace, 2),
@@ -254,75 +429,215 @@ class AudioAnalyzer:
             "issues":                    unique_issues,
         }
 
-    def reset_answer(self):
+    def reset_answer(self, state: AudioSessionState):
         """
         Reset per-answer accumulators only.
         Call this after saving get_answer_snapshot() when moving to next question.
         Session-wide stats (total_words, pitch_history etc.) are NOT reset.
         """
-        self._answer_chunks     = []
-        self._answer_transcript = ""
-        self._answer_start_time = datetime.utcnow()
+        state.reset_answer()
 
-    def get_session_statistics(self) -> Dict[str, Any]:
+    def get_session_statistics(self, state: AudioSessionState) -> Dict[str, Any]:
         """
         Get session-wide aggregated statistics.
         Called by real_time_monitor.get_session_summary() at session end.
         Feeds into AnalyticsModel and feedback_generator.
         """
-        avg_pace     = (self.total_words / self.total_speaking_time * 60) \
-                       if self.total_speaking_time > 0 else 0
-        filler_rate  = (self.total_filler_words / self.total_words * 100) \
-                       if self.total_words > 0 else 0
+        avg_pace     = (state.total_words / state.total_speaking_time * 60) \
+                       if state.total_speaking_time > 0 else 0
+        filler_rate  = (state.total_filler_words / state.total_words * 100) \
+                       if state.total_words > 0 else 0
+        audio_s      = state.audio_seconds
 
         return {
-            "total_speaking_time_seconds": round(self.total_speaking_time, 2),
-            "total_words":                 self.total_words,
-            "total_filler_words":          self.total_filler_words,
+            "total_speaking_time_seconds": round(state.total_speaking_time, 2),
+            "total_words":                 state.total_words,
+            "total_filler_words":          state.total_filler_words,
             "average_speaking_pace":       round(avg_pace, 2),
             "filler_word_rate":            round(filler_rate, 2),
-            "average_volume":              round(float(np.mean(self.volume_history)), 2)
-                                           if self.volume_history else 0.0,
-            "average_pitch":               round(float(np.mean(self.pitch_history)), 2)
-                                           if self.pitch_history else 0.0,
-            "pitch_variation":             round(float(np.std(self.pitch_history)), 2)
-                                           if self.pitch_history else 0.0,
+            "average_volume":              round(float(np.mean(state.volume_history)), 2)
+                                           if state.volume_history else 0.0,
+            "average_pitch":               round(float(np.mean(state.pitch_history)), 2)
+                                           if state.pitch_history else 0.0,
+            "pitch_variation":             round(float(np.std(state.pitch_history)), 2)
+                                           if state.pitch_history else 0.0,
+            # Share of the received audio that reached the expensive stages
+            "stage_share": {
+                "audio_seconds":       round(audio_s, 2),
+                "voiced_seconds":      round(state.voiced_seconds, 2),
+                "transcribed_seconds": round(state.transcribed_seconds, 2),
+                "pitch_pct":           round(state.voiced_seconds / audio_s * 100, 1)
+                                       if audio_s else 0.0,
+                "transcription_pct":   round(state.transcribed_seconds / audio_s * 100, 1)
+                                       if audio_s else 0.0,
+            },
         }
 
-    def reset(self):
+    def warm_up(self):
+        """
+        Run one synthetic chunk through the acoustic stages, so the first
+        live chunk doesn't pay librosa / scipy's lazy imports (~1.5 s).
+        """
+        sr = 16000
+        y  = (0.1 * np.sin(2 * np.pi * 150 * np.arange(sr) / sr)).astype(np.float32)
+        frames = AcousticFrames(y, sr)
+        self._analyze_volume(frames)
+        self._analyze_pauses(frames)
+        self._analyze_pitch(y, sr, detect_voice(y, sr))
+
+    def get_timings(self, state: Optional[AudioSessionState] = None) -> Dict[str, Any]:
+        """Per-stage latency histograms — one session's, or process-wide."""
+        return (state.timings if state is not None else audio_pipeline_timings).snapshot()
+
+    def mark_gap(self, state: AudioSessionState):
+        """
+        Chunks were dropped before the next one (ingest ring overflow).
+        The container decoder discards its partial state and resyncs on
+        the next Cluster / OggS page instead of misparsing from mid-block.
+        """
+        if state.stream_decoder is not None:
+            state.stream_decoder.resync()
+
+    def reset(self, state: AudioSessionState):
         """
         Full reset — call at start of new session.
         Resets both session-wide and per-answer accumulators.
         """
-        self.total_words         = 0
-        self.total_filler_words  = 0
-        self.total_speaking_time = 0.0
-        self.pitch_history       = []
-        self.volume_history      = []
-        self.reset_answer()
+        state.reset()
 
     # ─────────────────────────── Private helpers ─────────────────────────────
 
-    def _transcribe_with_whisper(self, audio_bytes: bytes) -> str:
-        if not self.whisper_available or not self.whisper_model:
-            return ""
+    def _record_timings(self, state: AudioSessionState, timings: Dict[str, float]):
+        """Close out one chunk's stage timings into both histogram sets."""
+        timings["total"] = sum(timings.values())
+        state.last_timings = timings
+        state.timings.record_frame(timings)
+        audio_pipeline_timings.record_frame(timings)
+
+    def _buffer_answer_audio(
+        self,
+        state:  AudioSessionState,
+        y:      np.ndarray,
+        sr:     int,
+        voice:  VoiceActivity,
+    ):
+        """Append a voiced chunk to the answer buffer and update the pause
+        tracker; silent chunks only extend the trailing silence."""
+        state.answer_sr = sr
+        speech = voice.mask
+        if not speech.any():
+            state.trailing_silence += len(y) / sr
+            return
+        state.answer_pcm.append(y)
+
+        hop_s = voice.frame_len / sr
+        last  = int(np.flatnonzero(speech)[-1])
+        state.trailing_silence = (len(speech) - 1 - last) * hop_s
+        state.segment_speech  += float(speech.sum()) * hop_s
+
+    def _take_segment(self, state: AudioSessionState) -> Optional[np.ndarray]:
+        start, has_speech = state.segment_start, state.segment_speech >= SEGMENT_MIN_SPEECH
+        state.segment_start  = len(state.answer_pcm)
+        state.segment_speech = 0.0
+        return state.answer_pcm.slice(start) if has_speech else None
+
+    def _decode_pcm(
+        self,
+        state:       AudioSessionState,
+        audio_bytes: Union[bytes, memoryview],
+        codec:       str,
+        source_rate: int,
+        channels:    int,
+        sample_rate: int,
+    ):
+        """
+        Raw interleaved PCM → mono float32 at sample_rate (no container).
+
+        Already at sample_rate: no resampling at all. Otherwise the
+        session's StreamingResampler, which keeps its filter state between
+        chunks instead of restarting at every chunk edge.
+        """
+        if codec == "pcm_s16le":
+            y = np.frombuffer(audio_bytes, dtype="<i2").astype(np.float32)
+            y *= 1.0 / 32768.0
+        else:
+            y = np.frombuffer(audio_bytes, dtype="<f4")
+        if channels > 1:
+            # Strided per-channel sum — ~10x faster than mean(axis=1) on a
+            # 2-wide axis
+            frames = y[: len(y) - len(y) % channels].reshape(-1, channels)
+            y = frames[:, 0].copy()
+            for c in range(1, channels):
+                y += frames[:, c]
+            y *= 1.0 / channels
+        source_rate = source_rate or sample_rate
+        if source_rate != sample_rate:
+            rs = state.pcm_resampler
+            if rs is None or rs.source_rate != source_rate or rs.target_rate != sample_rate:
+                rs = state.pcm_resampler = StreamingResampler(source_rate, sample_rate)
+            y = rs.process(y)
+        return y.astype(np.float32, copy=False), sample_rate
+
+    def _decode_container(
+        self,
+        state:       AudioSessionState,
+        audio_bytes: Union[bytes, memoryview],
+        codec:       Optional[str],
+        sample_rate: int,
+    ):
+        """
+        Encoded chunk → mono float32 at sample_rate.
+
+        WebM/Opus and Ogg/Opus MediaRecorder chunks (header chunk and the
+        header-less continuation chunks after it) go through the session's
+        persistent in-memory AudioStreamDecoder; anything else is decoded
+        as a self-contained file.
+        """
+        kind = codec or sniff_container(audio_bytes)
+        dec  = state.stream_decoder
+        streaming = kind in ("webm_opus", "ogg_opus") or (kind is None and dec is not None)
+
+        if AV_AVAILABLE and streaming:
+            if dec is None or (kind and kind != dec.container) or dec.sample_rate != sample_rate:
+                dec = state.stream_decoder = AudioStreamDecoder(kind or dec.container, sample_rate)
+            return dec.feed(audio_bytes), sample_rate
+
+        return self._load_container(audio_bytes, sample_rate)
+
+    def _load_container(self, audio_bytes: Union[bytes, memoryview], sample_rate: int):
+        """Self-contained WAV / FLAC / ... bytes → mono float32 at sample_rate."""
+        audio_bytes = bytes(audio_bytes)
         try:
-            temp_path = f"temp_{uuid.uuid4().hex}.wav"
-            audio_data, samplerate = sf.read(io.BytesIO(audio_bytes))
-            sf.write(temp_path, audio_data, samplerate)
-            result = self.whisper_model.transcribe(
-                temp_path, language="en", fp16=False)
+            return librosa.load(io.BytesIO(audio_bytes), sr=sample_rate)
+        except Exception:
+            if AV_AVAILABLE:
+                return self._load_with_av(audio_bytes, sample_rate)
+            # No PyAV — audioread needs a real file
+            tmp = f"tmp_audio_{uuid.uuid4().hex}.webm"
+            with open(tmp, 'wb') as f:
+                f.write(audio_bytes)
             try:
-                os.remove(temp_path)
-            except:
-                pass
-            return result["text"].strip()
-        except Exception as e:
-            print(f"[AudioAnalyzer] Whisper error: {e}")
-            return ""
-
-    def _analyze_volume(self, audio: np.ndarray) -> Dict[str, Any]:
-        rms        = librosa.feature.rms(y=audio)[0]
+                return librosa.load(tmp, sr=sample_rate)
+            finally:
+                try:
+                    os.remove(tmp)
+                except:
+                    pass
+
+    def _load_with_av(self, audio_bytes: bytes, sample_rate: int):
+        """Any FFmpeg-readable container, decoded from memory."""
+        resampler = av.AudioResampler(format="flt", layout="mono", rate=sample_rate)
+        pcm = []
+        with av.open(io.BytesIO(audio_bytes)) as container:
+            for frame in container.decode(audio=0):
+                frame.pts = None
+                pcm.extend(r.to_ndarray().reshape(-1) for r in resampler.resample(frame))
+        pcm.extend(r.to_ndarray().reshape(-1) for r in resampler.resample(None))
+        y = np.concatenate(pcm) if pcm else np.zeros(0, dtype=np.float32)
+        return y, sample_rate
+
+    def _analyze_volume(self, frames: AcousticFrames) -> Dict[str, Any]:
+        rms        = frames.rms
         mean_rms   = np.mean(rms)
         std_rms    = np.std(rms)
         vol_level  = float(min(100, mean_rms * 1000))
@@ -330,39 +645,28 @@ class AudioAnalyzer:
             consistency = float(max(0, 100 - (std_rms / mean_rms) * 50))
         else:
             consistency = 0.0
-        energy = float(np.sum(audio ** 2) / len(audio))
+        energy = frames.energy
         return {
             "level":       round(vol_level, 2),
             "consistency": round(consistency, 2),
             "energy":      round(energy, 6),
         }
 
-    def _analyze_pitch(self, audio: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _analyze_pitch(self, audio: np.ndarray, sr: int, voice: VoiceActivity) -> Dict[str, Any]:
+        """Mean pitch + variation via the configured engine (yin | pyin),
+        tracked over the voiced spans only."""
         try:
-            f0, voiced_flag, _ = librosa.pyin(
-                audio,
-                fmin=librosa.note_to_hz("C2"),
-                fmax=librosa.note_to_hz("C7"),
-            )
-            voiced_f0 = f0[voiced_flag]
-            if len(voiced_f0) > 0:
-                mean_p = float(np.nanmean(voiced_f0))
-                std_p  = float(np.nanstd(voiced_f0))
-                var    = (std_p / mean_p * 100) if mean_p > 0 else 0.0
-            else:
-                mean_p, var = 0.0, 0.0
-            return {
-                "mean_pitch": round(mean_p, 2) if not np.isnan(mean_p) else 0.0,
-                "variation":  round(var,    2) if not np.isnan(var)    else 0.0,
-            }
+            f0 = [self._pitch_track(audio[s:e], sr) for s, e in voice.spans()]
+            return summarise_pitch(np.concatenate(f0) if f0 else np.zeros(0))
         except Exception as e:
             print(f"[AudioAnalyzer] Pitch error: {e}")
             return {"mean_pitch": 0.0, "variation": 0.0}
 
-    def _analyze_pauses(self, audio: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _analyze_pauses(self, frames: AcousticFrames) -> Dict[str, Any]:
         try:
-            intervals       = librosa.effects.split(audio, top_db=30)
-            total_duration  = len(audio) / sr
+            sr              = frames.sr
+            intervals       = frames.intervals()
+            total_duration  = frames.n_samples / sr
             speaking_time   = sum((e - s) / sr for s, e in intervals)
             pause_time      = total_duration - speaking_time
             num_pauses      = max(0, len(intervals) - 1)
@@ -378,25 +682,14 @@ class AudioAnalyzer:
             return {"pause_time": 0.0, "num_pauses": 0, "silence_ratio": 0.0}
 
     def _analyze_transcript(self, transcript: str, duration: float) -> Dict[str, Any]:
-        words      = re.findall(r"\b\w+\b", transcript.lower())
-        word_count = len(words)
-        pace       = (word_count / duration * 60) if duration > 0 else 0.0
-
-        filler_words_found = []
-        filler_count       = 0
-        transcript_lower   = transcript.lower()
-
-        for filler in self.filler_words:
-            count = transcript_lower.count(filler)
-            if count > 0:
-                filler_count += count
-                filler_words_found.append({"word": filler, "count": count})
+        scan = scan_transcript(transcript)
+        pace = (scan.word_count / duration * 60) if duration > 0 else 0.0
 
         return {
-            "word_count":  word_count,
+            "word_count":  scan.word_count,
             "pace":        round(pace, 2),
-            "filler_count": filler_count,
-            "filler_words": filler_words_found,
+            "filler_count": scan.filler_count,
+            "filler_words": scan.filler_breakdown(),
         }
 
     def _detect_audio_issues(self, analysis: Dict[str, Any]):
@@ -427,7 +720,7 @@ class AudioAnalyzer:
             warnings.append(f"Too many filler words ({flist}) — try pausing instead.")
         return issues, warnings
 
-    def _empty_result(self, error_msg: str = "") -> Dict[str, Any]:
+    def empty_result(self, error_msg: str = "") -> Dict[str, Any]:
         return {
             "timestamp": datetime.utcnow().isoformat(),
             "duration_seconds": 0.0, "transcript": "",
@@ -0,0 +1,443 @@
+"""
+audio_stream_decoder.py
+=======================
+Persistent in-memory decoder for browser MediaRecorder audio streams
+(WebM/Opus from Chrome / Edge, Ogg/Opus from Firefox).
+
+MediaRecorder with a timeslice emits ONE stream cut into chunks: only the
+first chunk carries the container header (EBML + Tracks / OpusHead); later
+chunks are bare continuation bytes — WebM SimpleBlocks or Ogg pages — that
+no stand-alone decoder can open. Previously each chunk was written to
+tmp_audio_<uuid>.webm and decoded through librosa/audioread, which failed
+on exactly those continuation chunks.
+
+AudioStreamDecoder keeps, per session:
+  - a tiny incremental demuxer (WebM: flat EBML walk; Ogg: page reader)
+    that buffers partial elements across chunk boundaries,
+  - ONE Opus decoder (PyAV / libavcodec) whose state carries across chunks,
+  - ONE resampler to mono float32 at the analysis rate.
+feed(chunk) returns the PCM decoded from that chunk — no files, no
+subprocesses.
+
+Gaps: when a chunk is lost (MediaIngest drops the oldest audio chunk under
+overload), the bytes after it start mid-element. resync() discards the
+partial state and the demuxer scans forward to the next WebM Cluster /
+audio SimpleBlock or Ogg page, keeping the codec opened from the stream
+header. A corrupt element or undecodable packet triggers the same resync
+instead of failing every later chunk.
+
+Ogg pages are ~1 s of audio, so resyncing on the next page alone would
+drop up to a second around each gap. Instead resync() holds on to the
+page the gap cut (its segment table and the bytes before the gap). When
+the next page turns out to directly follow it (page sequence number),
+the bytes before that page are the held page's tail, and every packet
+lying wholly outside the lost span is decoded — as with WebM, a gap
+costs about the dropped bytes. A gap that swallows a page header still
+loses the rest of that page: its segment table is gone, and Opus packets
+carry no length of their own.
+
+Optional dependency: PyAV (`pip install av`). Without it AV_AVAILABLE is
+False and AudioAnalyzer falls back to librosa.
+
+Used by:
+  - audio_analyzer.py : one decoder per AudioSessionState
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+AV_AVAILABLE = False
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    av = None
+    print("⚠ PyAV not available — WebM/Opus chunks fall back to librosa (pip install av)")
+
+
+EBML_MAGIC = b"\x1a\x45\xdf\xa3"
+OGG_MAGIC  = b"OggS"
+
+# ─────────────────────────── WebM element IDs ────────────────────────────────
+_EBML_HEADER   = 0x1A45DFA3
+_SEGMENT       = 0x18538067
+_CLUSTER       = 0x1F43B675
+_CUES          = 0x1C53BB6B
+_TRACKS        = 0x1654AE6B
+_TRACK_ENTRY   = 0xAE
+_TRACK_AUDIO   = 0xE1
+_BLOCK_GROUP   = 0xA0
+_SIMPLE_BLOCK  = 0xA3
+_BLOCK         = 0xA1
+_CODEC_ID      = 0x86
+_CODEC_PRIVATE = 0x63A2
+_TRACK_NUMBER  = 0xD7
+
+# Masters are entered, not skipped — their children are parsed in the same
+# flat walk, which is how live (unknown-size) WebM has to be read anyway
+_MASTERS = {_SEGMENT, _CLUSTER, _TRACKS, _TRACK_ENTRY, _TRACK_AUDIO, _BLOCK_GROUP}
+
+# Resync: what may follow an audio block inside a live stream, and the
+# largest block accepted as a sync candidate (a 120 ms Opus packet at
+# 510 kbit/s is ~7.7 kB)
+_CLUSTER_ID     = _CLUSTER.to_bytes(4, "big")
+_FOLLOW_IDS     = {bytes([_SIMPLE_BLOCK]), bytes([_BLOCK_GROUP]), _CLUSTER_ID,
+                   _CUES.to_bytes(4, "big")}
+_MAX_SYNC_BLOCK = 8192
+
+
+def sniff_container(data) -> Optional[str]:
+    """Codec name for a chunk that starts a stream, else None."""
+    head = bytes(data[:4])
+    if head == EBML_MAGIC:
+        return "webm_opus"
+    if head == OGG_MAGIC:
+        return "ogg_opus"
+    if head == b"RIFF":
+        return "wav"
+    return None
+
+
+def _read_vint(buf: bytearray, pos: int, keep_marker: bool):
+    """EBML variable-length int at pos → (value, length), or (None, 0) if short."""
+    if pos >= len(buf):
+        return None, 0
+    first = buf[pos]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first & mask:
+        mask >>= 1
+        length += 1
+    if length > 8:
+        raise ValueError("Invalid EBML vint")
+    if pos + length > len(buf):
+        return None, 0
+    value = first if keep_marker else first & (mask - 1)
+    for b in buf[pos + 1:pos + length]:
+        value = (value << 8) | b
+    return value, length
+
+
+class AudioStreamDecoder:
+    """
+    Incremental WebM/Opus or Ogg/Opus → mono float32 PCM for ONE session.
+    """
+
+    def __init__(self, container: str, sample_rate: int = 16000):
+        if not AV_AVAILABLE:
+            raise RuntimeError("PyAV is required for streaming Opus decoding")
+        self.container   = container          # "webm_opus" | "ogg_opus"
+        self.sample_rate = sample_rate
+
+        self._buf    = bytearray()
+        self._codec  = None                   # av CodecContext, after header
+        self._resampler = av.AudioResampler(format="flt", layout="mono", rate=sample_rate)
+
+        # WebM demux state
+        self._skip         = 0                # bytes of an ignored element left
+        self._audio_track  = None
+        self._track_number = None
+        self._track_codec  = None
+        self._codec_private: Optional[bytes] = None
+
+        # Ogg demux state
+        self._ogg_packet = bytearray()
+        self._ogg_headers_seen = 0
+        # Page cut by a gap: (sequence number, lacing table, bytes before it)
+        self._gap_page: Optional[tuple] = None
+
+        # Set after a gap: scan for the next sync point before demuxing
+        self._resyncing = False
+        self.resyncs    = 0
+
+    # ─────────────────────────── Public API ──────────────────────────────────
+
+    def feed(self, chunk) -> np.ndarray:
+        """Decode one MediaRecorder chunk; returns the PCM it completed."""
+        self._buf += chunk
+        packets = (self._demux_webm() if self.container == "webm_opus"
+                   else self._demux_ogg())
+        out = [self._decode(p) for p in packets]
+        out = [y for y in out if y.size]
+        return np.concatenate(out) if out else np.zeros(0, dtype=np.float32)
+
+    def resync(self):
+        """The stream has a gap before the next chunk: drop partial state."""
+        self._gap_page = (self._held_ogg_page() if self.container == "ogg_opus"
+                          else None)
+        self._buf.clear()
+        self._skip       = 0
+        if self._gap_page is None:
+            self._ogg_packet = bytearray()
+        self._resyncing  = True
+        self.resyncs    += 1
+
+    @property
+    def ready(self) -> bool:
+        """True once the stream header has been seen."""
+        return self._codec is not None
+
+    # ─────────────────────────── Opus decode ─────────────────────────────────
+
+    def _open_codec(self, extradata: Optional[bytes]):
+        codec = av.CodecContext.create("opus", "r")
+        if extradata:
+            codec.extradata = extradata
+        self._codec = codec
+
+    def _decode(self, payload: bytes) -> np.ndarray:
+        if self._codec is None:
+            return np.zeros(0, dtype=np.float32)
+        pcm = []
+        try:
+            frames = self._codec.decode(av.Packet(payload))
+        except av.error.FFmpegError:
+            return np.zeros(0, dtype=np.float32)     # corrupt packet — skip it
+        for frame in frames:
+            frame.pts = None
+            for res in self._resampler.resample(frame):
+                pcm.append(res.to_ndarray().reshape(-1))
+        return np.concatenate(pcm) if pcm else np.zeros(0, dtype=np.float32)
+
+    # ─────────────────────────── WebM demux ──────────────────────────────────
+
+    def _demux_webm(self) -> List[bytes]:
+        buf, pos, packets = self._buf, 0, []
+        while True:
+            if self._resyncing:
+                sync = self._find_webm_sync(buf, pos)
+                if sync is None:
+                    pos = max(pos, len(buf) - 16)   # keep a possible partial header
+                    break
+                pos, self._resyncing = sync, False
+
+            if self._skip:
+                n = min(self._skip, len(buf) - pos)
+                pos += n
+                self._skip -= n
+                if self._skip:
+                    break
+
+            try:
+                eid, id_len = _read_vint(buf, pos, keep_marker=True)
+                if eid is None:
+                    break
+                size, size_len = _read_vint(buf, pos + id_len, keep_marker=False)
+            except ValueError:
+                self._resyncing = True             # corrupt element — rescan
+                pos += 1
+                continue
+            if size is None:
+                break
+            unknown = size == (1 << (7 * size_len)) - 1
+            body = pos + id_len + size_len
+
+            if eid == _EBML_HEADER and self._codec is not None:
+                # MediaRecorder restarted — new stream, fresh codec state
+                self._codec = None
+                self._audio_track = self._track_number = None
+
+            if eid in _MASTERS or unknown:
+                pos = body
+                if eid == _TRACK_ENTRY:
+                    self._track_number = self._track_codec = None
+                    self._codec_private = None
+                continue
+
+            if eid in (_SIMPLE_BLOCK, _BLOCK, _CODEC_ID, _CODEC_PRIVATE, _TRACK_NUMBER):
+                if body + size > len(buf):
+                    break                       # wait for the rest of it
+                if (eid in (_SIMPLE_BLOCK, _BLOCK) and self._codec is None
+                        and self._track_codec == "A_OPUS"):
+                    # No CodecPrivate in the track — decoder defaults apply
+                    self._audio_track = self._track_number
+                    self._open_codec(None)
+                data = bytes(buf[body:body + size])
+                pos = body + size
+                if eid in (_SIMPLE_BLOCK, _BLOCK):
+                    payload = self._block_payload(data)
+                    if payload is not None:
+                        packets.append(payload)
+                elif eid == _TRACK_NUMBER:
+                    self._track_number = int.from_bytes(data, "big")
+                elif eid == _CODEC_ID:
+                    self._track_codec = data.decode("ascii", "replace")
+                elif eid == _CODEC_PRIVATE:
+                    self._codec_private = data
+                if (self._codec is None and self._track_codec == "A_OPUS"
+                        and self._track_number is not None
+                        and self._codec_private is not None):
+                    self._audio_track = self._track_number
+                    self._open_codec(self._codec_private)
+                continue
+
+            # Anything else (EBML header, SeekHead, Cues, Void, …) is skipped
+            pos = body
+            self._skip = size
+
+        del buf[:pos]
+        return packets
+
+    def _find_webm_sync(self, buf: bytearray, pos: int) -> Optional[int]:
+        """
+        Offset of the next Cluster, or of an audio SimpleBlock whose size
+        lands exactly on another block / Cluster / Cues, at or after pos.
+        None if there is none yet (more bytes needed).
+        """
+        while pos < len(buf):
+            cluster = buf.find(_CLUSTER_ID, pos)
+            block   = buf.find(bytes([_SIMPLE_BLOCK]), pos)
+            if self._audio_track is None or block < 0 \
+                    or (0 <= cluster < block):
+                return cluster if cluster >= 0 else None
+            try:
+                size, size_len = _read_vint(buf, block + 1, keep_marker=False)
+                track, _       = _read_vint(buf, block + 1 + size_len, keep_marker=False) \
+                                 if size is not None else (None, 0)
+            except ValueError:
+                size = track = None
+                size_len = 1
+            if size is not None and track is not None:
+                end = block + 1 + size_len + size
+                if track == self._audio_track and 4 <= size <= _MAX_SYNC_BLOCK:
+                    if end + 4 > len(buf):
+                        return None                 # validate once more arrives
+                    if bytes(buf[end:end + 1]) in _FOLLOW_IDS \
+                            or bytes(buf[end:end + 4]) in _FOLLOW_IDS:
+                        return block
+            elif size is None and block + 9 > len(buf):
+                return None
+            pos = block + 1
+        return None
+
+    def _block_payload(self, data: bytes) -> Optional[bytes]:
+        track, n = _read_vint(data, 0, keep_marker=False)
+        if track != self._audio_track or len(data) < n + 3:
+            return None
+        flags = data[n + 2]
+        if flags & 0x06:
+            return None                         # laced — not emitted for Opus
+        return data[n + 3:]
+
+    # ─────────────────────────── Ogg demux ───────────────────────────────────
+
+    def _demux_ogg(self) -> List[bytes]:
+        buf, pos, packets = self._buf, 0, []
+        if self._gap_page is not None:
+            pos = self._recover_gap_page(packets)
+            if pos is None:
+                return packets                  # its tail is still arriving
+        while True:
+            start = buf.find(OGG_MAGIC, pos)
+            if start < 0:
+                pos = max(pos, len(buf) - 3)    # keep a possible partial magic
+                break
+            if start + 27 > len(buf):
+                pos = start
+                break
+            n_segs = buf[start + 26]
+            table_end = start + 27 + n_segs
+            if table_end > len(buf):
+                pos = start
+                break
+            lacing = buf[start + 27:table_end]
+            page_end = table_end + sum(lacing)
+            if page_end > len(buf):
+                pos = start
+                break
+
+            header_type = buf[start + 5]
+            if header_type & 0x02:              # beginning of stream
+                self._codec = None
+                self._ogg_headers_seen = 0
+                self._ogg_packet = bytearray()
+
+            # First page after a gap: the tail of a packet that began in the
+            # lost bytes is dropped, whole packets after it are kept
+            skip_tail = self._resyncing and bool(header_type & 0x01)
+            self._resyncing = False
+
+            p = table_end
+            for seg in lacing:
+                if skip_tail:
+                    p += seg
+                    skip_tail = seg == 255
+                    continue
+                self._ogg_packet += buf[p:p + seg]
+                p += seg
+                if seg < 255:
+                    packets.extend(self._ogg_complete(bytes(self._ogg_packet)))
+                    self._ogg_packet = bytearray()
+            pos = page_end
+
+        del buf[:pos]
+        return packets
+
+    def _held_ogg_page(self) -> Optional[tuple]:
+        """The incomplete page at the head of the buffer, if its header is in."""
+        buf = self._buf
+        if len(buf) < 27 or buf[:4] != OGG_MAGIC or buf[5] & 0x02:
+            return None
+        table_end = 27 + buf[26]
+        if table_end > len(buf):
+            return None
+        seq = int.from_bytes(buf[18:22], "little")
+        return seq, bytes(buf[27:table_end]), bytes(buf[table_end:])
+
+    def _recover_gap_page(self, packets: List[bytes]) -> Optional[int]:
+        """
+        Decode what survives of the page held across a gap. The bytes before
+        the next page are its tail if that page's sequence number follows
+        the held one's; packets touching the lost span are dropped. Returns
+        the offset to demux on from, None to wait for more bytes.
+        """
+        buf = self._buf
+        seq, lacing, head = self._gap_page
+        left  = sum(lacing) - len(head)         # page bytes after the head
+        start = buf.find(OGG_MAGIC)
+        if start < 0 or start + 27 > len(buf):
+            if len(buf) - 3 <= left:
+                return None
+            start = -1                          # more than its tail — lost
+        follows = (0 <= start <= left and
+                   int.from_bytes(buf[start + 18:start + 22], "little") == seq + 1)
+        if follows:
+            lost = (len(head), len(head) + left - start)   # page offsets
+            tail = bytes(buf[:start])
+        else:
+            # The gap crossed a page boundary: only the head survives, and
+            # demuxing resyncs on the next page
+            lost, tail, start = (len(head), len(head) + left), b"", 0
+
+        pkt, broken, off = self._ogg_packet, False, 0
+        for seg in lacing:
+            end = off + seg
+            if off < lost[1] and end > lost[0]:
+                broken = True
+            elif not broken:
+                pkt += head[off:end] if end <= lost[0] else \
+                       tail[off - lost[1]:end - lost[1]]
+            off = end
+            if seg < 255:
+                if not broken:
+                    packets.extend(self._ogg_complete(bytes(pkt)))
+                pkt, broken = bytearray(), False
+
+        # A packet left open continues on the next page — dropped if broken
+        self._ogg_packet = bytearray() if broken or not follows else pkt
+        self._resyncing  = broken or not follows
+        self._gap_page   = None
+        return start
+
+    def _ogg_complete(self, packet: bytes) -> List[bytes]:
+        if self._ogg_headers_seen == 0:
+            self._ogg_headers_seen = 1
+            if packet.startswith(b"OpusHead"):
+                self._open_codec(packet)
+            return []
+        if self._ogg_headers_seen == 1:
+            self._ogg_headers_seen = 2
+            if packet.startswith(b"OpusTags"):
+                return []
+        return [packet]
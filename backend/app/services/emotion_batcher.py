@@ -0,0 +1,151 @@
+"""
+emotion_batcher.py
+==================
+Cross-session micro-batching for HSEmotion inference.
+
+Without batching every face crop from every session is a separate
+batch-size-1 ONNX run. With dozens of concurrent interviews that is dozens
+of tiny runs per second, each paying the full per-call overhead.
+
+EmotionBatcher sits between VideoAnalyzer and the HSEmotion model:
+  1. Worker threads (one per frame being analysed) submit a face crop and
+     block on a Future.
+  2. A single batching thread collects crops from ALL sessions for at most
+     `max_wait_ms`, or until `max_batch_size` crops are waiting.
+  3. The batch runs as ONE predict_multi_emotions() call and each Future
+     receives its own (label, scores) result.
+
+Latency cost is bounded by max_wait_ms; under load batches fill up before
+the deadline, so the wait is usually much shorter.
+
+Used by:
+  - inference_engine.py : creates the process-wide batcher
+  - video_analyzer.py   : _analyze_emotions() submits crops through it
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, List, Tuple
+
+import numpy as np
+
+
+class EmotionBatcher:
+    """
+    Collects face crops from all sessions and runs them as batched inference.
+    """
+
+    def __init__(
+        self,
+        model:          Any,
+        max_batch_size: int   = 16,
+        max_wait_ms:    float = 4.0,
+    ):
+        self.model          = model
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait       = max(0.0, max_wait_ms) / 1000.0
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+
+        # Counters — exposed via stats() for sizing max_batch_size / max_wait
+        self.batches_run   = 0
+        self.crops_run     = 0
+        self.largest_batch = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="emotion-batcher", daemon=True)
+        self._thread.start()
+
+    # ─────────────────────────── Public API ──────────────────────────────────
+
+    def submit(self, crop: np.ndarray) -> Future:
+        """Queue one BGR face crop; the Future resolves to (label, scores)."""
+        fut: Future = Future()
+        if self._closed:
+            fut.set_exception(RuntimeError("EmotionBatcher is closed"))
+            return fut
+        self._queue.put((crop, fut))
+        return fut
+
+    def predict(self, crop: np.ndarray, timeout: float = 2.0) -> Tuple[str, np.ndarray]:
+        """Blocking helper with the same return shape as predict_emotions()."""
+        return self.submit(crop).result(timeout=timeout)
+
+    def stats(self) -> dict:
+        return {
+            "batches_run":    self.batches_run,
+            "crops_run":      self.crops_run,
+            "avg_batch_size": round(self.crops_run / self.batches_run, 2)
+                              if self.batches_run else 0.0,
+            "largest_batch":  self.largest_batch,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms":    self.max_wait * 1000.0,
+        }
+
+    def close(self):
+        """Stop the batching thread; pending crops are failed."""
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=1.0)
+
+    # ─────────────────────────── Batching loop ───────────────────────────────
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    self._run_batch(batch)
+                    self._fail_pending()
+                    return
+                batch.append(nxt)
+
+            self._run_batch(batch)
+
+        self._fail_pending()
+
+    def _run_batch(self, batch: List[tuple]):
+        crops = [crop for crop, _ in batch]
+        try:
+            if len(crops) == 1:
+                label, scores = self.model.predict_emotions(crops[0], logits=False)
+                results = [(label, scores)]
+            else:
+                labels, scores = self.model.predict_multi_emotions(crops, logits=False)
+                results = list(zip(labels, scores))
+        except Exception as e:
+            print(f"[EmotionBatcher] Batch of {len(crops)} failed: {e}")
+            for _, fut in batch:
+                fut.set_exception(e)
+            return
+
+        self.batches_run   += 1
+        self.crops_run     += len(crops)
+        self.largest_batch  = max(self.largest_batch, len(crops))
+
+        for (_, fut), result in zip(batch, results):
+            fut.set_result(result)
+
+    def _fail_pending(self):
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None:
+                item[1].set_exception(RuntimeError("EmotionBatcher is closed"))
@@ -15,7 +15,7 @@ Changes from original:
   - LLM prompt, strengths/improvements logic, structure all kept exactly
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 from .llm_service import LLMService
 
@@ -23,8 +23,8 @@ from .llm_service import LLMService
 class FeedbackGenerator:
     """Generates comprehensive feedback reports after interview sessions."""
 
-    def __init__(self):
-        self.llm_service = LLMService()
+    def __init__(self, llm_service: Optional[LLMService] = None):
+        self.llm_service = llm_service or LLMService()
 
     async def generate_comprehensive_feedback(
         self,
@@ -331,13 +331,7 @@ Keep the tone supportive, constructive, and professional."""
             return self._fallback_feedback(user_name, scores, strengths, improvements)
 
         try:
-            response = self.llm_service.client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.llm_service.model,
-                temperature=0.7,
-                max_tokens=800,
-            )
-            return response.choices[0].message.content.strip()
+            return await self.llm_service.chat(prompt, temperature=0.7, max_tokens=800)
         except Exception as e:
             print(f"[FeedbackGenerator] LLM error: {e}")
             return self._fallback_feedback(user_name, scores, strengths, improvements)
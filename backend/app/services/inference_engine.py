@@ -0,0 +1,114 @@
+"""
+inference_engine.py
+===================
+Process-wide owner of every heavy model used during live interviews.
+
+Before this module each WebSocket connection built its own RealTimeMonitor,
+which in turn loaded its own MediaPipe FaceMesh, Whisper model, worker pool
+and Groq client — memory and connect time grew by one model set per socket.
+
+Now:
+  - ONE VideoAnalyzer   (HSEmotion; each session's VideoSessionState holds
+                         its own tracking-mode FaceMesh graph)
+  - ONE EmotionBatcher  (face crops from all sessions → batched ONNX runs)
+  - ONE AudioAnalyzer   (acoustic features)
+  - ONE TranscriptionService (configured Whisper model, async queue with
+                              bounded concurrency — see transcription_service.py)
+  - ONE LLMService      (AsyncGroq over one pooled HTTP client, capped
+                         in-flight calls — see llm_service.py)
+  - ONE ThreadPoolExecutor sized to the host's cores
+are shared by every session. Each session only holds a VideoSessionState
+and an AudioSessionState (see real_time_monitor.py), which the engine's
+analyzers read and update.
+
+Used by:
+  - real_time_monitor.py : runs per-session analysis on the shared pool
+  - routers/websocket.py : shared LLMService for evaluation / follow-ups
+  - routers/sessions.py  : shared LLMService for question generation
+  - main.py              : warm-up on startup, shutdown on exit
+"""
+
+import os
+import asyncio
+from typing import Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import settings
+from .video_analyzer import VideoAnalyzer
+from .emotion_batcher import EmotionBatcher
+from .audio_analyzer import AudioAnalyzer
+from .transcription_service import TranscriptionService
+from .llm_service import LLMService
+
+
+class InferenceEngine:
+    """
+    Shared models + worker pool for all concurrent interview sessions.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = (
+            max_workers
+            or settings.inference_workers
+            or os.cpu_count()
+            or 2
+        )
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="inference",
+        )
+
+        print(f"[InferenceEngine] Loading shared models "
+              f"({self.max_workers} workers)...")
+        self.video_analyzer = VideoAnalyzer(
+            roi_tracking=settings.face_roi_tracking,
+            mesh_input_size=settings.face_mesh_input_size,
+        )
+        self.audio_analyzer = AudioAnalyzer(pitch_engine=settings.pitch_engine)
+        self.audio_analyzer.warm_up()
+        self.transcription  = TranscriptionService()
+        self.llm_service    = LLMService()
+
+        self.emotion_batcher: Optional[EmotionBatcher] = None
+        if settings.emotion_batching_enabled and self.video_analyzer.emotion_model is not None:
+            self.emotion_batcher = EmotionBatcher(
+                self.video_analyzer.emotion_model,
+                max_batch_size=settings.emotion_batch_max_size,
+                max_wait_ms=settings.emotion_batch_max_wait_ms,
+            )
+            self.video_analyzer.emotion_batcher = self.emotion_batcher
+        print("✓ InferenceEngine ready")
+
+    async def run(self, fn: Callable[..., Any], *args) -> Any:
+        """Run a blocking analysis call on the shared worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn, *args)
+
+    def shutdown(self):
+        """Stop the worker pool — call once on application shutdown."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.transcription.close()
+        if self.emotion_batcher is not None:
+            self.emotion_batcher.close()
+
+
+# ─────────────────────────── Process-wide instance ───────────────────────────
+
+_engine: Optional[InferenceEngine] = None
+
+
+def get_inference_engine() -> InferenceEngine:
+    """Return the process-wide engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = InferenceEngine()
+    return _engine
+
+
+async def shutdown_inference_engine():
+    """Shut down the process-wide engine if it was created."""
+    global _engine
+    if _engine is not None:
+        await _engine.llm_service.close()
+        _engine.shutdown()
+        _engine = None
@@ -8,16 +8,42 @@ Key changes from original:
     and injects it into the prompt to anchor the LLM score within ±15
   - decide_next_action() added — uses concrete rules to decide:
       next_question / follow_up / end_session
+  - Tiered evaluation: when the pre-score's confidence band is clearly
+    weak or clearly strong, the LLM (which could only move the score
+    ±15) is skipped and the evaluation is built from the pre-score.
+    Every evaluation carries "evaluation_tier":
+      local_weak / local_strong / llm / fallback
+  - With a trained surrogate model (surrogate_scorer.py), its estimate of
+    the LLM score replaces composite_pre_score as the ±15 clamp anchor,
+    the centre of the tiering band and the local / fallback score;
+    "anchor_source" records which was used
   - All existing methods kept with same signatures for compatibility
   - All fallbacks kept intact
+  - Calls are truly async: AsyncGroq over ONE pooled httpx.AsyncClient
+    (the sync Groq client blocked the event loop — every other session's
+    frames, pings and answers — for each round-trip), with a per-call
+    timeout and a process-wide cap on in-flight calls
+    (settings.llm_timeout_seconds / llm_max_concurrency)
+
+Used by:
+  - inference_engine.py      : ONE instance per process
+  - routers/websocket.py     : evaluation, decisions, follow-ups
+  - routers/sessions.py      : question generation
+  - feedback_generator.py    : chat() for the session report
 """
 
-from groq import Groq
+import asyncio
+import time
+
+import httpx
+from groq import AsyncGroq
 from ..config import settings
 import json
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 
-from .answer_scorer import build_scoring_context
+from .answer_scorer import build_scoring_context, confidence_band, summarize_pre_score
+from .surrogate_scorer import load_surrogate_scorer
+from ..utils.timing import StageTimings
 
 
 class LLMService:
@@ -27,15 +53,91 @@ class LLMService:
     """
 
     def __init__(self):
+        self.max_concurrency = max(1, settings.llm_max_concurrency)
         try:
-            self.client = Groq(api_key=settings.GROQ_API_KEY) \
-                          if settings.GROQ_API_KEY else None
+            self.client = AsyncGroq(
+                api_key=settings.GROQ_API_KEY,
+                base_url=settings.llm_base_url,
+                timeout=settings.llm_timeout_seconds,
+                max_retries=settings.llm_max_retries,
+                # One keep-alive pool for every session's calls
+                http_client=httpx.AsyncClient(
+                    timeout=settings.llm_timeout_seconds,
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_concurrency,
+                    ),
+                ),
+            ) if settings.GROQ_API_KEY else None
         except Exception as e:
             print(f"[LLMService] Groq init error: {e}")
             self.client = None
 
         self.model = "llama-3.1-8b-instant"
 
+        # Local estimate of the LLM score (None → composite_pre_score)
+        self.surrogate = load_surrogate_scorer(settings.surrogate_model_path)
+
+        # Process-wide cap on in-flight calls (this instance is shared)
+        self._limit    = asyncio.Semaphore(self.max_concurrency)
+        self.in_flight = 0
+        self.calls     = 0
+        self.failed    = 0
+        self.timings   = StageTimings()
+
+    # ─────────────────────────── Transport ───────────────────────────────────
+
+    async def chat(
+        self,
+        prompt:      str,
+        temperature: float,
+        max_tokens:  int,
+        timeout:     Optional[float] = None,
+    ) -> str:
+        """
+        One chat completion → stripped message text. Waits for a slot under
+        the concurrency cap; raises on timeout / API errors (callers keep
+        their own fallbacks).
+        """
+        queued_at = time.perf_counter()
+        async with self._limit:
+            started = time.perf_counter()
+            self.in_flight += 1
+            try:
+                response = await self.client.chat.completions.create(
+                    messages=[{"role": "user", "content": prompt}],
+                    model=self.model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=timeout or settings.llm_timeout_seconds,
+                )
+                self.calls += 1
+            except Exception:
+                self.failed += 1
+                raise
+            finally:
+                self.in_flight -= 1
+                self.timings.record_frame({
+                    "queue_wait": (started - queued_at) * 1000.0,
+                    "request":    (time.perf_counter() - started) * 1000.0,
+                })
+        return response.choices[0].message.content.strip()
+
+    def get_timings(self) -> Dict[str, Any]:
+        return {
+            "model":           self.model if self.client else None,
+            "max_concurrency": self.max_concurrency,
+            "in_flight":       self.in_flight,
+            "completed":       self.calls,
+            "failed":          self.failed,
+            "stages":          self.timings.snapshot(),
+        }
+
+    async def close(self):
+        """Close the pooled HTTP client — call once on shutdown."""
+        if self.client is not None:
+            await self.client.close()
+
     # ─────────────────────────── Question generation ─────────────────────────
 
     async def generate_interview_questions(
@@ -94,13 +196,9 @@ Return ONLY a valid JSON array, no markdown, no explanation:
             return self._get_default_questions(position)
 
         try:
-            response = self.client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.model,
-                temperature=0.7,
-                max_tokens=2000,
-            )
-            content = response.choices[0].message.content.strip()
+            # Long generation — twice the usual timeout
+            content = await self.chat(prompt, temperature=0.7, max_tokens=2000,
+                                      timeout=settings.llm_timeout_seconds * 2)
             content = self._extract_json(content)
             return json.loads(content)
 
@@ -133,12 +231,21 @@ Return ONLY a valid JSON array, no markdown, no explanation:
                             but strongly recommended
 
         Returns:
-            Dict with scores and feedback, compatible with InterviewResponse
+            Dict with scores and feedback, compatible with InterviewResponse,
+            plus "evaluation_tier"
         """
+        # Decisive pre-score → local evaluation, no LLM round-trip
+        tier = self.evaluation_tier(pre_score, expected_type)
+        if tier != "llm":
+            return self._local_evaluation(pre_score, expected_type, tier)
+
         # Build pre-score context string if available
         pre_score_context = ""
+        anchor, anchor_source = None, None
         if pre_score and pre_score.get("composite_pre_score", 0) > 0:
-            pre_score_context = "\n\n" + build_scoring_context(pre_score)
+            anchor, anchor_source = self.score_anchor(pre_score, expected_type)
+            pre_score_context = "\n\n" + build_scoring_context(
+                pre_score, anchor if anchor_source == "surrogate" else None)
 
         # STAR section only for behavioral questions
         star_section = ""
@@ -188,33 +295,62 @@ Return ONLY this JSON (no markdown):
 }}"""
 
         if not self.client:
-            return self._fallback_evaluation(pre_score)
+            return self._fallback_evaluation(pre_score, expected_type)
 
         try:
-            response = self.client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.model,
-                temperature=0.3,
-                max_tokens=600,
-            )
-            content = response.choices[0].message.content.strip()
+            content = await self.chat(prompt, temperature=0.3, max_tokens=600)
             content = self._extract_json(content)
             result  = json.loads(content)
 
-            # Clamp overall_score to pre_score ±15 if pre_score was provided
-            if pre_score and pre_score.get("composite_pre_score", 0) > 0:
-                anchor     = pre_score["composite_pre_score"]
+            # Clamp overall_score to anchor ±15 if pre_score was provided
+            if anchor is not None:
                 low, high  = max(0, anchor - 15), min(100, anchor + 15)
                 raw_score  = result.get("overall_score", anchor)
                 result["overall_score"] = round(
                     max(low, min(high, raw_score)), 1)
                 result["pre_score_anchor"] = anchor   # saved for transparency
+                result["anchor_source"]    = anchor_source
 
+            result["evaluation_tier"] = "llm"
             return result
 
         except Exception as e:
             print(f"[LLMService] Evaluation error: {e}")
-            return self._fallback_evaluation(pre_score)
+            return self._fallback_evaluation(pre_score, expected_type)
+
+    def evaluation_tier(
+        self,
+        pre_score:     Optional[Dict[str, Any]],
+        expected_type: str = "behavioral",
+    ) -> str:
+        """
+        "local_weak" / "local_strong" when the confidence band around the
+        score anchor lies entirely below settings.eval_local_weak_below /
+        above settings.eval_local_strong_above, else "llm".
+        """
+        if (not settings.eval_tiering or not pre_score
+                or pre_score.get("composite_pre_score", 0) <= 0):
+            return "llm"
+        anchor, _ = self.score_anchor(pre_score, expected_type)
+        low, high = confidence_band(pre_score, anchor)
+        if high < settings.eval_local_weak_below:
+            return "local_weak"
+        if low > settings.eval_local_strong_above:
+            return "local_strong"
+        return "llm"
+
+    def score_anchor(
+        self,
+        pre_score:     Dict[str, Any],
+        expected_type: str = "behavioral",
+    ) -> Tuple[float, str]:
+        """
+        Centre of the ±15 clamp: (score, "surrogate") from the trained
+        surrogate model, else (composite_pre_score, "pre_score").
+        """
+        if self.surrogate is not None:
+            return self.surrogate.predict(pre_score, expected_type), "surrogate"
+        return pre_score.get("composite_pre_score", 70), "pre_score"
 
     # ─────────────────────────── Follow-up generation ────────────────────────
 
@@ -246,13 +382,7 @@ Return ONLY the question text, nothing else."""
             return "Can you give me a specific example of that?"
 
         try:
-            response = self.client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.model,
-                temperature=0.8,
-                max_tokens=100,
-            )
-            return response.choices[0].message.content.strip()
+            return await self.chat(prompt, temperature=0.8, max_tokens=100)
 
         except Exception as e:
             print(f"[LLMService] Follow-up error: {e}")
@@ -300,9 +430,61 @@ Return ONLY the question text, nothing else."""
               reason       : human-readable reason (for debugging)
               confidence   : "rule_based" | "llm_assisted"
         """
+        decision = self._rule_based_action(
+            pre_score, question_number, total_questions, follow_ups_given)
+        if decision is not None:
+            return decision
+
+        composite          = pre_score.get("composite_pre_score", 50)
+        needs_followup_llm = evaluation.get("needs_follow_up", False)
+
+        # Rule 4 — LLM flagged follow-up AND we haven't given one yet
+        if needs_followup_llm and follow_ups_given == 0:
+            return {
+                "action":     "follow_up",
+                "reason":     "LLM flagged answer needs elaboration",
+                "confidence": "llm_assisted",
+            }
+
+        # Rule 5 — default: move on
+        return {
+            "action":     "next_question",
+            "reason":     f"Answer adequate (pre-score: {composite:.0f})",
+            "confidence": "rule_based",
+        }
+
+    def predicts_follow_up(
+        self,
+        pre_score:        Dict[str, Any],
+        question_number:  int,
+        total_questions:  int,
+        follow_ups_given: int = 0,
+    ) -> bool:
+        """
+        True when decide_next_action() will return follow_up whatever the
+        LLM evaluation says (rule 3) — known before the evaluation starts.
+        """
+        decision = self._rule_based_action(
+            pre_score, question_number, total_questions, follow_ups_given)
+        return decision is not None and decision["action"] == "follow_up"
+
+    def can_follow_up(self, follow_ups_given: int) -> bool:
+        """
+        True when decide_next_action() could still ask for a follow-up on
+        this question — rules 3 and 4 both require none given yet.
+        """
+        return follow_ups_given == 0
+
+    def _rule_based_action(
+        self,
+        pre_score:        Dict[str, Any],
+        question_number:  int,
+        total_questions:  int,
+        follow_ups_given: int,
+    ) -> Optional[Dict[str, Any]]:
+        """Rules 1-3 of decide_next_action() — they need no evaluation."""
         composite    = pre_score.get("composite_pre_score", 50)
         star_found   = len(pre_score.get("star_components_found", []))
-        needs_followup_llm = evaluation.get("needs_follow_up", False)
 
         # Rule 1 — session end
         if question_number >= total_questions and follow_ups_given >= 1:
@@ -329,20 +511,7 @@ Return ONLY the question text, nothing else."""
                 "confidence": "rule_based",
             }
 
-        # Rule 4 — LLM flagged follow-up AND we haven't given one yet
-        if needs_followup_llm and follow_ups_given == 0:
-            return {
-                "action":     "follow_up",
-                "reason":     "LLM flagged answer needs elaboration",
-                "confidence": "llm_assisted",
-            }
-
-        # Rule 5 — default: move on
-        return {
-            "action":     "next_question",
-            "reason":     f"Answer adequate (pre-score: {composite:.0f})",
-            "confidence": "rule_based",
-        }
+        return None
 
     # ─────────────────────────── Private helpers ─────────────────────────────
 
@@ -355,10 +524,16 @@ Return ONLY the question text, nothing else."""
         return content.strip()
 
     def _fallback_evaluation(
-        self, pre_score: Optional[Dict[str, Any]] = None
+        self,
+        pre_score:     Optional[Dict[str, Any]] = None,
+        expected_type: str = "behavioral",
     ) -> Dict[str, Any]:
-        """Fallback when LLM is unavailable. Uses pre_score if available."""
-        base = pre_score.get("composite_pre_score", 70) if pre_score else 70
+        """
+        Fallback when LLM is unavailable. Uses pre_score if available —
+        scored by the surrogate model when one is trained.
+        """
+        base, source = self.score_anchor(pre_score, expected_type) \
+                       if pre_score else (70, None)
         return {
             "relevance_score":    base,
             "clarity_score":      base,
@@ -371,8 +546,60 @@ Return ONLY the question text, nothing else."""
                                   "Score estimated from objective metrics.",
             "needs_follow_up":    False,
             "pre_score_anchor":   base,
+            "anchor_source":      source,
+            "evaluation_tier":    "fallback",
         }
 
+    def _local_evaluation(
+        self,
+        pre_score:     Dict[str, Any],
+        expected_type: str,
+        tier:          str,
+    ) -> Dict[str, Any]:
+        """
+        Evaluation built from the pre-score alone (decisive tiers). Same
+        shape as the LLM result, scored at the score anchor, with strengths
+        / improvements read off the components.
+        """
+        base, source = self.score_anchor(pre_score, expected_type)
+        weak = tier == "local_weak"
+        strengths, improvements = summarize_pre_score(pre_score)
+        if not strengths:
+            strengths = ["Answer provided"]
+        if not improvements:
+            improvements = ["Tie the result back to the role you are applying for"]
+
+        if weak:
+            feedback = (f"This answer needs more substance. "
+                        f"{improvements[0]}.")
+        else:
+            feedback = (f"Strong, well-structured answer. "
+                        f"{strengths[0]}.")
+
+        result = {
+            "relevance_score":    pre_score.get("relevance_score", base),
+            "clarity_score":      round((pre_score.get("sentence_clarity_score", base)
+                                         + pre_score.get("filler_word_score", base)) / 2, 1),
+            "completeness_score": round((pre_score.get("word_count_score", base)
+                                         + pre_score.get("star_keyword_score", base)) / 2, 1),
+            "specificity_score":  pre_score.get("specificity_score", base),
+            "overall_score":      base,
+            "strengths":          strengths,
+            "improvements":       improvements,
+            "feedback":           feedback,
+            "needs_follow_up":    weak,
+            "pre_score_anchor":   base,
+            "anchor_source":      source,
+            "evaluation_tier":    tier,
+        }
+        if expected_type == "behavioral":
+            found = pre_score.get("star_components_found", [])
+            result["star_components"] = {
+                f"has_{component}": component in found
+                for component in ("situation", "task", "action", "result")
+            }
+        return result
+
     def _get_default_questions(self, position: str) -> List[Dict[str, str]]:
         """Fallback questions when LLM unavailable."""
         return [
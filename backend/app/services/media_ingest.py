@@ -0,0 +1,159 @@
+"""
+media_ingest.py
+===============
+Per-session bounded ingestion stage between the WebSocket reader and the
+video / audio analysis workers.
+
+Without it the message loop awaited analysis inline for every media frame:
+when inference fell behind the client's send rate, frames piled up in the
+socket buffer and ping / answer / end_session messages waited behind
+seconds of stale video.
+
+Now:
+  - video : depth-1 "latest wins" slot. A frame arriving while the previous
+            one is still waiting replaces it (the stale one is dropped), so
+            analysis lag never exceeds one frame.
+  - audio : small ring (settings.ingest_audio_ring_size). When full the
+            OLDEST chunk is dropped. Audio is a stream (WebM / Ogg chunks
+            only decode in order), so a drop is reported to on_audio_gap
+            before the next chunk runs — the decoder resyncs on it.
+  - one worker task per kind drains its buffer and runs the handler, so at
+    most one video and one audio analysis are in flight per session.
+
+Dropped counts and queue-wait times are kept per session (stats()).
+
+Used by:
+  - routers/websocket.py : reader task offers media, workers run analysis
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..config import settings
+from ..utils.stats import RunningStats
+
+
+MediaHandler = Callable[..., Awaitable[None]]
+
+
+class _Lane:
+    """Counters + wait-time stats for one media kind."""
+
+    __slots__ = ("received", "processed", "dropped", "wait_ms")
+
+    def __init__(self):
+        self.received  = 0
+        self.processed = 0
+        self.dropped   = 0
+        self.wait_ms   = RunningStats()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "received":     self.received,
+            "processed":    self.processed,
+            "dropped":      self.dropped,
+            "avg_wait_ms":  round(self.wait_ms.mean, 2),
+            "max_wait_ms":  round(self.wait_ms.max, 2) if self.wait_ms.count else 0.0,
+        }
+
+
+class MediaIngest:
+    """
+    Bounded media buffers + worker tasks for ONE interview session.
+    """
+
+    def __init__(
+        self,
+        on_video:        MediaHandler,
+        on_audio:        MediaHandler,
+        audio_ring_size: Optional[int] = None,
+        on_audio_gap:    Optional[Callable[[], Any]] = None,
+    ):
+        self.on_video     = on_video
+        self.on_audio     = on_audio
+        self.on_audio_gap = on_audio_gap
+
+        self._video_slot: Optional[tuple] = None
+        self._audio_ring: deque = deque(
+            maxlen=max(1, audio_ring_size or settings.ingest_audio_ring_size))
+        self._audio_gap   = False   # a chunk was dropped before the ring's head
+        self._video_ready = asyncio.Event()
+        self._audio_ready = asyncio.Event()
+
+        self.video = _Lane()
+        self.audio = _Lane()
+
+        self._tasks = [
+            asyncio.create_task(self._video_worker()),
+            asyncio.create_task(self._audio_worker()),
+        ]
+
+    # ─────────────────────────── Producer side (reader task) ─────────────────
+
+    def offer_video(self, *args, **kwargs):
+        """Queue a frame for analysis, replacing any frame still waiting."""
+        self.video.received += 1
+        if self._video_slot is not None:
+            self.video.dropped += 1
+        self._video_slot = (time.perf_counter(), args, kwargs)
+        self._video_ready.set()
+
+    def offer_audio(self, *args, **kwargs):
+        """Queue a chunk for analysis; the oldest waiting chunk goes if full."""
+        self.audio.received += 1
+        if len(self._audio_ring) == self._audio_ring.maxlen:
+            self.audio.dropped += 1
+            self._audio_gap = True
+        self._audio_ring.append((time.perf_counter(), args, kwargs))
+        self._audio_ready.set()
+
+    # ─────────────────────────── Workers ─────────────────────────────────────
+
+    async def _video_worker(self):
+        while True:
+            await self._video_ready.wait()
+            self._video_ready.clear()
+            item, self._video_slot = self._video_slot, None
+            if item is not None:
+                await self._run(self.video, self.on_video, item)
+
+    async def _audio_worker(self):
+        while True:
+            await self._audio_ready.wait()
+            self._audio_ready.clear()
+            while self._audio_ring:
+                item = self._audio_ring.popleft()
+                if self._audio_gap:
+                    self._audio_gap = False
+                    if self.on_audio_gap is not None:
+                        self.on_audio_gap()
+                await self._run(self.audio, self.on_audio, item)
+
+    async def _run(self, lane: _Lane, handler: MediaHandler, item: tuple):
+        queued_at, args, kwargs = item
+        lane.wait_ms.add((time.perf_counter() - queued_at) * 1000.0)
+        try:
+            await handler(*args, **kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[MediaIngest] Handler error: {e}")
+        lane.processed += 1
+
+    # ─────────────────────────── Lifecycle / stats ───────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "video": self.video.to_dict(),
+            "audio": self.audio.to_dict(),
+        }
+
+    async def close(self):
+        """Cancel the workers; anything still buffered is discarded."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._video_slot = None
+        self._audio_ring.clear()
@@ -11,15 +11,35 @@ Changes from original:
   - Added: reset_answer() — resets per-answer state between questions
   - reset() now also calls audio_analyzer.reset_answer()
   - All existing logic, thresholds, and interventions kept exactly
+  - Models + worker pool now come from the shared InferenceEngine;
+    the monitor only owns per-session VideoSessionState / AudioSessionState
+  - get_answer_snapshot() video data is now the current answer's window,
+    not the session-rolling average; reset_answer() starts a new window
+  - Audio chunks: decode on the shared pool, await the process-wide
+    TranscriptionService, then analyze on the pool — Whisper no longer
+    runs on (or blocks) the analysis workers
+  - settings.transcription_mode "answer" / "segment": chunks only feed the
+    answer's PCM buffer; Whisper runs once per answer (or per pause-closed
+    segment in the background) and finalize_answer_transcript() hands the
+    single transcript to the audio snapshot. Chunks the browser
+    transcribed keep its text; Whisper only covers the spans without it,
+    and the answer transcript joins both in order (the browser's text is
+    cumulative per answer, so each span takes only the words it added)
+  - TranscriptRouter applies speech_recognition_mode / whisper_enabled /
+    max_audio_chunk_size_mb per chunk and counts transcripts by source
+  - Voice-activity gate runs with the decode; silent chunks never reach
+    Whisper, voiced chunks send only their voiced spans
 """
 
-from typing import Dict, Any, Optional
-from datetime import datetime
-from .video_analyzer import VideoAnalyzer
-from .audio_analyzer import AudioAnalyzer
-from .llm_service import LLMService
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Union
+from datetime import datetime
+from functools import partial
+from ..config import settings
+from .video_analyzer import VideoSessionState
+from .audio_analyzer import AudioSessionState, MIN_ANALYSIS_SECONDS
+from .inference_engine import InferenceEngine, get_inference_engine
+from .transcript_router import BROWSER, WHISPER, TranscriptRouter
 
 
 class RealTimeMonitor:
@@ -28,11 +48,19 @@ class RealTimeMonitor:
     Generates instant feedback and warnings during the interview.
     """
 
-    def __init__(self):
-        self.video_analyzer = VideoAnalyzer()
-        self.audio_analyzer = AudioAnalyzer()
-        self.executor       = ThreadPoolExecutor(max_workers=2)
-        self.llm_service    = LLMService()
+    def __init__(self, engine: Optional[InferenceEngine] = None):
+        # Shared, process-wide models and worker pool
+        self.engine         = engine or get_inference_engine()
+        self.video_analyzer = self.engine.video_analyzer
+        self.audio_analyzer = self.engine.audio_analyzer
+        self.transcription  = self.engine.transcription
+        self.transcripts    = TranscriptRouter(
+            whisper_available=self.transcription.available)
+        self.llm_service    = self.engine.llm_service
+
+        # Per-session state the shared analyzers work on
+        self.video_state    = VideoSessionState()
+        self.audio_state    = AudioSessionState()
 
         # Thresholds for triggering real-time interventions
         self.intervention_cooldown  = 30# seconds between interventions
@@ -65,30 +93,40 @@ class RealTimeMonitor:
         # Track warnings shown during current answer (saved to DB per answer)
         self._warnings_shown: list = []
 
+        # The current answer's text in order (deferred modes): Whisper jobs
+        # for the buffered spans, and between them browser spans — the word
+        # offset each starts at in the browser's cumulative transcript
+        self._answer_parts: List[Union[int, asyncio.Task]] = []
+        self._browser_text = ""
+
     # ─────────────────────────── Real-time analysis ───────────────────────────
 
     async def analyze_frame_realtime(
         self,
-        video_frame: str,
-        audio_chunk: Optional[str] = None,
-        transcript:  Optional[str] = None,
-        user_name:   str = "there",
+        video_frame:    Union[str, bytes, memoryview, None],
+        audio_chunk:    Union[str, bytes, memoryview, None] = None,
+        transcript:     Optional[str] = None,
+        user_name:      str = "there",
+        audio_codec:    Optional[str] = None,
+        audio_rate:     int = 0,
+        audio_channels: int = 1,
     ) -> Dict[str, Any]:
         """
         Analyze a single frame/moment in real-time.
 
         Args:
-            video_frame: Base64 encoded video frame
-            audio_chunk: Optional base64 encoded audio
-            transcript : Optional transcript of current speech
-            user_name  : User's first name for personalized messages
+            video_frame   : Base64 encoded video frame, or raw JPEG bytes
+            audio_chunk   : Optional base64 encoded audio, or raw payload bytes
+            transcript    : Optional transcript of current speech
+            user_name     : User's first name for personalized messages
+            audio_codec   : codec of a binary audio payload (None for base64)
+            audio_rate    : sample rate of raw PCM audio
+            audio_channels: channel count of raw PCM audio
 
         Returns:
             Dict with video_analysis, audio_analysis,
             intervention (if triggered), warnings, should_interrupt
         """
-        loop = asyncio.get_event_loop()   # ← fixed: was before docstring
-
         result = {
             "timestamp":       datetime.utcnow().isoformat(),
             "video_analysis":  {},
@@ -100,9 +138,9 @@ class RealTimeMonitor:
 
         # ── Video analysis ────────────────────────────────────────────────────
         if video_frame:
-            video_analysis = await loop.run_in_executor(
-                self.executor,
+            video_analysis = await self.engine.run(
                 self.video_analyzer.analyze_frame,
+                self.video_state,
                 video_frame,
             )
             result["video_analysis"] = video_analysis
@@ -116,12 +154,8 @@ class RealTimeMonitor:
 
         # ── Audio analysis ────────────────────────────────────────────────────
         if audio_chunk:
-            audio_analysis = await loop.run_in_executor(
-                self.executor,
-                self.audio_analyzer.analyze_audio_chunk,
-                audio_chunk,
-                transcript,
-            )
+            audio_analysis = await self._analyze_audio(
+                audio_chunk, transcript, audio_codec, audio_rate, audio_channels)
             result["audio_analysis"] = audio_analysis
 
             audio_intervention = self._check_audio_interventions(
@@ -142,6 +176,136 @@ class RealTimeMonitor:
 
         return result
 
+    async def _analyze_audio(
+        self,
+        audio_chunk:    Union[str, bytes, memoryview],
+        transcript:     Optional[str],
+        audio_codec:    Optional[str],
+        audio_rate:     int,
+        audio_channels: int,
+    ) -> Dict[str, Any]:
+        """Decode → transcript (browser / Whisper / none) → acoustic analysis."""
+        payload_bytes = (len(audio_chunk) * 3 // 4 if isinstance(audio_chunk, str)
+                         else len(audio_chunk))
+        source     = self.transcripts.route(transcript, payload_bytes)
+        transcript = transcript if source == BROWSER else None
+
+        try:
+            y, sr, voice = await self.engine.run(partial(
+                self._decode_and_gate,
+                audio_chunk,
+                codec=audio_codec,
+                source_rate=audio_rate,
+                channels=audio_channels,
+            ))
+        except Exception as e:
+            print(f"[RealTimeMonitor] Audio decode error: {e}")
+            return self.audio_analyzer.empty_result(f"Analysis error: {str(e)}")
+
+        mode     = settings.transcription_mode
+        deferred = mode != "chunk" and source == WHISPER
+
+        timing = None
+        if (source == WHISPER and not deferred and voice.voiced
+                and self.audio_analyzer.chunk_duration(self.audio_state, y, sr)
+                    >= MIN_ANALYSIS_SECONDS):
+            speech     = voice.voiced_audio(y)
+            timing     = await self.transcription.transcribe(speech, sr)
+            transcript = timing.pop("text")
+            self.transcripts.record_whisper(timing)
+            self.audio_state.transcribed_seconds += len(speech) / sr
+
+        analysis = await self.engine.run(partial(
+            self.audio_analyzer.analyze_samples,
+            self.audio_state, y, sr, transcript,
+            buffer_pcm=deferred,
+            voice=voice,
+        ))
+        analysis["transcript_source"] = source
+        if timing is not None:
+            analysis["transcription_ms"] = timing
+
+        if mode == "segment" and deferred:
+            await self._queue_segment(
+                self.audio_analyzer.take_closed_segment(self.audio_state), sr)
+        elif mode != "chunk" and source == BROWSER:
+            # Browser text for this span: Whisper gets the audio buffered
+            # before it, so the answer transcript keeps the spoken order
+            await self._queue_segment(
+                self.audio_analyzer.take_remaining_audio(self.audio_state), sr)
+            self._add_browser_text(transcript)
+        return analysis
+
+    def _add_browser_text(self, transcript: str):
+        """
+        Keep the browser's transcript, which holds the whole answer so far
+        (final + interim). A new browser span starts, at the first word
+        past the previous transcript, only after Whisper work; otherwise
+        the current span just grows.
+        """
+        if not self._answer_parts or isinstance(self._answer_parts[-1], asyncio.Task):
+            self._answer_parts.append(len(self._browser_text.split()))
+        self._browser_text = transcript
+
+    async def _queue_segment(self, segment, sr: int):
+        """
+        Start Whisper on a closed stretch of the answer buffer (None:
+        nothing). With settings.transcription_session_jobs already in
+        flight, waits for one to finish first — the session's audio lane
+        slows down instead of the shared queue growing.
+        """
+        if segment is None:
+            return
+        limit   = max(1, settings.transcription_session_jobs)
+        pending = [p for p in self._answer_parts
+                   if isinstance(p, asyncio.Task) and not p.done()]
+        while len(pending) >= limit:
+            _, still = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending = list(still)
+        self.audio_state.transcribed_seconds += len(segment) / sr
+        self._answer_parts.append(asyncio.create_task(
+            self.transcription.transcribe(segment, sr)))
+
+    def _decode_and_gate(self, audio_chunk, **decode_kwargs):
+        """Decode + voice gate in one pool hop."""
+        y, sr = self.audio_analyzer.decode_chunk(
+            self.audio_state, audio_chunk, **decode_kwargs)
+        return y, sr, self.audio_analyzer.gate(self.audio_state, y, sr)
+
+    async def finalize_answer_transcript(self):
+        """
+        Deferred transcription modes: transcribe whatever the answer buffer
+        still holds, wait for the background segments and set the answer's
+        transcript — Whisper segments and browser transcripts joined in
+        order. Call before get_answer_snapshot(). No-op in "chunk" mode or
+        when nothing went to Whisper (the chunks' own text stands).
+        """
+        state = self.audio_state
+        if settings.transcription_mode == "chunk" or not self.transcription.available:
+            self._cancel_segment_jobs()
+            return
+
+        await self._queue_segment(
+            self.audio_analyzer.take_remaining_audio(state), state.answer_sr)
+        parts, self._answer_parts = self._answer_parts, []
+        words, self._browser_text = self._browser_text.split(), ""
+        jobs = [p for p in parts if isinstance(p, asyncio.Task)]
+        if not jobs:
+            return
+
+        results = await asyncio.gather(*jobs)
+        for r in results:
+            self.transcripts.record_whisper(r)
+        # Browser spans are cut from its final text — interim words it
+        # revised later are not kept twice
+        starts = [p for p in parts if isinstance(p, int)]
+        ends   = iter(starts[1:] + [len(words)])
+        texts  = [" ".join(words[p:next(ends)]) if isinstance(p, int)
+                  else p.result()["text"] for p in parts]
+        self.audio_analyzer.set_answer_transcript(state, " ".join(t for t in texts if t))
+        print(f"[RealTimeMonitor] Answer transcribed: {len(results)} segment(s), "
+              f"{sum(r['inference_ms'] for r in results):.0f} ms Whisper")
+
     # ─────────────────────────── Per-answer snapshot ─────────────────────────
 
     def get_answer_snapshot(self) -> Dict[str, Any]:
@@ -159,8 +323,8 @@ class RealTimeMonitor:
               warnings_shown : list of all warnings shown during this answer
         """
         return {
-            "video":         self.video_analyzer.get_session_summary(),
-            "audio":         self.audio_analyzer.get_answer_snapshot(),
+            "video":         self.video_analyzer.get_answer_snapshot(self.video_state),
+            "audio":         self.audio_analyzer.get_answer_snapshot(self.audio_state),
             "warnings_shown":list(set(self._warnings_shown)),  # deduplicated
         }
 
@@ -170,12 +334,10 @@ class RealTimeMonitor:
         Session-wide accumulators in video and audio analyzers are kept.
         Issue counters are kept (they track session-wide patterns).
         """
-        self.audio_analyzer.reset_answer()
+        self.video_analyzer.reset_answer(self.video_state)
+        self.audio_analyzer.reset_answer(self.audio_state)
         self._warnings_shown = []
-        # Note: video_analyzer has no per-answer state separate from session,
-        # its get_session_summary() returns session-wide averages which is
-        # what we want for per-answer snapshot too (rolling average up to
-        # this point in the session)
+        self._cancel_segment_jobs()
 
     # ─────────────────────────── Session summary ─────────────────────────────
 
@@ -188,8 +350,8 @@ class RealTimeMonitor:
             Dict with video_summary, audio_summary, issue_history
         """
         return {
-            "video_summary": self.video_analyzer.get_session_summary(),
-            "audio_summary": self.audio_analyzer.get_session_statistics(),
+            "video_summary": self.video_analyzer.get_session_summary(self.video_state),
+            "audio_summary": self.audio_analyzer.get_session_statistics(self.audio_state),
             "issue_history": dict(self.issue_counters),
         }
 
@@ -345,8 +507,16 @@ class RealTimeMonitor:
         Full reset — call at start of a new session.
         Resets both analyzers, issue counters, and intervention state.
         """
-        self.video_analyzer.reset()
-        self.audio_analyzer.reset()          # resets session-wide + per-answer
+        self.video_analyzer.reset(self.video_state)
+        self.audio_analyzer.reset(self.audio_state)   # resets session-wide + per-answer
         self.issue_counters          = {k: 0 for k in self.issue_counters}
         self.last_intervention_time  = None
-        self._warnings_shown         = []
\ No newline at end of file
+        self._warnings_shown         = []
+        self._cancel_segment_jobs()
+
+    def _cancel_segment_jobs(self):
+        for part in self._answer_parts:
+            if isinstance(part, asyncio.Task):
+                part.cancel()
+        self._answer_parts = []
+        self._browser_text = ""
@@ -0,0 +1,160 @@
+"""
+surrogate_scorer.py — Local model of the LLM's answer score
+============================================================
+Every stored InterviewResponse holds the pre-score components and the
+final llm_score. training/train_surrogate.py fits a ridge regression
+from one to the other, offline, and saves it as a versioned JSON
+artifact. SurrogateScorer loads it and predicts with one dot product
+over ~10 features — a few microseconds, no numpy on the request path.
+
+Features (FEATURES, then one indicator per question type seen in
+training; other types fall back to the intercept):
+  - the six PreScore components, scaled to 0-1
+  - log(1 + word count)
+
+The prediction is a calibrated estimate of what the LLM would have given.
+llm_service.py uses it as the anchor for the ±15 clamp, as the centre
+of the evaluation tier's confidence band, and as the score of the local
+tiers and of _fallback_evaluation() when Groq is down or rate-limited.
+With no artifact at settings.surrogate_model_path, all of these stay on
+composite_pre_score.
+
+Artifact (format_version 1):
+  {"format": "surrogate_scorer", "format_version": 1,
+   "model_version": "20261017-093000", "model": "ridge", "alpha": 1.0,
+   "features": [...], "question_types": [...],
+   "mean": [...], "scale": [...], "coef": [...], "intercept": 61.2,
+   "trained_at": "...", "n_train": N, "n_test": N, "metrics": {...}}
+
+Used by:
+  - llm_service.py             : clamp anchor, tier band, local + fallback score
+  - training/train_surrogate.py: featurize(), fit_ridge(), agreement()
+"""
+
+import json
+import math
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+# Pre-score components, in PreScore order
+COMPONENTS = [
+    "word_count_score",
+    "filler_word_score",
+    "star_keyword_score",
+    "specificity_score",
+    "relevance_score",
+    "sentence_clarity_score",
+]
+FEATURES = COMPONENTS + ["log_word_count"]
+
+
+# ─────────────────────────── Features ────────────────────────────────────────
+
+def featurize(
+    pre_score:      Dict[str, Any],
+    question_type:  str,
+    question_types: Sequence[str],
+    word_count:     Optional[int] = None,
+) -> List[float]:
+    """Feature row for one answer (FEATURES + question type indicators)."""
+    if word_count is None:
+        word_count = pre_score.get("word_count_used", 0)
+    row = [pre_score.get(name, 0.0) / 100.0 for name in COMPONENTS]
+    row.append(math.log1p(max(0, word_count)))
+    row.extend(1.0 if question_type == t else 0.0 for t in question_types)
+    return row
+
+
+# ─────────────────────────── Training ────────────────────────────────────────
+
+def fit_ridge(X: np.ndarray, y: np.ndarray, alpha: float) -> Dict[str, Any]:
+    """
+    Ridge regression on standardised features; the intercept is not
+    penalised. Returns the artifact's model fields.
+    """
+    mean  = X.mean(axis=0)
+    scale = X.std(axis=0)
+    scale[scale == 0] = 1.0
+    Z     = (X - mean) / scale
+    y_c   = y - y.mean()
+    coef  = np.linalg.solve(Z.T @ Z + alpha * np.eye(Z.shape[1]), Z.T @ y_c)
+    return {
+        "mean":      mean.tolist(),
+        "scale":     scale.tolist(),
+        "coef":      coef.tolist(),
+        "intercept": float(y.mean()),
+    }
+
+
+def agreement(predicted: np.ndarray, llm: np.ndarray) -> Dict[str, float]:
+    """How closely predictions track the LLM's scores."""
+    err = predicted - llm
+    r   = float(np.corrcoef(predicted, llm)[0, 1]) \
+          if len(llm) > 1 and predicted.std() > 0 and llm.std() > 0 else 0.0
+    return {
+        "mae":          round(float(np.abs(err).mean()), 2),
+        "rmse":         round(float(np.sqrt((err ** 2).mean())), 2),
+        "bias":         round(float(err.mean()), 2),
+        "pearson_r":    round(r, 3),
+        "within_5":     round(float((np.abs(err) <= 5).mean() * 100), 1),
+        "within_10":    round(float((np.abs(err) <= 10).mean() * 100), 1),
+        "within_15":    round(float((np.abs(err) <= 15).mean() * 100), 1),
+    }
+
+
+# ─────────────────────────── Serving ─────────────────────────────────────────
+
+class SurrogateScorer:
+    """Predicts the LLM's overall_score from a pre-score (pure Python)."""
+
+    def __init__(self, artifact: Dict[str, Any]):
+        if artifact.get("format") != "surrogate_scorer" \
+                or artifact.get("format_version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported surrogate artifact "
+                f"({artifact.get('format')} v{artifact.get('format_version')})")
+        if artifact.get("features") != FEATURES:
+            raise ValueError("Surrogate artifact was trained on different features")
+
+        self.model_version  = artifact["model_version"]
+        self.question_types = list(artifact["question_types"])
+        self.metrics        = artifact.get("metrics", {})
+
+        # Fold the standardisation into the weights: one dot product per call
+        self._weights = [c / s for c, s in zip(artifact["coef"], artifact["scale"])]
+        self._bias    = artifact["intercept"] - sum(
+            w * m for w, m in zip(self._weights, artifact["mean"]))
+
+    @classmethod
+    def load(cls, path: str) -> "SurrogateScorer":
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def predict(
+        self,
+        pre_score:     Dict[str, Any],
+        question_type: str = "behavioral",
+        word_count:    Optional[int] = None,
+    ) -> float:
+        """Estimated LLM score, 0-100 (word_count defaults to word_count_used)."""
+        row   = featurize(pre_score, question_type, self.question_types, word_count)
+        score = self._bias + sum(w * x for w, x in zip(self._weights, row))
+        return round(max(0.0, min(100.0, score)), 1)
+
+
+def load_surrogate_scorer(path: Optional[str]) -> Optional[SurrogateScorer]:
+    """The configured scorer, or None (anchor stays on composite_pre_score)."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        scorer = SurrogateScorer.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠  Surrogate scorer not loaded ({path}): {e}")
+        return None
+    print(f"✓ Surrogate scorer {scorer.model_version} loaded "
+          f"(held-out MAE {scorer.metrics.get('surrogate', {}).get('mae', '?')})")
+    return scorer
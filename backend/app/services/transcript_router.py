@@ -0,0 +1,109 @@
+"""
+transcript_router.py
+====================
+Per-session choice of transcript source for each audio chunk, driven by
+settings that used to be declared but never read:
+
+  - speech_recognition_mode
+      "browser" : use the browser's Web Speech transcript, never Whisper
+      "whisper" : always Whisper; browser transcripts are ignored
+      "hybrid"  : the browser transcript when it is present and non-trivial,
+                  Whisper only for chunks the browser sent nothing for
+  - whisper_enabled          : off → behaves like "browser"
+  - max_audio_chunk_size_mb  : larger payloads are never sent to Whisper
+
+Chrome sends a transcript with almost every chunk, so in hybrid mode
+Whisper only runs for the minority of users without Web Speech.
+
+In the deferred transcription modes (settings.transcription_mode "answer" /
+"segment") the decision is still per chunk. Audio routed to Whisper is
+buffered; a browser-transcribed chunk closes the buffered span before it,
+and the answer transcript joins Whisper's text for those spans with the
+browser's text in between, in spoken order.
+
+Every decision is counted per source, together with the Whisper time it
+cost (wall and process CPU), so the load saved is visible per session.
+
+Used by:
+  - real_time_monitor.py : route() for every audio chunk
+  - routers/websocket.py : stats() in the status endpoint + AnalyticsModel
+"""
+
+import re
+from typing import Any, Dict, Optional
+
+from ..config import settings
+
+BROWSER  = "browser"
+WHISPER  = "whisper"
+NONE     = "none"
+
+# A browser transcript needs at least this many word characters to be used
+MIN_BROWSER_CHARS = 2
+_WORD_CHAR = re.compile(r"\w")
+
+
+class TranscriptRouter:
+    """
+    Transcript source decisions + accounting for ONE session.
+    """
+
+    def __init__(
+        self,
+        mode:              Optional[str] = None,
+        whisper_available: bool = True,
+    ):
+        self.mode = mode or settings.speech_recognition_mode
+        self.whisper_allowed = whisper_available and settings.whisper_enabled
+        if self.mode == WHISPER and not self.whisper_allowed:
+            print("⚠ speech_recognition_mode=whisper but Whisper is unavailable "
+                  "— using browser transcripts")
+        self.max_whisper_bytes = int(settings.max_audio_chunk_size_mb * 1024 * 1024)
+
+        self.chunks      = {BROWSER: 0, WHISPER: 0, NONE: 0}
+        self.oversize    = 0
+        self.whisper_calls  = 0
+        self.whisper_ms     = 0.0
+        self.whisper_cpu_ms = 0.0
+
+    def route(self, browser_transcript: Optional[str], payload_bytes: int) -> str:
+        """
+        Source for one chunk: BROWSER, WHISPER or NONE (no transcript).
+        """
+        browser_ok = self._is_usable(browser_transcript)
+
+        if self.mode == WHISPER and self.whisper_allowed:
+            source = WHISPER
+        elif browser_ok:
+            source = BROWSER
+        elif self.mode == "browser" or not self.whisper_allowed:
+            source = NONE
+        else:
+            source = WHISPER
+
+        if source == WHISPER and payload_bytes > self.max_whisper_bytes:
+            self.oversize += 1
+            source = BROWSER if browser_ok else NONE
+
+        self.chunks[source] += 1
+        return source
+
+    def record_whisper(self, timing: Dict[str, Any]):
+        """Account one Whisper call (a TranscriptionService result)."""
+        self.whisper_calls  += 1
+        self.whisper_ms     += timing.get("inference_ms", 0.0)
+        self.whisper_cpu_ms += timing.get("cpu_ms", 0.0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode":                self.mode,
+            "chunks_by_source":    dict(self.chunks),
+            "oversize_chunks":     self.oversize,
+            "whisper_calls":       self.whisper_calls,
+            "whisper_total_ms":    round(self.whisper_ms, 1),
+            "whisper_cpu_ms":      round(self.whisper_cpu_ms, 1),
+        }
+
+    @staticmethod
+    def _is_usable(transcript: Optional[str]) -> bool:
+        return bool(transcript) and len(_WORD_CHAR.findall(transcript)) >= MIN_BROWSER_CHARS
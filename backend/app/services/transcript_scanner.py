@@ -0,0 +1,198 @@
+"""
+transcript_scanner.py
+=====================
+One-pass, word-boundary scanner shared by everything that reads a transcript.
+
+Before this module each consumer scanned the same answer on its own:
+  - AudioAnalyzer: one transcript.count() per filler phrase (12 full scans,
+    and substring hits — "like" in "likely", "right" in "copyright"),
+  - AnswerScorer:  a token regex for the word count, then one substring scan
+    per STAR keyword (~75) and another tokenisation for relevance,
+  - websocket.py:  str.split() again for the off-topic check (so "team," and
+    "team" were different words).
+
+Now the text is tokenised ONCE (\\w+ words, plus "%" for the STAR result
+list) and walked through a trie keyed on tokens that holds every filler and
+STAR phrase, so all phrases are matched at word boundaries in a single
+pass. STAR phrases still accept an inflected last word ("results",
+"impacted", "challenges"), as the old substring match did; fillers must
+match exactly.
+
+scan_transcript() caches results per text, so the websocket off-topic check
+and AnswerScorer share one scan of the submitted answer.
+
+Used by:
+  - audio_analyzer.py     : word count + filler breakdown per chunk / answer
+  - answer_scorer.py      : word count, STAR components, relevance keywords
+  - routers/websocket.py  : off-topic keyword overlap
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+# ─────────────────────────── Phrase lists ────────────────────────────────────
+
+FILLER_WORDS = (
+    "um", "uh", "like", "you know", "basically", "actually",
+    "sort of", "kind of", "i mean", "you see", "right", "okay",
+)
+
+# Grouped by STAR component — detecting these shows structured thinking
+STAR_KEYWORDS = {
+    "situation": [
+        "situation", "context", "background", "at the time", "when i was",
+        "i was working", "we were", "the project", "the team", "the company",
+        "in my previous", "at my last", "during my", "while i was",
+    ],
+    "task": [
+        "task", "responsibility", "my role", "i was responsible", "i needed to",
+        "i had to", "my goal", "the objective", "i was asked", "i was assigned",
+        "challenge", "problem to solve", "requirement",
+    ],
+    "action": [
+        "i did", "i decided", "i took", "i implemented", "i developed",
+        "i created", "i led", "i managed", "i worked with", "i collaborated",
+        "i reached out", "i built", "i designed", "i analysed", "i analyzed",
+        "my approach", "i first", "i then", "i started", "i resolved",
+        "i communicated", "i presented", "i proposed", "specifically i",
+    ],
+    "result": [
+        "result", "outcome", "impact", "achieved", "increased", "decreased",
+        "reduced", "improved", "saved", "delivered", "completed", "successfully",
+        "as a result", "which led to", "this resulted in", "we saw",
+        "the team", "the project", "percent", "%", "by the end",
+        "feedback was", "it was successful",
+    ],
+}
+
+# Words that carry no topic — AnswerScorer relevance
+STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "is", "was", "are", "were", "be", "been",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "can", "your", "you", "me", "my", "we",
+    "our", "us", "i", "it", "its", "this", "that", "these", "those",
+    "what", "how", "why", "when", "where", "who", "which", "tell", "describe",
+    "give", "example", "time", "situation", "please",
+})
+
+# The shorter list the websocket off-topic check has always used
+COMMON_WORDS = frozenset({
+    "a", "the", "is", "are", "an", "and", "or", "but", "in", "at", "to",
+    "for", "of", "with", "by",
+})
+
+_TOKEN = re.compile(r"\w+|%")
+
+# Inflections a STAR phrase's last word may carry, longest first
+_SUFFIXES = ("ing", "es", "ed", "s", "d")
+
+_FILLER = "filler"
+_STAR   = "star"
+
+
+class TranscriptScan:
+    """Everything the consumers need from ONE transcript."""
+
+    __slots__ = ("word_count", "vocabulary", "fillers", "star_components")
+
+    def __init__(
+        self,
+        word_count:      int,
+        vocabulary:      FrozenSet[str],
+        fillers:         Tuple[Tuple[str, int], ...],
+        star_components: Tuple[str, ...],
+    ):
+        self.word_count      = word_count
+        self.vocabulary      = vocabulary        # distinct lower-case words
+        self.fillers         = fillers           # ((phrase, count), ...) in FILLER_WORDS order
+        self.star_components = star_components   # in STAR order
+
+    @property
+    def filler_count(self) -> int:
+        return sum(count for _, count in self.fillers)
+
+    def filler_breakdown(self) -> List[Dict[str, int]]:
+        """[{"word", "count"}] — the shape AudioAnalyzer has always reported."""
+        return [{"word": word, "count": count} for word, count in self.fillers]
+
+    def keywords(self, stopwords: FrozenSet[str] = STOPWORDS) -> FrozenSet[str]:
+        return self.vocabulary - stopwords
+
+
+class TranscriptScanner:
+    """
+    Token trie over filler + STAR phrases. Each terminal records
+    (kind, label, phrase, inflectable).
+    """
+
+    def __init__(
+        self,
+        fillers:       Iterable[str] = FILLER_WORDS,
+        star_keywords: Dict[str, List[str]] = STAR_KEYWORDS,
+    ):
+        self.fillers    = tuple(fillers)
+        self.components = tuple(star_keywords)
+        self._root: Dict = {}
+        self.max_phrase = 0
+
+        for phrase in self.fillers:
+            self._add(phrase, (_FILLER, phrase, False))
+        for component, phrases in star_keywords.items():
+            for phrase in phrases:
+                self._add(phrase, (_STAR, component, True))
+
+    def _add(self, phrase: str, terminal: Tuple[str, str, bool]):
+        tokens = _TOKEN.findall(phrase.lower())
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node.setdefault(None, []).append(terminal)
+        self.max_phrase = max(self.max_phrase, len(tokens))
+
+    def scan(self, text: str) -> TranscriptScan:
+        tokens = _TOKEN.findall(text.lower()) if text else []
+        root   = self._root
+
+        filler_counts: Dict[str, int] = {}
+        star_found = set()
+
+        for i in range(len(tokens)):
+            node = root
+            for token in tokens[i:i + self.max_phrase]:
+                # A STAR phrase may end on an inflected form of its last word
+                for suffix in _SUFFIXES:
+                    if token.endswith(suffix) and len(token) > len(suffix) + 2:
+                        stem = node.get(token[:-len(suffix)])
+                        if stem is not None:
+                            for kind, label, inflectable in stem.get(None, ()):
+                                if inflectable:
+                                    star_found.add(label)
+                            break
+
+                node = node.get(token)
+                if node is None:
+                    break
+                for kind, label, _ in node.get(None, ()):
+                    if kind == _FILLER:
+                        filler_counts[label] = filler_counts.get(label, 0) + 1
+                    else:
+                        star_found.add(label)
+
+        words = [t for t in tokens if t != "%"]
+        return TranscriptScan(
+            word_count=len(words),
+            vocabulary=frozenset(words),
+            fillers=tuple((f, filler_counts[f]) for f in self.fillers if f in filler_counts),
+            star_components=tuple(c for c in self.components if c in star_found),
+        )
+
+
+_DEFAULT_SCANNER = TranscriptScanner()
+
+
+@lru_cache(maxsize=256)
+def scan_transcript(text: str) -> TranscriptScan:
+    """Scan with the default phrase lists; cached per text."""
+    return _DEFAULT_SCANNER.scan(text)
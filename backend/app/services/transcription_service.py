@@ -0,0 +1,188 @@
+"""
+transcription_service.py
+========================
+Process-wide Whisper transcription behind an async request queue.
+
+Before this module every AudioAnalyzer loaded whisper.load_model("tiny")
+(ignoring settings.whisper_model_size) and transcribed synchronously on the
+shared analysis pool, serialised by a lock — a queue of sessions waiting
+on one model while holding analysis worker threads.
+
+Now:
+  - the configured model (settings.whisper_model_size) is loaded ONCE per
+    replica, settings.transcription_concurrency replicas per process,
+  - sessions `await transcribe(audio, sr)`; the request goes on an asyncio
+    queue and one worker coroutine per replica feeds it to its own model on
+    a dedicated "whisper" thread pool — so at most N transcriptions use the
+    CPU / GPU at once, and analysis workers never block on Whisper,
+  - every request reports its queue wait and inference time; both are also
+    kept as process-wide latency histograms (get_timings()).
+
+The queue itself is not capped; each session bounds what it puts in.
+Per-chunk requests are awaited by the session's one audio analysis in
+flight (MediaIngest); deferred segment jobs run in the background, at most
+settings.transcription_session_jobs per session (RealTimeMonitor waits
+for one to finish before starting another). So the queue holds at most
+max(1, transcription_session_jobs) requests per live session.
+
+Used by:
+  - inference_engine.py   : ONE instance per process
+  - real_time_monitor.py  : awaits transcribe() for each audio chunk
+  - routers/websocket.py  : /ws/timings
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import librosa
+import numpy as np
+
+from ..config import settings
+from ..utils.timing import StageTimings
+
+# ─────────────────────────── Whisper ─────────────────────────────────────────
+WHISPER_AVAILABLE = False
+whisper = None
+try:
+    import whisper
+    WHISPER_AVAILABLE = True
+    print("✓ Whisper module imported")
+except ImportError:
+    print("⚠ Whisper not available — transcription disabled")
+
+WHISPER_SR = 16000
+
+
+class TranscriptionService:
+    """
+    Shared Whisper model(s) + async request queue for all sessions.
+    """
+
+    def __init__(
+        self,
+        model_size:  Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.model_size  = model_size or settings.whisper_model_size
+        self.concurrency = max(1, concurrency or settings.transcription_concurrency)
+        self.device      = "cpu"
+        self.models: List[Any] = []
+
+        if WHISPER_AVAILABLE and settings.whisper_enabled:
+            try:
+                import torch
+                if settings.enable_gpu and torch.cuda.is_available():
+                    self.device = "cuda"
+                print(f"Loading Whisper model ({self.model_size}, "
+                      f"{self.concurrency}x on {self.device})...")
+                self.models = [whisper.load_model(self.model_size, device=self.device)
+                               for _ in range(self.concurrency)]
+                print("✓ Whisper model loaded")
+            except Exception as e:
+                print(f"⚠ Whisper load failed: {e}")
+                self.models = []
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.models)),
+            thread_name_prefix="whisper",
+        )
+        self._queue:   Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+        self.timings   = StageTimings()
+        self.completed = 0
+        self.failed    = 0
+
+    @property
+    def available(self) -> bool:
+        return bool(self.models)
+
+    # ─────────────────────────── Public API ──────────────────────────────────
+
+    async def transcribe(self, audio: np.ndarray, sr: int) -> Dict[str, Any]:
+        """
+        Queue mono float audio for transcription and wait for the result.
+
+        Returns:
+            {"text": str, "queue_wait_ms": float, "inference_ms": float,
+             "cpu_ms": float}
+        """
+        if not self.available:
+            return {"text": "", "queue_wait_ms": 0.0, "inference_ms": 0.0, "cpu_ms": 0.0}
+
+        self._ensure_workers()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((audio, sr, future, time.perf_counter()))
+        return await future
+
+    def get_timings(self) -> Dict[str, Any]:
+        return {
+            "model":       self.model_size if self.available else None,
+            "device":      self.device,
+            "concurrency": len(self.models),
+            "queued":      self._queue.qsize() if self._queue is not None else 0,
+            "completed":   self.completed,
+            "failed":      self.failed,
+            "stages":      self.timings.snapshot(),
+        }
+
+    def close(self):
+        """Cancel the queue workers and stop the Whisper pool."""
+        for task in self._workers:
+            task.cancel()
+        self._workers = []
+        self._queue   = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ─────────────────────────── Workers ─────────────────────────────────────
+
+    def _ensure_workers(self):
+        # Created lazily so the queue and tasks belong to the serving loop
+        if self._queue is None:
+            self._queue   = asyncio.Queue()
+            self._workers = [asyncio.create_task(self._worker(model))
+                             for model in self.models]
+
+    async def _worker(self, model):
+        loop = asyncio.get_running_loop()
+        while True:
+            audio, sr, future, queued_at = await self._queue.get()
+            if future.done():                   # caller went away meanwhile
+                continue
+
+            started = time.perf_counter()
+            cpu_ms  = 0.0
+            try:
+                text, cpu_ms = await loop.run_in_executor(
+                    self._executor, self._run_model, model, audio, sr)
+                self.completed += 1
+            except Exception as e:
+                print(f"[Transcription] Whisper error: {e}")
+                text = ""
+                self.failed += 1
+            finished = time.perf_counter()
+
+            wait_ms  = (started - queued_at) * 1000.0
+            infer_ms = (finished - started) * 1000.0
+            self.timings.record_frame({"queue_wait": wait_ms, "inference": infer_ms})
+            if not future.done():
+                future.set_result({
+                    "text":          text,
+                    "queue_wait_ms": round(wait_ms, 2),
+                    "inference_ms":  round(infer_ms, 2),
+                    "cpu_ms":        round(cpu_ms, 2),
+                })
+
+    def _run_model(self, model, audio: np.ndarray, sr: int):
+        """(text, process CPU ms) — the CPU figure includes torch's intra-op
+        threads, and any other work the process did meanwhile."""
+        cpu_start = time.process_time()
+        # Whisper takes 16 kHz mono float32 directly — works for raw PCM
+        # frames as well as decoded containers
+        if sr != WHISPER_SR:
+            audio = librosa.resample(audio, orig_sr=sr, target_sr=WHISPER_SR)
+        result = model.transcribe(
+            audio.astype(np.float32), language="en", fp16=self.device == "cuda")
+        return result["text"].strip(), (time.process_time() - cpu_start) * 1000.0
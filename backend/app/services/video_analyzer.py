@@ -9,7 +9,8 @@ Model stack:
                                   Trained on AffectNet (450k images, 8 classes, ~75% accuracy)
                                   Runs via ONNX Runtime — no TF/Keras version conflict
 
-Input  : base64-encoded JPEG frame string (from WebSocket video_frame messages)
+Input  : base64-encoded JPEG frame string (from JSON video_frame messages)
+         or raw JPEG bytes (from binary media frames, see utils/media_protocol.py)
 Output : Dict with all metrics, warnings, issues — compatible with:
            • real_time_monitor.py  (per-frame warnings → WebSocket interventions)
            • feedback_generator.py (session summary → final feedback report)
@@ -26,8 +27,15 @@ import cv2
 import mediapipe as mp
 import numpy as np
 import base64
-from typing import Dict, Any, List, Optional
+import math
+import time
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
+from itertools import chain
+from collections import deque
+
+from ..utils.stats import RunningStats
+from ..utils.timing import StageTimings, lap, pipeline_timings
 
 # ─────────────────────────── HSEmotion (ONNX) ────────────────────────────────
 # EfficientNet-B2 trained on AffectNet — 8-class emotion recognition
@@ -60,8 +68,190 @@ HEAD_VERT_UP_THRESH   = 0.59   # v_off < -this  → looking_up
 # Eye Aspect Ratio threshold — below this = eyes closed
 EAR_CLOSED_THRESH = 0.15
 
-# Emotion analysis frame interval (every Nth processed frame)
-EMOTION_FRAME_INTERVAL = 1
+# Adaptive emotion cadence — HSEmotion only reruns when the expression
+# landmarks (mouth / eyebrows / eyes) have moved since the last inference,
+# or when the last result is too old. Deltas are normalised by face width.
+EMOTION_LANDMARK_DELTA_THRESH = 0.025  # max per-feature change → rerun
+EMOTION_MAX_STALE_SECONDS     = 1.5    # rerun at least this often
+EMOTION_SMOOTHING_ALPHA       = 0.6    # weight of a new inference vs last_emo
+
+# Face-ROI tracking — after a detection, the next frame is cropped to the
+# previous face box grown by this fraction of its size on every side
+FACE_ROI_EXPAND   = 0.6
+FACE_ROI_MIN_SIDE = 96     # px — smaller boxes fall back to full frame
+
+
+# ─────────────────────────── Landmark layout ─────────────────────────────────
+# MediaPipe FaceMesh indices gathered into one (N, 3) float32 array per frame
+# (x_px, y_px, z). Row order is fixed; geometry below indexes rows by name.
+# The face box (ROI and emotion crop) spans ALL of these points — including
+# the lip and brow points the expression descriptor added, so it reaches
+# up to the eyebrows.
+LANDMARK_INDICES = {
+    "left_eye_left":   33,  "left_eye_right":   133,
+    "left_eye_top":    159, "left_eye_bottom":  145,
+    "right_eye_left":  362, "right_eye_right":  263,
+    "right_eye_top":   386, "right_eye_bottom": 374,
+    "nose_tip":        1,   "nose_bridge":      6,
+    "mouth_left":      61,  "mouth_right":      291,
+    "chin":            152,
+    "left_face":       234, "right_face":       454,
+    "upper_lip":       13,  "lower_lip":        14,
+    "left_brow":       105, "right_brow":       334,
+}
+LM = {name: row for row, name in enumerate(LANDMARK_INDICES)}
+_MESH_ROWS = tuple(LANDMARK_INDICES.values())
+
+# Every landmark pair the per-frame geometry needs, as (name, a, b): one
+# gather lm[A] - lm[B] yields all (dx, dy, dz) at once
+_GEOMETRY_PAIRS = [
+    ("left_eye_v",   "left_eye_top",    "left_eye_bottom"),
+    ("right_eye_v",  "right_eye_top",   "right_eye_bottom"),
+    ("left_eye_h",   "left_eye_left",   "left_eye_right"),
+    ("right_eye_h",  "right_eye_left",  "right_eye_right"),
+    ("face",         "right_face",      "left_face"),
+    ("nose_left",    "nose_tip",        "left_face"),
+    ("nose_chin",    "nose_tip",        "chin"),
+    ("mouth",        "mouth_right",     "mouth_left"),
+    ("lips",         "lower_lip",       "upper_lip"),
+    ("left_brow",    "left_eye_top",    "left_brow"),
+    ("right_brow",   "right_eye_top",   "right_brow"),
+]
+_GEO_NAMES = tuple(name for name, _, _ in _GEOMETRY_PAIRS)
+_GEO_A = np.array([LM[a] for _, a, _ in _GEOMETRY_PAIRS], dtype=np.intp)
+_GEO_B = np.array([LM[b] for _, _, b in _GEOMETRY_PAIRS], dtype=np.intp)
+_NOSE  = LM["nose_tip"]
+
+
+# Recent smoothed emotions kept for nervousness detection
+EMOTION_HISTORY_SIZE = 30
+
+HEAD_POSITIONS = ["neutral", "looking_down", "looking_up",
+                  "turned_left", "turned_right"]
+
+
+# ─────────────────────────── Streaming accumulators ──────────────────────────
+
+class VideoStats:
+    """
+    O(1)-memory aggregates over a run of analysed face frames. Each session
+    keeps two: one for the whole session (get_session_summary) and one for
+    the current answer (get_answer_snapshot), replaced at every answer
+    boundary — neither keeps or rescans per-frame samples.
+    """
+
+    __slots__ = ("eye_contact", "engagement", "head_position_counts",
+                 "emotion_counts", "nervousness_hits", "nervousness_indicators",
+                 "issue_counts", "eye_closed_count")
+
+    def __init__(self):
+        self.eye_contact          = RunningStats()
+        self.engagement           = RunningStats()
+        self.head_position_counts: Dict[str, int] = {p: 0 for p in HEAD_POSITIONS}
+        self.emotion_counts:       Dict[str, int] = {e: 0 for e in EMOTION_LABELS}
+        self.nervousness_hits      = 0
+        self.nervousness_indicators: set = set()
+        self.issue_counts:         Dict[str, int] = {}
+        self.eye_closed_count      = 0
+
+    @property
+    def frames(self) -> int:
+        return self.eye_contact.count
+
+    def add_frame(self, analysis: Dict[str, Any], emotion: Optional[str]):
+        """Fold one face frame in; emotion=None until HSEmotion has run once."""
+        self.eye_contact.add(analysis["eye_contact_score"])
+        self.engagement.add(analysis["engagement_score"])
+        pos = analysis["head_position"]
+        if pos in self.head_position_counts:
+            self.head_position_counts[pos] += 1
+        if emotion in self.emotion_counts:
+            self.emotion_counts[emotion] += 1
+        if analysis["nervousness_indicators"]:
+            self.nervousness_hits += 1
+            self.nervousness_indicators.update(analysis["nervousness_indicators"])
+        if analysis["gaze_direction"] == "closed":
+            self.eye_closed_count += 1
+        for issue in analysis["issues"]:
+            self.issue_counts[issue] = self.issue_counts.get(issue, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        total = max(self.eye_contact.count, 1)
+
+        # Most frequent emotion across the window
+        dominant_emo = max(self.emotion_counts, key=self.emotion_counts.get) \
+                       if any(self.emotion_counts.values()) else "neutral"
+
+        return {
+            "eye_contact_score":       round(self.eye_contact.mean, 2),
+            "engagement_score":        round(self.engagement.mean, 2),
+            "dominant_emotion":        dominant_emo,
+            "emotion_breakdown":       dict(self.emotion_counts),
+            "nervousness_rate":        round(self.nervousness_hits / total * 100, 1),
+            "head_position_breakdown": dict(self.head_position_counts),
+            "issue_counts":            dict(self.issue_counts),
+        }
+
+
+# ─────────────────────────── Per-session state ───────────────────────────────
+class VideoSessionState:
+    """
+    Everything VideoAnalyzer tracks for ONE interview session.
+
+    The analyzer itself (MediaPipe graphs, emotion model, thresholds) is
+    shared process-wide via InferenceEngine — each session only owns this
+    small object, which the analyzer reads and updates on every frame.
+    """
+
+    def __init__(self):
+        # This session's MediaPipe FaceMesh graph, created lazily by
+        # VideoAnalyzer. It runs in tracking mode (landmarks carried from
+        # frame to frame), so it only ever sees this session's frames —
+        # MediaIngest keeps at most one of them in flight at a time.
+        self.face_mesh = None
+        self.reset()
+
+    def reset(self):
+        """Reset state for a new session."""
+        self.previous_landmarks  = None
+        self.frame_count         = 0      # processed frames (after skip)
+        self.skip_counter        = 0
+
+        # Consecutive-frame counters per issue (warning debounce)
+        self._consecutive_issues: Dict[str, int] = {}
+
+        # Recent emotions (bounded — only the nervousness window reads it)
+        self.emotion_history: deque = deque(maxlen=EMOTION_HISTORY_SIZE)
+        self.last_emo: Dict = {
+            "dominant_emotion":   "neutral",
+            "emotion_confidence": 0.0,
+            "emotions":           {e: 0.0 for e in EMOTION_LABELS},
+        }
+
+        # Adaptive emotion cadence
+        self.last_expression:     Optional[np.ndarray] = None
+        self.last_emotion_time:   float = 0.0
+        self.emotion_inferences:  int   = 0
+        self.emotion_skipped:     int   = 0
+
+        # Per-session accumulators for feedback_generator
+        self.session_stats = VideoStats()
+
+        # Per-answer window — swapped for a fresh one by reset_answer()
+        self.answer_stats  = VideoStats()
+        self._answer_emotion_base = (0, 0)   # (inferences, skipped) at answer start
+
+        # Keep last result for frame-skip returns
+        self._last_analysis: Optional[Dict] = None
+
+        # Face-ROI tracking: (x1, y1, x2, y2) in full-frame px, None = search
+        self.face_roi:      Optional[tuple] = None
+        self.roi_frames:    int = 0    # frames analysed on the tracked crop
+        self.full_frames:   int = 0    # frames that needed full-frame search
+
+        # Per-stage latency (ms) — histograms + the last analysed frame
+        self.timings      = StageTimings()
+        self.last_timings: Dict[str, float] = {}
 
 
 # ─────────────────────────── VideoAnalyzer ───────────────────────────────────
@@ -84,29 +274,24 @@ class VideoAnalyzer:
       - Real-time issues list
       - Real-time warnings list (shown on frontend camera overlay)
 
-    All results are stored per-frame and accumulated for session summary,
-    which is consumed by feedback_generator.py at session end.
+    One instance is shared by every session (see inference_engine.py).
+    Per-frame results are accumulated into the caller's VideoSessionState
+    for the session summary consumed by feedback_generator.py.
     """
 
-    def __init__(self):
-        # MediaPipe FaceMesh
+    def __init__(self, roi_tracking: bool = True, mesh_input_size: int = 320):
+        # MediaPipe FaceMesh — one tracking-mode graph per session, held in
+        # VideoSessionState (graphs are not thread-safe, and tracking must
+        # follow a single face)
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh    = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5,
-        )
-
-        # State tracking
-        self.previous_landmarks  = None
-        self.frame_count         = 0      # processed frames (after skip)
-        self.skip_counter        = 0
+
         self.frame_skip_rate     = 2      # process every 2nd frame
-        
-        # In __init__, add:
-        self._consecutive_issues: Dict[str, int] = {}
-        # ADD:
+
+        # Crop to the tracked face box, and shrink MediaPipe input so its
+        # longest side is at most mesh_input_size px (0 = never downscale)
+        self.roi_tracking        = roi_tracking
+        self.mesh_input_size     = mesh_input_size
+
         self._warning_thresholds = {
             "looking_down":       2,   # fast — 2 frames
             "looking_up":         2,   # fast
@@ -122,40 +307,39 @@ class VideoAnalyzer:
             "showing_nervousness":6,
         }
 
-        # Emotion history (kept for nervousness detection + session summary)
-        self.emotion_history: List[Dict] = []
-        self.max_emotion_history = 30
-        self.last_emo: Dict = {
-            "dominant_emotion":   "neutral",
-            "emotion_confidence": 0.0,
-            "emotions":           {e: 0.0 for e in EMOTION_LABELS},
-        }
-
-        # Per-session accumulators for feedback_generator
-        self._eye_contact_samples:  List[float] = []
-        self._engagement_samples:   List[float] = []
-        self._head_position_counts: Dict[str, int] = {
-            "neutral": 0, "looking_down": 0, "looking_up": 0,
-            "turned_left": 0, "turned_right": 0
-        }
-        self._emotion_counts:   Dict[str, int] = {e: 0 for e in EMOTION_LABELS}
-        self._nervousness_hits: int = 0
-        self._issue_counts:     Dict[str, int] = {}
-
-        # Keep last result for frame-skip returns
-        self._last_analysis: Optional[Dict] = None
-
         self.deepface_available  = False   # kept for API compat — we use HSEmotion
         self.emotion_model_name  = "HSEmotion EfficientNet-B2 (AffectNet)"
+        self.emotion_model       = _emotion_model
+
+        # Optional cross-session EmotionBatcher (set by InferenceEngine).
+        # None → one predict_emotions() call per crop.
+        self.emotion_batcher     = None
+
+    def _face_mesh(self, state: VideoSessionState):
+        """The session's FaceMesh graph (created on its first frame)."""
+        if state.face_mesh is None:
+            state.face_mesh = self.mp_face_mesh.FaceMesh(
+                max_num_faces=1,
+                refine_landmarks=True,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5,
+            )
+        return state.face_mesh
 
     # ─────────────────────────── Public API ──────────────────────────────────
 
-    def analyze_frame(self, frame_data: str) -> Dict[str, Any]:
+    def analyze_frame(
+        self,
+        state:      VideoSessionState,
+        frame_data: Union[str, bytes, memoryview],
+    ) -> Dict[str, Any]:
         """
-        Analyze a single base64-encoded video frame.
+        Analyze a single video frame.
 
         Args:
+            state     : the calling session's VideoSessionState
             frame_data: Base64 string (with or without data:image/...;base64, prefix)
+                        or raw encoded image bytes from a binary media frame
 
         Returns:
             Dict with all metrics. Compatible with real_time_monitor.py and
@@ -163,84 +347,91 @@ class VideoAnalyzer:
             live frontend overlay.
         """
         # Frame skip for performance
-        self.skip_counter += 1
-        if self.skip_counter % self.frame_skip_rate != 0:
-            return self._last_analysis if self._last_analysis else self._empty_result()
+        state.skip_counter += 1
+        if state.skip_counter % self.frame_skip_rate != 0:
+            return state._last_analysis if state._last_analysis else self._empty_result()
+
+        timings: Dict[str, float] = {}
+        t_start = t = time.perf_counter()
 
         try:
-            # Decode base64 → OpenCV BGR frame
-            image = self._decode_frame(frame_data)
+            # Decode base64 / raw bytes → OpenCV BGR frame
+            image = self._decode_frame(frame_data, timings)
             if image is None:
                 return self._empty_result("Failed to decode frame")
 
             h, w = image.shape[:2]
-            rgb  = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
-            # MediaPipe inference
-            results = self.face_mesh.process(rgb)
+            # MediaPipe inference — tracked face crop first, full frame if lost
+            face_lm, region = self._detect_face(state, image, timings)
+            t = time.perf_counter()
 
             analysis = self._empty_result()
 
-            if results.multi_face_landmarks:
-                self.frame_count += 1
-                face_lm = results.multi_face_landmarks[0]
-                lm      = self._extract_landmarks(face_lm, image.shape)
+            if face_lm is not None:
+                state.frame_count += 1
+                lm      = self._extract_landmarks(face_lm, image.shape, region)
+                bbox    = self._face_bbox(lm)
+                if self.roi_tracking:
+                    state.face_roi = self._next_roi(bbox, w, h)
+
+                geo     = self._face_geometry(lm)
 
                 analysis["face_detected"] = True
 
                 # ── Eye contact + EAR ─────────────────────────────────────────
-                eye = self._analyze_eye_contact(lm)
+                eye = self._analyze_eye_contact(geo)
                 analysis["eye_contact_score"] = eye["score"]
                 analysis["gaze_direction"]    = eye["direction"]
                 analysis["eye_aspect_ratio"]  = eye["ear"]
 
                 # ── Head pose ─────────────────────────────────────────────────
-                pose = self._analyze_head_pose(lm)
+                pose = self._analyze_head_pose(geo)
                 analysis["head_position"]         = pose["position"]
                 analysis["head_tilt_angle"]       = pose["tilt_angle"]
                 analysis["head_horizontal_offset"]= pose["horizontal_offset"]
                 analysis["head_vertical_offset"]  = pose["vertical_offset"]
 
                 # ── Head movement ─────────────────────────────────────────────
-                if self.previous_landmarks:
-                    mv = self._detect_head_movement(lm, self.previous_landmarks)
+                if state.previous_landmarks is not None:
+                    mv = self._detect_head_movement(lm, state.previous_landmarks)
                     analysis["head_movement"]      = mv["type"]
                     analysis["movement_intensity"] = mv["intensity"]
                     analysis["movement_distance"]  = mv["distance"]
-
-                # ── Emotion (HSEmotion ONNX) ──────────────────────────────────
-                if EMOTION_AVAILABLE and self.frame_count % EMOTION_FRAME_INTERVAL == 0:
-                    # Get bounding box for face crop
-                    xs  = [lm[k][0] for k in lm]
-                    ys  = [lm[k][1] for k in lm]
-                    x1  = max(0, min(xs) - 15)
-                    y1  = max(0, min(ys) - 20)
-                    x2  = min(w, max(xs) + 15)
-                    y2  = min(h, max(ys) + 15)
-                    emo = self._analyze_emotions(image, x1, y1, x2, y2)
-                    if emo:
-                        self.last_emo = emo
-                        self.emotion_history.append(emo)
-                        if len(self.emotion_history) > self.max_emotion_history:
-                            self.emotion_history.pop(0)
-                        # Accumulate for session summary
-                        dom = emo["dominant_emotion"]
-                        if dom in self._emotion_counts:
-                            self._emotion_counts[dom] += 1
-
-                analysis["emotions"]           = self.last_emo["emotions"]
-                analysis["dominant_emotion"]   = self.last_emo["dominant_emotion"]
-                analysis["emotion_confidence"] = self.last_emo["emotion_confidence"]
+                t = lap(timings, "geometry", t)
+
+                # ── Emotion (HSEmotion ONNX, adaptive cadence) ────────────────
+                if EMOTION_AVAILABLE:
+                    expression = self._expression_descriptor(geo)
+                    if self._emotion_due(state, expression):
+                        # Face crop: the landmark box, padded
+                        fx1, fy1, fx2, fy2 = bbox
+                        x1  = max(0, fx1 - 15)
+                        y1  = max(0, fy1 - 20)
+                        x2  = min(w, fx2 + 15)
+                        y2  = min(h, fy2 + 15)
+                        emo = self._analyze_emotions(image, x1, y1, x2, y2)
+                        if emo:
+                            state.last_emo = self._smooth_emotion(state, emo)
+                            state.last_expression   = expression
+                            state.last_emotion_time = time.monotonic()
+                            state.emotion_inferences += 1
+                            state.emotion_history.append(state.last_emo)
+                    else:
+                        state.emotion_skipped += 1
+                    t = lap(timings, "emotion", t)
+
+                analysis["emotions"]           = state.last_emo["emotions"]
+                analysis["dominant_emotion"]   = state.last_emo["dominant_emotion"]
+                analysis["emotion_confidence"] = state.last_emo["emotion_confidence"]
 
                 # ── Nervousness ───────────────────────────────────────────────
                 nervousness = self._detect_nervousness(
                     analysis["dominant_emotion"],
                     analysis.get("movement_intensity", 0),
-                    self.emotion_history,
+                    state.emotion_history,
                 )
                 analysis["nervousness_indicators"] = nervousness
-                if nervousness:
-                    self._nervousness_hits += 1
 
                 # ── Engagement ────────────────────────────────────────────────
                 engagement = self._calculate_engagement(
@@ -252,27 +443,28 @@ class VideoAnalyzer:
                 analysis["engagement_score"] = engagement
 
                 # ── Issues + warnings (for frontend overlay + real_time_monitor)
-                issues, warnings = self._detect_issues(analysis)
+                issues, warnings = self._detect_issues(state, analysis)
                 analysis["issues"]   = issues
                 analysis["warnings"] = warnings
 
                 # ── Accumulate per-session stats ──────────────────────────────
-                self._eye_contact_samples.append(analysis["eye_contact_score"])
-                self._engagement_samples.append(analysis["engagement_score"])
-                pos = analysis["head_position"]
-                if pos in self._head_position_counts:
-                    self._head_position_counts[pos] += 1
-                for issue in issues:
-                    self._issue_counts[issue] = self._issue_counts.get(issue, 0) + 1
+                # Every face frame counts towards the emotion breakdown,
+                # whether its emotion was inferred or carried forward
+                emotion = (state.last_emo["dominant_emotion"]
+                           if state.emotion_inferences else None)
+                state.session_stats.add_frame(analysis, emotion)
+                state.answer_stats.add_frame(analysis, emotion)
+                t = lap(timings, "issues", t)
 
-                self.previous_landmarks = lm
+                state.previous_landmarks = lm
 
             else:
                 analysis["issues"].append("no_face_detected")
                 analysis["warnings"].append(
                     "Please ensure your face is visible in the camera")
 
-            self._last_analysis = analysis
+            state._last_analysis = analysis
+            self._record_timings(state, timings, t_start)
             return analysis
 
         except Exception as e:
@@ -281,7 +473,7 @@ class VideoAnalyzer:
             traceback.print_exc()
             return self._empty_result(f"Analysis error: {str(e)}")
 
-    def get_session_summary(self) -> Dict[str, Any]:
+    def get_session_summary(self, state: VideoSessionState) -> Dict[str, Any]:
         """
         Return aggregated metrics for the entire session.
         Called by real_time_monitor.get_session_summary() which feeds
@@ -292,109 +484,224 @@ class VideoAnalyzer:
           emotion_breakdown, nervousness_rate, head_position_breakdown,
           issue_counts, frames_analyzed
         """
-        total = max(len(self._eye_contact_samples), 1)
-
-        avg_eye     = (sum(self._eye_contact_samples) / total
-                       if self._eye_contact_samples else 0.0)
-        avg_engage  = (sum(self._engagement_samples) / total
-                       if self._engagement_samples else 0.0)
-
-        # Most frequent emotion across the session
-        dominant_emo = max(self._emotion_counts, key=self._emotion_counts.get) \
-                       if any(self._emotion_counts.values()) else "neutral"
-
-        nervousness_rate = round(self._nervousness_hits / total * 100, 1)
-
         return {
             # Keys consumed by feedback_generator
-            "eye_contact_score":       round(avg_eye, 2),
-            "engagement_score":        round(avg_engage, 2),
-            "dominant_emotion":        dominant_emo,
-            "emotion_breakdown":       dict(self._emotion_counts),
-            "nervousness_rate":        nervousness_rate,
-            "head_position_breakdown": dict(self._head_position_counts),
-            "issue_counts":            dict(self._issue_counts),
-            "frames_analyzed":         self.frame_count,
+            **state.session_stats.summary(),
+            "frames_analyzed":         state.frame_count,
             "emotion_model":           self.emotion_model_name,
+            "emotion_inferences":      state.emotion_inferences,
+            "emotion_inferences_skipped": state.emotion_skipped,
+            "face_roi":                self.get_roi_stats(state),
         }
 
-    def reset(self):
-        """Reset state for a new question / new session."""
-        self.previous_landmarks  = None
-        self.frame_count         = 0
-        self.skip_counter        = 0
-        self.emotion_history     = []
-        self.last_emo            = {
-            "dominant_emotion":   "neutral",
-            "emotion_confidence": 0.0,
-            "emotions":           {e: 0.0 for e in EMOTION_LABELS},
+    def get_answer_snapshot(self, state: VideoSessionState) -> Dict[str, Any]:
+        """
+        VideoSnapshot-compatible metrics for the current answer only —
+        frames since the last reset_answer(). Called when an answer is
+        submitted; O(1) whatever the session length.
+        """
+        window = state.answer_stats
+        summary = window.summary()
+        base_inf, base_skip = state._answer_emotion_base
+        return {
+            "frames_analyzed":            window.frames,
+            "avg_eye_contact_score":      summary["eye_contact_score"],
+            "avg_engagement_score":       summary["engagement_score"],
+            "dominant_emotion":           summary["dominant_emotion"],
+            "emotion_breakdown":          summary["emotion_breakdown"],
+            "nervousness_rate":           summary["nervousness_rate"],
+            "nervousness_indicators":     sorted(window.nervousness_indicators),
+            "head_position_breakdown":    summary["head_position_breakdown"],
+            "issue_counts":               summary["issue_counts"],
+            "eye_closed_count":           window.eye_closed_count,
+            "emotion_model":              self.emotion_model_name,
+            "emotion_inferences":         state.emotion_inferences - base_inf,
+            "emotion_inferences_skipped": state.emotion_skipped - base_skip,
+        }
+
+    def reset_answer(self, state: VideoSessionState):
+        """Start a new answer window; session-wide stats are kept."""
+        state.answer_stats = VideoStats()
+        state._answer_emotion_base = (state.emotion_inferences, state.emotion_skipped)
+
+    def reset(self, state: VideoSessionState):
+        """Reset a session's state for a new session."""
+        state.reset()
+
+    def get_timings(self, state: Optional[VideoSessionState] = None) -> Dict[str, Any]:
+        """Per-stage latency histograms — one session's, or process-wide."""
+        return (state.timings if state is not None else pipeline_timings).snapshot()
+
+    def get_roi_stats(self, state: VideoSessionState) -> Dict[str, Any]:
+        """
+        How often FaceMesh ran on the tracked face crop vs the full frame —
+        a low hit rate means the face_mesh stage timings are full-frame runs.
+        """
+        searched = state.roi_frames + state.full_frames
+        return {
+            "roi_frames":   state.roi_frames,
+            "full_frames":  state.full_frames,
+            "hit_rate_pct": round(state.roi_frames / searched * 100, 1)
+                            if searched else 0.0,
         }
-        self._eye_contact_samples  = []
-        self._engagement_samples   = []
-        self._head_position_counts = {k: 0 for k in self._head_position_counts}
-        self._emotion_counts       = {e: 0 for e in EMOTION_LABELS}
-        self._nervousness_hits     = 0
-        self._issue_counts         = {}
-        self._last_analysis        = None
-        self._consecutive_issues = {}
 
     # ─────────────────────────── Private helpers ─────────────────────────────
 
-    def _decode_frame(self, frame_data: str) -> Optional[np.ndarray]:
-        """Decode base64 string to BGR OpenCV image."""
+    def _record_timings(
+        self, state: VideoSessionState, timings: Dict[str, float], t_start: float
+    ):
+        """Close out one frame's stage timings into both histogram sets."""
+        timings["total"] = (time.perf_counter() - t_start) * 1000.0
+        state.last_timings = timings
+        state.timings.record_frame(timings)
+        pipeline_timings.record_frame(timings)
+
+    def _decode_frame(
+        self,
+        frame_data: Union[str, bytes, memoryview],
+        timings:    Optional[Dict[str, float]] = None,
+    ) -> Optional[np.ndarray]:
+        """Decode base64 string or raw encoded bytes to BGR OpenCV image."""
+        timings = {} if timings is None else timings
         try:
-            if "," in frame_data:
-                frame_data = frame_data.split(",")[1]
-            img_bytes = base64.b64decode(frame_data)
+            t = time.perf_counter()
+            if isinstance(frame_data, str):
+                if "," in frame_data:
+                    frame_data = frame_data.split(",")[1]
+                img_bytes = base64.b64decode(frame_data)
+                t = lap(timings, "b64decode", t)
+            else:
+                img_bytes = frame_data   # binary frame — no copy
             nparr     = np.frombuffer(img_bytes, np.uint8)
             image     = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            lap(timings, "imdecode", t)
             return image
         except Exception as e:
             print(f"[VideoAnalyzer] Decode error: {e}")
             return None
 
-    def _extract_landmarks(self, face_lm, image_shape) -> Dict[str, tuple]:
-        """Extract key facial landmarks as (x_px, y_px, z) tuples."""
+    def _detect_face(
+        self,
+        state:   VideoSessionState,
+        image:   np.ndarray,
+        timings: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Run FaceMesh on the tracked ROI (if any), falling back to the full
+        frame when the face is lost. Returns (face_landmarks, region) where
+        region = (x1, y1, x2, y2) of the pixels MediaPipe saw, or (None, None).
+        """
+        h, w = image.shape[:2]
+
+        if state.face_roi is not None:
+            x1, y1, x2, y2 = state.face_roi
+            face_lm = self._process_region(state, image[y1:y2, x1:x2], timings)
+            if face_lm is not None:
+                state.roi_frames += 1
+                return face_lm, state.face_roi
+            state.face_roi = None   # face lost → search the whole frame
+
+        state.full_frames += 1
+        face_lm = self._process_region(state, image, timings)
+        return (face_lm, (0, 0, w, h)) if face_lm is not None else (None, None)
+
+    def _process_region(
+        self,
+        state:   VideoSessionState,
+        bgr:     np.ndarray,
+        timings: Optional[Dict[str, float]] = None,
+    ):
+        """Downscale (optional), convert to RGB and run FaceMesh on one region."""
+        timings = {} if timings is None else timings
+        t = time.perf_counter()
+        rh, rw = bgr.shape[:2]
+        longest = max(rh, rw)
+        if self.mesh_input_size and longest > self.mesh_input_size:
+            scale = self.mesh_input_size / longest
+            bgr   = cv2.resize(bgr, (max(1, int(rw * scale)), max(1, int(rh * scale))),
+                               interpolation=cv2.INTER_AREA)
+        rgb     = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+        t       = lap(timings, "preprocess", t)
+        results = self._face_mesh(state).process(rgb)
+        lap(timings, "face_mesh", t)
+        return results.multi_face_landmarks[0] if results.multi_face_landmarks else None
+
+    def _next_roi(self, bbox: tuple, w: int, h: int) -> Optional[tuple]:
+        """Expanded face box (full-frame px) to crop the next frame to."""
+        fx1, fy1, fx2, fy2 = bbox
+        side = max(fx2 - fx1, fy2 - fy1)
+        if side <= 0:
+            return None
+        pad = int(side * FACE_ROI_EXPAND)
+        x1, y1 = max(0, fx1 - pad), max(0, fy1 - pad)
+        x2, y2 = min(w, fx2 + pad), min(h, fy2 + pad)
+        if min(x2 - x1, y2 - y1) < FACE_ROI_MIN_SIDE:
+            return None
+        return (x1, y1, x2, y2)
+
+    def _extract_landmarks(
+        self, face_lm, image_shape, region: Optional[tuple] = None
+    ) -> np.ndarray:
+        """
+        Gather the LANDMARK_INDICES points into one (N, 3) float32 array of
+        (x_px, y_px, z) in full-frame pixel coordinates; rows are named by LM.
+        `region` is the (x1, y1, x2, y2) crop MediaPipe ran on — its
+        normalised coords are mapped back into the full frame.
+        """
         h, w = image_shape[:2]
-        def g(i):
-            p = face_lm.landmark[i]
-            return (int(p.x * w), int(p.y * h), p.z)
-        return {
-            "left_eye_left":    g(33),  "left_eye_right":   g(133),
-            "left_eye_top":     g(159), "left_eye_bottom":  g(145),
-            "right_eye_left":   g(362), "right_eye_right":  g(263),
-            "right_eye_top":    g(386), "right_eye_bottom": g(374),
-            "nose_tip":         g(1),   "nose_bridge":      g(6),
-            "mouth_left":       g(61),  "mouth_right":      g(291),
-            "chin":             g(152),
-            "left_face":        g(234), "right_face":       g(454),
-        }
+        ox, oy = 0, 0
+        if region is not None:
+            ox, oy = region[0], region[1]
+            w, h   = region[2] - region[0], region[3] - region[1]
+        pts = face_lm.landmark
+        # Whole-pixel coords, truncated like the int() the metrics were tuned
+        # on. Scaling inside the one pass over MediaPipe's point objects
+        # (which dominates this stage) beats separate NumPy ops on 19 rows.
+        return np.fromiter(
+            chain.from_iterable(
+                (int(p.x * w) + ox, int(p.y * h) + oy, p.z)
+                for p in map(pts.__getitem__, _MESH_ROWS)
+            ),
+            dtype=np.float32, count=3 * len(_MESH_ROWS),
+        ).reshape(-1, 3)
+
+    def _face_geometry(self, lm: np.ndarray) -> Dict[str, tuple]:
+        """
+        All pairwise (dx, dy, dz) offsets used by eye contact, head pose and the
+        expression descriptor, from a single vectorized gather over `lm`.
+        """
+        d = (lm.take(_GEO_A, axis=0) - lm.take(_GEO_B, axis=0)).tolist()
+        return dict(zip(_GEO_NAMES, d))
+
+    def _face_bbox(self, lm: np.ndarray) -> tuple:
+        """
+        (x1, y1, x2, y2) int pixel box around all tracked landmarks, brows
+        and lips included. Computed once per frame (ROI + emotion crop);
+        builtin min/max over 19 values beat two NumPy reductions.
+        """
+        xs, ys = lm[:, :2].T.tolist()
+        return int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys))
 
-    def _ear(self, lm: Dict) -> float:
+    def _ear(self, geo: Dict[str, tuple]) -> float:
         """Eye Aspect Ratio — approaches 0 when eyes are closed."""
-        def one(top, bot, left, right):
-            v = abs(top[1] - bot[1])
-            h = abs(left[0] - right[0])
-            return v / h if h else 0.0
-        l = one(lm["left_eye_top"],  lm["left_eye_bottom"],
-                lm["left_eye_left"], lm["left_eye_right"])
-        r = one(lm["right_eye_top"], lm["right_eye_bottom"],
-                lm["right_eye_left"],lm["right_eye_right"])
+        def one(v, h):
+            return abs(v) / abs(h) if h else 0.0
+        l = one(geo["left_eye_v"][1],  geo["left_eye_h"][0])
+        r = one(geo["right_eye_v"][1], geo["right_eye_h"][0])
         return (l + r) / 2
 
-    def _analyze_eye_contact(self, lm: Dict) -> Dict[str, Any]:
+    def _analyze_eye_contact(self, geo: Dict[str, tuple]) -> Dict[str, Any]:
         """
         Compute eye contact score (0-100) from nose-face-center offset.
         Penalises to 0 when eyes are detected as closed (EAR < threshold).
         """
-        nx   = lm["nose_tip"][0]
-        cx   = (lm["left_face"][0] + lm["right_face"][0]) / 2
-        fw   = lm["right_face"][0] - lm["left_face"][0]
-        off  = abs(nx - cx) / fw if fw else 0
+        fw   = geo["face"][0]
+        dx   = geo["nose_left"][0] - fw / 2      # nose_x - face centre x
+        off  = abs(dx) / fw if fw else 0
         gaze_score = max(0.0, 100.0 - off * 200.0)
-        dir_ = "center" if off < 0.1 else ("left" if nx < cx else "right")
+        dir_ = "center" if off < 0.1 else ("left" if dx < 0 else "right")
 
-        ear   = self._ear(lm)
+        ear   = self._ear(geo)
         if ear < EAR_CLOSED_THRESH:
             score = 0.0
             dir_  = "closed"
@@ -407,7 +714,7 @@ class VideoAnalyzer:
             "ear":       round(ear, 3),
         }
 
-    def _analyze_head_pose(self, lm: Dict) -> Dict[str, Any]:
+    def _analyze_head_pose(self, geo: Dict[str, tuple]) -> Dict[str, Any]:
         """
         Compute head position from nose-chin-face geometry.
 
@@ -417,15 +724,9 @@ class VideoAnalyzer:
         → looking_down : nose moves toward chin → v_off closer to 0
         → looking_up   : nose moves far above chin → v_off very negative
         """
-        nx, ny, _ = lm["nose_tip"]
-        cy        = lm["chin"][1]
-        lx        = lm["left_face"][0]
-        rx        = lm["right_face"][0]
-        cx_face   = (lx + rx) / 2
-        fw        = rx - lx
-
-        h_off = (nx - cx_face) / fw if fw else 0
-        v_off = (ny - cy) / fw if fw else 0
+        fw    = geo["face"][0]
+        h_off = (geo["nose_left"][0] - fw / 2) / fw if fw else 0
+        v_off = geo["nose_chin"][1] / fw if fw else 0
 
         if abs(h_off) > HEAD_HORIZ_THRESH:
             pos = "turned_left" if h_off < 0 else "turned_right"
@@ -436,10 +737,8 @@ class VideoAnalyzer:
         else:
             pos = "neutral"
 
-        tilt = np.degrees(np.arctan2(
-            lm["mouth_right"][1] - lm["mouth_left"][1],
-            lm["mouth_right"][0] - lm["mouth_left"][0],
-        ))
+        mdx, mdy = geo["mouth"][:2]
+        tilt     = math.degrees(math.atan2(mdy, mdx))
 
         return {
             "position":          pos,
@@ -448,12 +747,9 @@ class VideoAnalyzer:
             "vertical_offset":   round(v_off, 3),
         }
 
-    def _detect_head_movement(self, curr: Dict, prev: Dict) -> Dict[str, Any]:
+    def _detect_head_movement(self, curr: np.ndarray, prev: np.ndarray) -> Dict[str, Any]:
         """Classify head movement intensity between two consecutive frames."""
-        d = np.sqrt(
-            (curr["nose_tip"][0] - prev["nose_tip"][0]) ** 2 +
-            (curr["nose_tip"][1] - prev["nose_tip"][1]) ** 2
-        )
+        d = math.hypot(*(curr[_NOSE, :2] - prev[_NOSE, :2]).tolist())
         if d < 5:    t, i = "stable",    0
         elif d < 15: t, i = "slight",    1
         elif d < 30: t, i = "moderate",  2
@@ -479,8 +775,11 @@ class VideoAnalyzer:
             if crop.size == 0:
                 return None
 
-            emotion_label, scores = _emotion_model.predict_emotions(
-                crop, logits=False)
+            if self.emotion_batcher is not None:
+                emotion_label, scores = self.emotion_batcher.predict(crop)
+            else:
+                emotion_label, scores = _emotion_model.predict_emotions(
+                    crop, logits=False)
 
             emos_pct = {
                 label: round(float(score) * 100, 1)
@@ -495,11 +794,57 @@ class VideoAnalyzer:
             print(f"[VideoAnalyzer] HSEmotion error: {e}")
             return None
 
+    def _expression_descriptor(self, geo: Dict[str, tuple]) -> np.ndarray:
+        """
+        Small face-width-normalised vector of the landmarks that drive
+        expression: mouth opening / width, eyebrow raise, eye opening.
+        """
+        fw = geo["face"][0] or 1
+        return np.array([
+            geo["lips"][1],
+            geo["mouth"][0],
+            geo["left_brow"][1],
+            geo["right_brow"][1],
+            -geo["left_eye_v"][1],
+            -geo["right_eye_v"][1],
+        ], dtype=np.float32) / fw
+
+    def _emotion_due(self, state: VideoSessionState, expression: np.ndarray) -> bool:
+        """True when HSEmotion must rerun: expression moved or result is stale."""
+        if state.last_expression is None:
+            return True
+        if time.monotonic() - state.last_emotion_time >= EMOTION_MAX_STALE_SECONDS:
+            return True
+        delta = float(np.max(np.abs(expression - state.last_expression)))
+        return delta > EMOTION_LANDMARK_DELTA_THRESH
+
+    def _smooth_emotion(self, state: VideoSessionState, emo: Dict) -> Dict:
+        """
+        Exponentially blend a fresh inference into last_emo. Dominant emotion
+        is taken from the blended EMOTION_LABELS scores.
+        """
+        new = emo["emotions"]
+        if state.emotion_inferences == 0:
+            blended = dict(new)
+        else:
+            a    = EMOTION_SMOOTHING_ALPHA
+            prev = state.last_emo["emotions"]
+            blended = {
+                k: round(a * new.get(k, 0.0) + (1 - a) * prev.get(k, 0.0), 1)
+                for k in EMOTION_LABELS
+            }
+        dom = max(blended, key=blended.get)
+        return {
+            "dominant_emotion":   dom,
+            "emotion_confidence": blended[dom],
+            "emotions":           blended,
+        }
+
     def _detect_nervousness(
         self,
         dominant_emotion: str,
         movement_intensity: int,
-        emotion_history: List[Dict],
+        emotion_history: deque,
     ) -> List[str]:
         """Detect nervousness indicators from emotion + movement + history."""
         indicators = []
@@ -508,8 +853,8 @@ class VideoAnalyzer:
         if movement_intensity >= 2:
             indicators.append("fidgeting")
         if len(emotion_history) >= 5:
-            recent = [e["dominant_emotion"] for e in emotion_history[-5:]]
-            if len(set(recent)) >= 4:
+            recent = {emotion_history[-i]["dominant_emotion"] for i in range(1, 6)}
+            if len(recent) >= 4:
                 indicators.append("emotional_instability")
         return indicators
 
@@ -530,7 +875,7 @@ class VideoAnalyzer:
         elif emotion in ["sad", "fear", "angry"]: s -= 15
         return max(0.0, min(100.0, round(s, 1)))
 
-    def _detect_issues(self, a: Dict[str, Any]):
+    def _detect_issues(self, state: VideoSessionState, a: Dict[str, Any]):
         issues:   List[str] = []
         warnings: List[str] = []
 
@@ -575,18 +920,17 @@ class VideoAnalyzer:
         for issue_key, warning_msg in checks:
             issues.append(issue_key)
             # Increment consecutive counter
-            self._consecutive_issues[issue_key] = \
-                self._consecutive_issues.get(issue_key, 0) + 1
+            state._consecutive_issues[issue_key] = \
+                state._consecutive_issues.get(issue_key, 0) + 1
             # Only warn after N consecutive frames
-            print(f"[DEBUG] {issue_key}: count={self._consecutive_issues[issue_key]}, threshold={self._warning_thresholds.get(issue_key, 3)}")  # ← ADD
             threshold = self._warning_thresholds.get(issue_key, 3)
-            if self._consecutive_issues[issue_key] >= threshold:
+            if state._consecutive_issues[issue_key] >= threshold:
                 warnings.append(warning_msg)
 
         # Reset counters for issues NOT present this frame
-        for key in list(self._consecutive_issues.keys()):
+        for key in list(state._consecutive_issues.keys()):
             if key not in active_issues:
-                self._consecutive_issues[key] = 0  # ← instant reset when stable
+                state._consecutive_issues[key] = 0  # ← instant reset when stable
 
         return issues, warnings
 
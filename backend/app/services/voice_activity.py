@@ -0,0 +1,94 @@
+"""
+voice_activity.py
+=================
+Cheap energy + zero-crossing voice-activity gate — the first stage of
+audio analysis.
+
+Each chunk is cut into 20 ms frames (no overlap, one reshape). A frame is
+voiced when its mean power is above settings.vad_energy_db (dBFS) AND its
+zero-crossing rate is below settings.vad_zcr_max — loud broadband noise
+(fans, keyboard, breath) crosses zero far more often than voiced speech.
+Voiced frames are then widened by settings.vad_hangover_ms on both sides
+so word onsets and tails stay attached to their spans.
+
+AudioAnalyzer uses the result to:
+  - skip silent chunks entirely (they only feed the silence accumulators),
+  - run pitch tracking on the voiced spans only,
+and RealTimeMonitor sends only voiced audio to Whisper.
+
+Used by:
+  - audio_analyzer.py     : gate() (timed) and analyze_samples()
+  - real_time_monitor.py  : decode + gate in one pool hop, via gate()
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from ..config import settings
+
+VAD_FRAME_SECONDS = 0.020
+
+
+class VoiceActivity:
+    """Per-frame voiced mask of ONE chunk + the sample spans it implies."""
+
+    __slots__ = ("mask", "frame_len", "n_samples", "sr")
+
+    def __init__(self, mask: np.ndarray, frame_len: int, n_samples: int, sr: int):
+        self.mask      = mask
+        self.frame_len = frame_len
+        self.n_samples = n_samples
+        self.sr        = sr
+
+    @property
+    def voiced(self) -> bool:
+        return bool(self.mask.any())
+
+    @property
+    def voiced_seconds(self) -> float:
+        return sum(e - s for s, e in self.spans()) / self.sr
+
+    def spans(self):
+        """(start, end) sample ranges of voiced audio."""
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], self.mask.astype(np.int8), [0]))))
+        bounds = np.minimum(edges * self.frame_len, self.n_samples)
+        # A trailing partial frame belongs to the last full frame
+        if len(bounds) and edges[-1] == len(self.mask):
+            bounds[-1] = self.n_samples
+        return bounds.reshape(-1, 2).tolist()
+
+    def voiced_audio(self, y: np.ndarray) -> np.ndarray:
+        """The voiced spans of y, joined."""
+        parts = [y[s:e] for s, e in self.spans()]
+        return np.concatenate(parts) if parts else y[:0]
+
+
+def detect_voice(
+    y:           np.ndarray,
+    sr:          int,
+    energy_db:   Optional[float] = None,
+    zcr_max:     Optional[float] = None,
+    hangover_ms: Optional[float] = None,
+) -> VoiceActivity:
+    """Gate one chunk of mono float audio; thresholds default to settings."""
+    energy_db   = settings.vad_energy_db   if energy_db   is None else energy_db
+    zcr_max     = settings.vad_zcr_max     if zcr_max     is None else zcr_max
+    hangover_ms = settings.vad_hangover_ms if hangover_ms is None else hangover_ms
+
+    frame_len = max(1, int(sr * VAD_FRAME_SECONDS))
+    n_frames  = len(y) // frame_len
+    if n_frames == 0:
+        return VoiceActivity(np.zeros(0, dtype=bool), frame_len, len(y), sr)
+
+    frames = y[:n_frames * frame_len].reshape(n_frames, frame_len)
+    power  = np.einsum("ij,ij->i", frames, frames) / frame_len
+    zcr    = np.count_nonzero(np.diff(np.signbit(frames), axis=1), axis=1) / frame_len
+
+    mask = (10.0 * np.log10(power + 1e-12) > energy_db) & (zcr < zcr_max)
+
+    hang = int(round(hangover_ms / 1000.0 / VAD_FRAME_SECONDS))
+    if hang and mask.any():
+        mask = np.convolve(mask, np.ones(2 * hang + 1), mode="same") > 0
+
+    return VoiceActivity(mask, frame_len, len(y), sr)
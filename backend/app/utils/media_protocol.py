@@ -0,0 +1,157 @@
+"""
+media_protocol.py — Binary WebSocket framing for video / audio media
+=====================================================================
+Replaces base64-in-JSON for the high-volume media path. Control messages
+(auth, answer, end_session, ping) stay JSON text frames; media is sent as
+binary frames:
+
+    ┌──────────────────────── 24-byte header (network byte order) ────────┐
+    │ version  u8   │ msg_type u8 │ codec u8 │ channels u8                 │
+    │ seq      u32  — per-session sequence number                          │
+    │ ts_ms    u64  — client capture timestamp (ms since epoch)            │
+    │ rate     u32  — audio sample rate in Hz (0 for video)                │
+    │ text_len u16  — length of UTF-8 transcript that follows (audio only) │
+    │ reserved u16                                                         │
+    └─────────────────────────────────────────────────────────────────────┘
+    [ transcript : text_len bytes, UTF-8 ]   ← browser speech recognition
+    [ payload    : raw JPEG / PCM / WebM-Opus bytes ]
+
+The payload is exposed as a memoryview over the received frame, so it goes
+straight into cv2.imdecode / the audio decoder without intermediate copies.
+"""
+
+import struct
+from typing import Optional
+
+
+PROTOCOL_VERSION = 1
+
+HEADER = struct.Struct("!BBBBIQIHH")
+HEADER_SIZE = HEADER.size   # 24 bytes
+
+# ─────────────────────────── Message types ───────────────────────────────────
+MSG_VIDEO_FRAME = 1
+MSG_AUDIO_CHUNK = 2
+
+# ─────────────────────────── Codecs ──────────────────────────────────────────
+VIDEO_CODECS = {
+    1: "jpeg",
+    2: "webp",
+}
+AUDIO_CODECS = {
+    16: "pcm_s16le",    # raw interleaved int16
+    17: "pcm_f32le",    # raw interleaved float32
+    18: "webm_opus",    # MediaRecorder default in Chrome / Firefox
+    19: "ogg_opus",
+    20: "wav",
+}
+
+# Raw sample codecs — no container, decoded with np.frombuffer
+PCM_CODECS = ("pcm_s16le", "pcm_f32le")
+
+
+class MediaProtocolError(ValueError):
+    """Raised when a binary media frame cannot be parsed."""
+
+
+class MediaPacket:
+    """One parsed binary media frame."""
+
+    __slots__ = (
+        "msg_type", "codec", "channels", "seq",
+        "timestamp_ms", "sample_rate", "transcript", "payload",
+    )
+
+    def __init__(
+        self,
+        msg_type:     int,
+        codec:        str,
+        channels:     int,
+        seq:          int,
+        timestamp_ms: int,
+        sample_rate:  int,
+        transcript:   Optional[str],
+        payload:      memoryview,
+    ):
+        self.msg_type     = msg_type
+        self.codec        = codec
+        self.channels     = channels
+        self.seq          = seq
+        self.timestamp_ms = timestamp_ms
+        self.sample_rate  = sample_rate
+        self.transcript   = transcript
+        self.payload      = payload
+
+    @property
+    def is_video(self) -> bool:
+        return self.msg_type == MSG_VIDEO_FRAME
+
+    @property
+    def is_audio(self) -> bool:
+        return self.msg_type == MSG_AUDIO_CHUNK
+
+
+def parse_media_packet(data: bytes) -> MediaPacket:
+    """
+    Parse a binary WebSocket frame into a MediaPacket.
+
+    Raises:
+        MediaProtocolError: on short frames, unknown version/type/codec
+    """
+    if len(data) < HEADER_SIZE:
+        raise MediaProtocolError(f"Frame too short ({len(data)} bytes)")
+
+    (version, msg_type, codec_id, channels,
+     seq, ts_ms, rate, text_len, _reserved) = HEADER.unpack_from(data, 0)
+
+    if version != PROTOCOL_VERSION:
+        raise MediaProtocolError(f"Unsupported protocol version {version}")
+
+    if msg_type == MSG_VIDEO_FRAME:
+        codec = VIDEO_CODECS.get(codec_id)
+    elif msg_type == MSG_AUDIO_CHUNK:
+        codec = AUDIO_CODECS.get(codec_id)
+    else:
+        raise MediaProtocolError(f"Unknown message type {msg_type}")
+
+    if codec is None:
+        raise MediaProtocolError(f"Unknown codec {codec_id} for type {msg_type}")
+
+    body_start = HEADER_SIZE + text_len
+    if len(data) < body_start:
+        raise MediaProtocolError("Transcript length exceeds frame size")
+
+    view       = memoryview(data)
+    transcript = None
+    if text_len:
+        transcript = bytes(view[HEADER_SIZE:body_start]).decode("utf-8", "replace")
+
+    return MediaPacket(
+        msg_type=msg_type,
+        codec=codec,
+        channels=channels or 1,
+        seq=seq,
+        timestamp_ms=ts_ms,
+        sample_rate=rate,
+        transcript=transcript,
+        payload=view[body_start:],
+    )
+
+
+def build_media_packet(
+    msg_type:     int,
+    codec_id:     int,
+    payload:      bytes,
+    seq:          int = 0,
+    timestamp_ms: int = 0,
+    sample_rate:  int = 0,
+    channels:     int = 1,
+    transcript:   Optional[str] = None,
+) -> bytes:
+    """Encode a binary media frame (used by benchmarks and client tooling)."""
+    text = transcript.encode("utf-8") if transcript else b""
+    header = HEADER.pack(
+        PROTOCOL_VERSION, msg_type, codec_id, channels,
+        seq, timestamp_ms, sample_rate, len(text), 0,
+    )
+    return header + text + bytes(payload)
@@ -0,0 +1,41 @@
+"""
+pcm_buffer.py — Growable float32 PCM buffer
+===========================================
+Append-only sample buffer with amortised doubling, so buffering a whole
+answer costs O(total samples) instead of one np.concatenate per chunk.
+
+Used by:
+  - services/audio_analyzer.py : per-answer audio for deferred transcription
+"""
+
+import numpy as np
+
+
+class PCMBuffer:
+    """Mono float32 samples, appended chunk by chunk."""
+
+    __slots__ = ("_data", "_size")
+
+    def __init__(self, capacity: int = 16000 * 30):
+        self._data = np.empty(max(1, capacity), dtype=np.float32)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, samples: np.ndarray):
+        n = len(samples)
+        if self._size + n > len(self._data):
+            grown = np.empty(max(len(self._data) * 2, self._size + n), dtype=np.float32)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size:self._size + n] = samples
+        self._size += n
+
+    def slice(self, start: int = 0, end: int = None) -> np.ndarray:
+        """Copy of samples[start:end] — safe to hand to another thread."""
+        end = self._size if end is None else min(end, self._size)
+        return self._data[start:end].copy()
+
+    def clear(self):
+        self._size = 0
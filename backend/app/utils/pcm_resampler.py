@@ -0,0 +1,46 @@
+"""
+pcm_resampler.py — Streaming resampler for raw PCM chunks
+=========================================================
+Raw PCM arrives in short chunks (100-500 ms). Resampling each chunk on its
+own — what librosa.resample did — restarts the filter at every boundary
+(edge transients the pitch tracker and VAD see as onsets) and pays the
+resampler's set-up cost per chunk.
+
+StreamingResampler wraps soxr.ResampleStream (libsoxr's polyphase
+resampler; soxr already ships with librosa >= 0.10 and backs its default
+"soxr_hq" mode): the filter is designed ONCE per session and its state is
+carried from chunk to chunk, so the concatenated output equals resampling
+the whole stream in one go. The price is a few tens of milliseconds of
+audio held in the filter and emitted with the next chunk.
+
+Used by:
+  - services/audio_analyzer.py : one resampler per session for raw PCM input
+"""
+
+import numpy as np
+import soxr
+
+# Same quality librosa.resample uses by default ("soxr_hq")
+SOXR_QUALITY = "HQ"
+
+
+class StreamingResampler:
+    """source_rate → target_rate, mono float32, state carried across chunks."""
+
+    def __init__(self, source_rate: int, target_rate: int):
+        self.source_rate = int(source_rate)
+        self.target_rate = int(target_rate)
+        self.reset()
+
+    def reset(self):
+        """Forget the stream (the next chunk starts a new one)."""
+        self._stream = soxr.ResampleStream(
+            self.source_rate, self.target_rate, 1,
+            dtype="float32", quality=SOXR_QUALITY)
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        """Resample the next chunk of the stream."""
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        if self.source_rate == self.target_rate:
+            return x
+        return self._stream.resample_chunk(x)
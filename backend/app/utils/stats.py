@@ -0,0 +1,63 @@
+"""
+stats.py — Constant-memory running statistics
+=============================================
+Streaming accumulators for per-frame / per-chunk metrics, so session
+summaries never have to keep or rescan sample lists.
+
+Used by:
+  - services/video_analyzer.py : eye contact / engagement per session
+"""
+
+import math
+from typing import Any, Dict
+
+
+class RunningStats:
+    """
+    Welford's online mean / variance plus min / max.
+
+    add() and every read are O(1) in time and memory, whatever the number
+    of samples; the result matches a two-pass computation over the samples.
+    """
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.mean  = 0.0
+        self._m2   = 0.0
+        self.min   = math.inf
+        self.max   = -math.inf
+
+    def add(self, x: float):
+        self.count += 1
+        delta      = x - self.mean
+        self.mean += delta / self.count
+        self._m2  += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 with fewer than two samples)."""
+        return self._m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self, ndigits: int = 2) -> Dict[str, Any]:
+        if not self.count:
+            return {"count": 0, "mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0}
+        return {
+            "count": self.count,
+            "mean":  round(self.mean, ndigits),
+            "std":   round(self.std, ndigits),
+            "min":   round(self.min, ndigits),
+            "max":   round(self.max, ndigits),
+        }
@@ -0,0 +1,121 @@
+"""
+timing.py — Always-on latency histograms for hot paths
+=======================================================
+Fixed log-spaced buckets (0.05 ms … ~30 s), so recording a sample is one
+bisect + two adds and memory never grows. Percentiles are read back from
+the buckets (upper bucket edge, ~15% resolution), which is plenty for
+sizing hardware and spotting regressions after a MediaPipe / ONNX Runtime
+upgrade.
+
+    timings = {}
+    t = time.perf_counter()
+    ...decode...
+    t = lap(timings, "imdecode", t)
+    ...
+    session_timings.record_frame(timings)
+    pipeline_timings.record_frame(timings)
+
+Used by:
+  - services/video_analyzer.py : per-stage frame timings
+  - services/audio_analyzer.py : per-stage chunk timings
+  - services/answer_pipeline.py: evaluation / follow-up latency
+  - routers/websocket.py       : /ws/timings endpoints, sampled timings
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+from .stats import RunningStats
+
+
+# Upper bucket edges in ms: 0.05 · 1.15^k, up to ~30 s; last bucket is +inf
+_BUCKET_EDGES: List[float] = []
+_edge = 0.05
+while _edge < 30_000:
+    _BUCKET_EDGES.append(round(_edge, 4))
+    _edge *= 1.15
+_BUCKET_EDGES.append(math.inf)
+
+
+def lap(timings: Dict[str, float], stage: str, since: float) -> float:
+    """Add the ms elapsed since `since` to timings[stage]; returns now."""
+    now = time.perf_counter()
+    timings[stage] = timings.get(stage, 0.0) + (now - since) * 1000.0
+    return now
+
+
+class LatencyHistogram:
+    """Bucketed latency distribution + exact mean / min / max."""
+
+    __slots__ = ("counts", "stats")
+
+    def __init__(self):
+        self.counts = [0] * len(_BUCKET_EDGES)
+        self.stats  = RunningStats()
+
+    def add(self, ms: float):
+        self.counts[bisect_left(_BUCKET_EDGES, ms)] += 1
+        self.stats.add(ms)
+
+    def percentile(self, p: float) -> float:
+        n = self.stats.count
+        if not n:
+            return 0.0
+        target = math.ceil(n * p / 100.0)
+        seen   = 0
+        for edge, c in zip(_BUCKET_EDGES, self.counts):
+            seen += c
+            if seen >= target:
+                return min(edge, self.stats.max)
+        return self.stats.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        s = self.stats
+        return {
+            "count":   s.count,
+            "mean_ms": round(s.mean, 3),
+            "p50_ms":  round(self.percentile(50), 3),
+            "p90_ms":  round(self.percentile(90), 3),
+            "p99_ms":  round(self.percentile(99), 3),
+            "max_ms":  round(s.max, 3) if s.count else 0.0,
+        }
+
+
+class StageTimings:
+    """
+    One LatencyHistogram per pipeline stage, plus the frame total.
+    Safe to record from several worker threads at once.
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record_frame(self, timings: Dict[str, float]):
+        with self._lock:
+            for stage, ms in timings.items():
+                hist = self._stages.get(stage)
+                if hist is None:
+                    hist = self._stages[stage] = LatencyHistogram()
+                hist.add(ms)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {stage: h.to_dict() for stage, h in self._stages.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+
+# Process-wide video pipeline timings (all sessions)
+pipeline_timings = StageTimings()
+
+# Process-wide audio pipeline timings (all sessions)
+audio_pipeline_timings = StageTimings()
+
+# Process-wide answer handling timings: LLM stages + answer → next prompt
+answer_timings = StageTimings()
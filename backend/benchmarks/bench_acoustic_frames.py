@@ -0,0 +1,110 @@
+"""
+bench_acoustic_frames.py
+========================
+Per-chunk cost of the volume / energy / pause features in AudioAnalyzer.
+
+Compares:
+  1. librosa : librosa.feature.rms for volume, librosa.effects.split (which
+               runs rms again) for pauses, and a separate squared-signal
+               pass for energy (the previous implementation)
+  2. shared  : AcousticFrames — squared once, framed once, everything
+               derived from that (AudioAnalyzer as shipped)
+
+Outputs (the rounded dict values AudioAnalyzer reports) are checked for
+agreement on every chunk before timing.
+
+Run from backend/:
+  python -m benchmarks.bench_acoustic_frames
+  python -m benchmarks.bench_acoustic_frames --chunks 500 --json out.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import librosa
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.audio_analyzer import AudioAnalyzer        # noqa: E402
+from app.services.acoustic_frames import AcousticFrames      # noqa: E402
+from benchmarks.bench_pitch_engines import synthetic_utterance  # noqa: E402
+
+SR = 16000
+
+
+def librosa_features(y: np.ndarray, sr: int):
+    """Reference copy of the previous _analyze_volume + _analyze_pauses."""
+    rms      = librosa.feature.rms(y=y)[0]
+    mean_rms = np.mean(rms)
+    std_rms  = np.std(rms)
+    level    = float(min(100, mean_rms * 1000))
+    consistency = float(max(0, 100 - (std_rms / mean_rms) * 50)) if mean_rms > 0 else 0.0
+    energy   = float(np.sum(y ** 2) / len(y))
+
+    intervals  = librosa.effects.split(y, top_db=30)
+    total      = len(y) / sr
+    pause_time = total - sum((e - s) / sr for s, e in intervals)
+    return (
+        {"level": round(level, 2), "consistency": round(consistency, 2),
+         "energy": round(energy, 6)},
+        {"pause_time": round(pause_time, 2), "num_pauses": max(0, len(intervals) - 1),
+         "silence_ratio": round(pause_time / total * 100, 2) if total > 0 else 0.0},
+    )
+
+
+def shared_features(analyzer: AudioAnalyzer, y: np.ndarray, sr: int):
+    frames = AcousticFrames(y, sr)
+    return analyzer._analyze_volume(frames), analyzer._analyze_pauses(frames)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--chunks",        type=int,   default=200)
+    ap.add_argument("--chunk-seconds", type=float, default=2.0)
+    ap.add_argument("--repeats",       type=int,   default=3)
+    ap.add_argument("--json",          help="write results to this file")
+    args = ap.parse_args()
+
+    rng    = np.random.default_rng(0)
+    chunks = [synthetic_utterance(rng.uniform(90, 250), args.chunk_seconds, rng)[0]
+              for _ in range(args.chunks)]
+
+    # Only the pure feature helpers are used — skip Whisper loading
+    analyzer = AudioAnalyzer.__new__(AudioAnalyzer)
+
+    mismatches = sum(librosa_features(y, SR) != shared_features(analyzer, y, SR)
+                     for y in chunks)
+
+    def run(fn):
+        t = time.perf_counter()
+        for y in chunks:
+            fn(y)
+        return (time.perf_counter() - t) * 1000.0 / len(chunks)
+
+    librosa_ms = min(run(lambda y: librosa_features(y, SR)) for _ in range(args.repeats))
+    shared_ms  = min(run(lambda y: shared_features(analyzer, y, SR))
+                     for _ in range(args.repeats))
+
+    results = {
+        "chunks":               args.chunks,
+        "librosa_ms_per_chunk": round(librosa_ms, 3),
+        "shared_ms_per_chunk":  round(shared_ms, 3),
+        "speedup":              round(librosa_ms / shared_ms, 2),
+        "mismatched_chunks":    mismatches,
+    }
+    print(f"librosa: {librosa_ms:8.3f} ms/chunk")
+    print(f" shared: {shared_ms:8.3f} ms/chunk   ({results['speedup']}x)")
+    print(f"outputs differing on {mismatches}/{args.chunks} chunks")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+bench_answer_latency.py
+=======================
+How long does the candidate wait between submitting an answer and seeing
+the next prompt?
+
+Against the stand-in Groq endpoint from bench_llm_event_loop (every call
+answers after --delay seconds), each answer is scored with AnswerScorer and
+pushed through run_answer_llm(), awaiting the follow-up when one is asked:
+
+  weak        : short, no STAR structure — rule 3 settles on a follow-up
+                before the evaluation, so generation can start alongside it
+  strong      : STAR answer with mixed signals — LLM tier, moves on
+  very_weak   : decisive pre-score — evaluated locally (local_weak)
+  very_strong : decisive pre-score — evaluated locally (local_strong)
+
+Each kind runs in three modes:
+
+  sequential : speculative=False, no stored follow-up (evaluation, then
+               follow-up — the original handler)
+  overlapped : speculative=True, no stored follow-up (question generated
+               without one)
+  stored     : the question's pre-generated follow_up (as shipped)
+
+A weak answer should drop from ~2 × delay (sequential) to ~1 × delay
+(overlapped, stored); stored also makes one LLM call instead of two. A
+strong one is unchanged. The local tiers skip the evaluation call: ~0 when
+moving on, ~1 × delay for a generated follow-up, ~0 with a stored one.
+
+Agreement: all modes must reach the same decision; sequential and
+overlapped the same follow-up text, stored the stored one.
+
+Run from backend/:
+  python -m benchmarks.bench_answer_latency
+  python -m benchmarks.bench_answer_latency --delay 0.8 --answers 10 --json out.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings                              # noqa: E402
+from app.services.answer_pipeline import run_answer_llm      # noqa: E402
+from app.services.answer_scorer import AnswerScorer          # noqa: E402
+from app.services.llm_service import LLMService              # noqa: E402
+from app.utils.timing import answer_timings                  # noqa: E402
+from benchmarks.bench_llm_event_loop import start_server     # noqa: E402
+
+QUESTION = "Tell me about a time you led a team through a difficult project."
+STORED   = "What was the most difficult part of leading that effort?"
+
+# (mode, speculative, stored follow-up)
+MODES = [
+    ("sequential", False, ""),
+    ("overlapped", True,  ""),
+    ("stored",     True,  STORED),
+]
+
+ANSWERS = {
+    "weak":   "Basically I like, um, did stuff, you know.",
+    "strong": ("In my last role the situation was a release that had slipped "
+               "two months. My task was to get the team of six back on track. "
+               "I split the backlog into weekly milestones, paired juniors "
+               "with seniors and ran daily fifteen minute check-ins. As a "
+               "result we shipped 3 weeks later with 40% fewer open bugs and "
+               "the client renewed the contract."),
+    "very_weak":   "Um, yeah, not really sure.",
+    "very_strong": ("In 2022 at Acme Corp I was leading a team of 8 engineers on a "
+                    "difficult migration project. The situation was that our legacy "
+                    "billing system was failing. My task was to lead the migration "
+                    "within 3 months. I designed the plan, I organized the team into "
+                    "two squads, and I implemented a weekly review. As a result we "
+                    "finished 2 weeks early, reduced costs by 30% and served 2 "
+                    "million users without downtime."),
+}
+
+
+async def answer_once(service: LLMService, pre_score, answer: str,
+                      speculative: bool, stored: str):
+    t = time.perf_counter()
+    result = await run_answer_llm(
+        service,
+        question=QUESTION,
+        answer=answer,
+        question_type="behavioral",
+        pre_score=pre_score,
+        question_number=1,
+        total_questions=5,
+        follow_ups_given=0,
+        stored_follow_up=stored,
+        speculative=speculative,
+    )
+    follow_up = None
+    if result["follow_up_task"] is not None:
+        follow_up = await result["follow_up_task"]
+    return (time.perf_counter() - t) * 1000.0, result, follow_up
+
+
+async def run(args):
+    service = LLMService()
+    scorer  = AnswerScorer()
+    results, mismatches = {}, 0
+
+    for kind, answer in ANSWERS.items():
+        pre_score = scorer.score_answer(question=QUESTION, answer=answer)
+        outcomes  = {}
+        for mode, speculative, stored in MODES:
+            wait_ms = []
+            for _ in range(args.answers):
+                ms, result, follow_up = await answer_once(
+                    service, pre_score, answer, speculative, stored)
+                wait_ms.append(ms)
+            outcomes[mode] = (result["decision"]["action"], follow_up)
+            results.setdefault(kind, {})[mode] = {
+                "action":           result["decision"]["action"],
+                "evaluation_tier":  result["evaluation"].get("evaluation_tier"),
+                "speculative":      result["speculative"],
+                "follow_up_source": result["follow_up_source"],
+                "wait_p50_ms":      round(float(np.percentile(wait_ms, 50)), 1),
+                "wait_max_ms":      round(float(np.max(wait_ms)), 1),
+            }
+        action, follow_up = outcomes["stored"]
+        expected_stored   = (action, STORED if action == "follow_up" else None)
+        if (outcomes["sequential"] != outcomes["overlapped"]
+                or outcomes["stored"] != expected_stored
+                or action != outcomes["sequential"][0]):
+            mismatches += 1
+        results[kind]["pre_score"] = pre_score.get("composite_pre_score")
+
+    results["stages"] = answer_timings.snapshot()
+    await service.close()
+    return results, mismatches
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--delay",   type=float, default=0.5, help="stand-in response time (s)")
+    ap.add_argument("--answers", type=int,   default=5,   help="answers per kind and mode")
+    ap.add_argument("--json",    help="write results to this file")
+    args = ap.parse_args()
+
+    server, url = start_server(args.delay)
+    settings.GROQ_API_KEY = settings.GROQ_API_KEY or "bench"
+    settings.llm_base_url = url
+
+    results, mismatches = asyncio.run(run(args))
+    server.shutdown()
+
+    print(f"{'answer':12s} {'tier':13s} {'action':14s} "
+          + " ".join(f"{mode:>11s}" for mode, _, _ in MODES) + "   ms, p50")
+    for kind in ANSWERS:
+        r = results[kind]
+        print(f"{kind:12s} {r['stored']['evaluation_tier']:13s} {r['stored']['action']:14s} "
+              + " ".join(f"{r[mode]['wait_p50_ms']:11.1f}" for mode, _, _ in MODES)
+              + f"   (pre-score {r['pre_score']:.0f})")
+    print(f"decision / follow-up mismatches: {mismatches}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results,
+                       "mismatches": mismatches}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,439 @@
+"""
+bench_audio_pipeline.py
+=======================
+End-to-end audio pipeline benchmark: per-stage time, real-time factor and
+peak memory per chunk, for every signal × input format × chunk size.
+
+Each run feeds one answer's worth of chunks through the same calls the
+RealTimeMonitor makes — AudioAnalyzer.decode_chunk → gate →
+analyze_samples — then get_answer_snapshot(). Stage times come from the
+analyzer's own StageTimings (decode, vad, framing, volume, pitch, pauses,
+text), so the benchmark measures exactly what /ws/timings reports in
+production. With --whisper, voiced audio also goes through the shared
+TranscriptionService ("transcription" stage).
+
+Signals (deterministic, seeded):
+  - vibrato : harmonic tone (140 Hz, 5.5 Hz vibrato) with a syllable envelope
+  - gaps    : the vibrato tone with 0.5 s silences every 1.5 s
+  - noise   : white noise at -30 dBFS (the voice gate should reject it)
+  - speech  : formant-filtered pulse trains (bench_pitch_engines)
+  - recorded (--corpus DIR): every audio file under DIR, one signal each
+
+Input formats:
+  - pcm     : raw int16 at 16 kHz (binary frames — no decode, no resample)
+  - pcm_48k : raw int16 stereo at 48 kHz (streaming resampler)
+  - wav     : base64 WAV per chunk (JSON path, librosa.load)
+  - webm    : one WebM/Opus stream cut into chunks (MediaRecorder; needs PyAV)
+  - webm_drop : the webm chunks with the middle one dropped, as the ingest
+                ring does on overflow (AudioAnalyzer.mark_gap → decoder resync)
+
+Synthetic chunks carry a browser-style transcript at ~150 wpm, so the text
+stage runs too. Agreement checks, per engine / signal / chunk size:
+  - pcm and wav carry identical samples: identical snapshots
+  - pcm_48k and webm against pcm: the same number of analysed chunks and
+    the same text metrics; acoustic metrics within SNAPSHOT_TOLERANCE
+    (resampling and Opus move them slightly). The one expected outlier:
+    gaps at 500 ms with pcm_48k, whose silences line up with the chunks
+    exactly — the resampler's held-back samples move each chunk edge
+    10-30 ms earlier, so every silent chunk starts with a tone tail
+  - webm_drop loses no more than the dropped chunk and the one it
+    resyncs in, against webm
+webm is cut at packet timestamps, every chunk-ms of audio, as
+MediaRecorder's timeslice does.
+
+Results go to --json; --baseline OLD.json flags rows whose real-time
+factor regressed by more than --tolerance (and by more than timer noise).
+
+Run from backend/:
+  python -m benchmarks.bench_audio_pipeline
+  python -m benchmarks.bench_audio_pipeline --chunk-ms 250,1000 --engines yin,pyin
+  python -m benchmarks.bench_audio_pipeline --json new.json --baseline old.json
+"""
+
+import argparse
+import asyncio
+import base64
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import librosa
+import numpy as np
+import soundfile as sf
+import soxr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.audio_analyzer import AudioAnalyzer, AudioSessionState  # noqa: E402
+from app.services.audio_stream_decoder import AV_AVAILABLE, av            # noqa: E402
+from benchmarks.bench_pitch_engines import AUDIO_EXTS, synthetic_utterance  # noqa: E402
+
+SR        = 16000
+SIGNALS   = ("vibrato", "gaps", "noise", "speech")
+FORMATS   = ("pcm", "pcm_48k", "wav", "webm", "webm_drop")
+WORDS     = ("so", "um", "i", "led", "the", "team", "and", "we", "reduced",
+             "latency", "by", "thirty", "percent", "like", "basically", "right")
+WPM       = 150
+
+# Format-dependent drift allowed against pcm (absolute; text metrics exact)
+SNAPSHOT_TOLERANCE = {
+    "word_count":         0,
+    "total_filler_words": 0,
+    "avg_volume_db":      6.0,
+    "avg_pitch_hz":       2.0,
+    "pitch_variation":    1.0,
+    "silence_percentage": 5.0,
+}
+
+# webm_drop may lose the dropped chunk plus the one the decoder resyncs in
+MAX_DROP_LOSS = 2
+
+# Slow-downs smaller than this per chunk are timer noise, not regressions
+MIN_REGRESSION_MS = 0.1
+
+
+# ─────────────────────────── Signals ─────────────────────────────────────────
+
+def vibrato_tone(seconds: float, rng) -> np.ndarray:
+    t  = np.arange(int(seconds * SR)) / SR
+    f0 = 140.0 * (1 + 0.03 * np.sin(2 * np.pi * 5.5 * t))
+    phase = 2 * np.pi * np.cumsum(f0) / SR
+    tone  = sum(np.sin(k * phase) / k for k in range(1, 9))
+    envelope = 0.5 - 0.5 * np.cos(2 * np.pi * 4.0 * t)        # ~4 syllables/s
+    y = 0.3 * tone / np.max(np.abs(tone)) * envelope
+    return y + rng.normal(0, 1e-3, len(y))
+
+
+def synthetic_signal(kind: str, seconds: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    if kind == "vibrato":
+        y = vibrato_tone(seconds, rng)
+    elif kind == "gaps":
+        y = vibrato_tone(seconds, rng)
+        period, gap = int(1.5 * SR), int(0.5 * SR)
+        for s in range(period - gap, len(y), period):
+            y[s:s + gap] = rng.normal(0, 1e-3, len(y[s:s + gap]))
+    elif kind == "noise":
+        y = rng.normal(0, 10 ** (-30 / 20), int(seconds * SR))
+    elif kind == "speech":
+        y, _ = synthetic_utterance(150.0, seconds, rng)
+        y = 0.5 * y
+    else:
+        raise ValueError(f"unknown signal {kind}")
+    return np.clip(y, -0.99, 0.99).astype(np.float32)
+
+
+def recorded_signals(root: str):
+    for dirpath, _, files in os.walk(root):
+        for fname in sorted(files):
+            if fname.lower().endswith(AUDIO_EXTS):
+                path = os.path.join(dirpath, fname)
+                try:
+                    y, _ = librosa.load(path, sr=SR, mono=True)
+                except Exception as e:
+                    print(f"⚠ Skipping {path}: {e}")
+                    continue
+                yield f"recorded:{os.path.relpath(path, root)}", y
+
+
+def transcript_for(seconds: float, index: int) -> str:
+    n = max(1, int(round(seconds * WPM / 60)))
+    return " ".join(WORDS[(index + i) % len(WORDS)] for i in range(n))
+
+
+# ─────────────────────────── Formats ─────────────────────────────────────────
+
+def _s16(y: np.ndarray) -> np.ndarray:
+    return (np.clip(y, -1, 1) * 32767).astype("<i2")
+
+
+def encode_webm(y: np.ndarray) -> bytes:
+    """Whole signal → one WebM/Opus stream at 48 kHz (as MediaRecorder makes)."""
+    buf = io.BytesIO()
+    y48 = _s16(soxr.resample(y, SR, 48000))
+    with av.open(buf, "w", format="webm") as out:
+        stream = out.add_stream("libopus", rate=48000)
+        stream.layout = "mono"
+        for s in range(0, len(y48), 960):
+            block = y48[s:s + 960]
+            frame = av.AudioFrame.from_ndarray(block.reshape(1, -1), format="s16",
+                                               layout="mono")
+            frame.sample_rate = 48000
+            frame.pts = s
+            for packet in stream.encode(frame):
+                out.mux(packet)
+        for packet in stream.encode(None):
+            out.mux(packet)
+    return buf.getvalue()
+
+
+def webm_cuts(data: bytes, n: int, chunk_ms: float):
+    """Byte offsets that cut the stream every chunk_ms of audio (MediaRecorder timeslice)."""
+    cuts = [0]
+    with av.open(io.BytesIO(data)) as src:
+        for packet in src.demux():
+            if (packet.pts is not None and packet.pos is not None and len(cuts) < n
+                    and packet.pts * packet.time_base * 1000 >= len(cuts) * chunk_ms):
+                cuts.append(packet.pos)
+    return cuts + [len(data)]
+
+
+def make_chunks(y: np.ndarray, fmt: str, chunk_ms: float):
+    """[(payload, decode kwargs)] for one answer's audio in one format (None = dropped)."""
+    step   = int(SR * chunk_ms / 1000)
+    pieces = [y[s:s + step] for s in range(0, len(y), step)]
+
+    if fmt == "pcm":
+        kw = {"codec": "pcm_s16le", "source_rate": SR, "channels": 1}
+        return [(_s16(p).tobytes(), kw) for p in pieces]
+    if fmt == "pcm_48k":
+        kw = {"codec": "pcm_s16le", "source_rate": 48000, "channels": 2}
+        y48 = _s16(soxr.resample(y, SR, 48000))
+        step48 = step * 3
+        return [(np.repeat(y48[s:s + step48, None], 2, axis=1).tobytes(), kw)
+                for s in range(0, len(y48), step48)]
+    if fmt == "wav":
+        out = []
+        for p in pieces:
+            buf = io.BytesIO()
+            sf.write(buf, _s16(p), SR, format="WAV", subtype="PCM_16")
+            out.append((base64.b64encode(buf.getvalue()).decode(), {}))
+        return out
+    if fmt in ("webm", "webm_drop"):
+        data = encode_webm(y)
+        cuts = webm_cuts(data, len(pieces), chunk_ms)
+        kw   = {"codec": "webm_opus"}
+        out  = [(data[a:b], kw) for a, b in zip(cuts, cuts[1:])]
+        n    = len(out)
+        if fmt == "webm_drop" and n > 2:
+            out[n // 2] = None
+        return out
+    raise ValueError(f"unknown format {fmt}")
+
+
+# ─────────────────────────── Measurement ─────────────────────────────────────
+
+def run_answer(analyzer, chunks, transcripts, transcription=None, memory=False):
+    """One answer through the pipeline → (state, wall_s, snapshot, snapshot_ms, peak_b, analysed)."""
+    state    = AudioSessionState()
+    peak     = 0
+    analysed = 0
+    loop  = asyncio.new_event_loop() if transcription is not None else None
+
+    t0 = time.perf_counter()
+    for chunk, text in zip(chunks, transcripts):
+        if chunk is None:
+            analyzer.mark_gap(state)
+            continue
+        payload, kw = chunk
+        if memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        y, sr = analyzer.decode_chunk(state, payload, SR, **kw)
+        voice = analyzer.gate(state, y, sr)
+        if transcription is not None and voice.voiced:
+            t = time.perf_counter()
+            result = loop.run_until_complete(transcription.transcribe(voice.voiced_audio(y), sr))
+            text   = result["text"]
+            elapsed = (time.perf_counter() - t) * 1000.0
+            state.chunk_timings["transcription"] = elapsed
+        before = state.audio_seconds
+        analyzer.analyze_samples(state, y, sr, text, voice=voice)
+        analysed += state.audio_seconds > before
+        if memory:
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    wall = time.perf_counter() - t0
+
+    t = time.perf_counter()
+    snapshot = analyzer.get_answer_snapshot(state)
+    snapshot_ms = (time.perf_counter() - t) * 1000.0
+    if loop is not None:
+        loop.close()
+    return state, wall, snapshot, snapshot_ms, peak, analysed
+
+
+def measure(analyzer, y, fmt, chunk_ms, with_text, repeats, transcription):
+    chunks = make_chunks(y, fmt, chunk_ms)
+    step_s = chunk_ms / 1000.0
+    texts  = [transcript_for(step_s, i) if with_text else None for i in range(len(chunks))]
+    audio_s = len(y) / SR
+
+    best = None
+    for _ in range(repeats):
+        run = run_answer(analyzer, chunks, texts, transcription)
+        if best is None or run[1] < best[1]:
+            best = run
+    state, wall, snapshot, snapshot_ms, _, analysed = best
+
+    tracemalloc.start()
+    peak = run_answer(analyzer, chunks, texts, memory=True)[4]
+    tracemalloc.stop()
+
+    stages = {stage: {"mean_ms": h["mean_ms"], "p90_ms": h["p90_ms"], "count": h["count"]}
+              for stage, h in state.timings.snapshot().items()}
+    return {
+        "chunks":         len(chunks),
+        "analysed":       analysed,
+        "audio_seconds":  round(audio_s, 2),
+        "wall_ms":        round(wall * 1000.0, 2),
+        "ms_per_chunk":   round(wall * 1000.0 / max(1, len(chunks)), 3),
+        "rtf":            round(wall / audio_s, 5),
+        "snapshot_ms":    round(snapshot_ms, 3),
+        "peak_kib_per_chunk": round(peak / 1024.0, 1),
+        "stages":         stages,
+        "snapshot":       {k: snapshot.get(k) for k in (
+            "word_count", "avg_volume_db", "avg_pitch_hz", "pitch_variation",
+            "total_filler_words", "silence_percentage")},
+    }
+
+
+def snapshot_drift(row, ref):
+    """Fields where row disagrees with the pcm reference beyond SNAPSHOT_TOLERANCE."""
+    drift = [] if row["analysed"] == ref["analysed"] else ["analysed"]
+    for field, tol in SNAPSHOT_TOLERANCE.items():
+        if abs((row["snapshot"][field] or 0) - (ref["snapshot"][field] or 0)) > tol:
+            drift.append(field)
+    return drift
+
+
+def compare_baseline(rows, path, tolerance):
+    with open(path) as f:
+        old = {_key(r): r for r in json.load(f)["results"]}
+    regressions = []
+    for r in rows:
+        o = old.get(_key(r))
+        if (o and r["rtf"] > o["rtf"] * (1 + tolerance)
+                and r["ms_per_chunk"] - o["ms_per_chunk"] > MIN_REGRESSION_MS):
+            regressions.append((_key(r), o["rtf"], r["rtf"]))
+    for key, before, after in regressions:
+        print(f"⚠ regression {'/'.join(map(str, key))}: rtf {before} → {after}")
+    if not regressions:
+        print(f"✓ no RTF regressions beyond {tolerance:.0%} against {path}")
+    return regressions
+
+
+def _key(row):
+    return (row["engine"], row["signal"], row["format"], row["chunk_ms"])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--seconds",   type=float, default=12.0, help="answer length per signal")
+    ap.add_argument("--chunk-ms",  default="250,500,1000,2000")
+    ap.add_argument("--signals",   default=",".join(SIGNALS))
+    ap.add_argument("--formats",   default=",".join(FORMATS))
+    ap.add_argument("--engines",   default="yin", help="pitch engines, e.g. yin,pyin")
+    ap.add_argument("--corpus",    help="directory of recorded speech files")
+    ap.add_argument("--whisper",   action="store_true",
+                    help="also transcribe voiced audio with TranscriptionService")
+    ap.add_argument("--repeats",   type=int,   default=3)
+    ap.add_argument("--seed",      type=int,   default=0)
+    ap.add_argument("--json",      help="write results to this file")
+    ap.add_argument("--baseline",  help="earlier --json output to check for regressions")
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    args = ap.parse_args()
+
+    chunk_sizes = [float(c) for c in args.chunk_ms.split(",")]
+    formats     = [f for f in args.formats.split(",") if f]
+    if not AV_AVAILABLE and any(f.startswith("webm") for f in formats):
+        print("⚠ PyAV not available — skipping the webm formats")
+        formats = [f for f in formats if not f.startswith("webm")]
+
+    signals = [(name, synthetic_signal(name, args.seconds, args.seed + i), True)
+               for i, name in enumerate(s for s in args.signals.split(",") if s)]
+    if args.corpus:
+        signals += [(name, y, False) for name, y in recorded_signals(args.corpus)]
+
+    transcription = None
+    if args.whisper:
+        from app.services.transcription_service import TranscriptionService
+        transcription = TranscriptionService()
+        if not transcription.available:
+            print("⚠ Whisper unavailable — transcription stage skipped")
+            transcription = None
+
+    rows = []
+    print(f"{'engine':6s} {'signal':10s} {'format':9s} {'chunk':>6s} "
+          f"{'ms/chunk':>9s} {'rtf':>8s} {'peak KiB':>9s}  slowest stages")
+    for engine in args.engines.split(","):
+        analyzer = AudioAnalyzer(pitch_engine=engine)
+        # Warm-up: first-call costs (imports, FFT plans, JIT) stay out of the rows
+        warm = synthetic_signal("speech", 2.0, args.seed)
+        run_answer(analyzer, make_chunks(warm, "pcm", 1000), [None, None])
+        for name, y, with_text in signals:
+            for fmt in formats:
+                for chunk_ms in chunk_sizes:
+                    r = measure(analyzer, y, fmt, chunk_ms, with_text,
+                                args.repeats, transcription)
+                    r.update(engine=engine, signal=name, format=fmt, chunk_ms=chunk_ms)
+                    rows.append(r)
+                    top = sorted(((s, v["mean_ms"]) for s, v in r["stages"].items()
+                                  if s != "total"), key=lambda x: -x[1])[:3]
+                    print(f"{engine:6s} {name[:10]:10s} {fmt:9s} {chunk_ms:6.0f} "
+                          f"{r['ms_per_chunk']:9.3f} {r['rtf']:8.5f} "
+                          f"{r['peak_kib_per_chunk']:9.1f}  "
+                          + ", ".join(f"{s} {ms:.2f}" for s, ms in top))
+
+    # Agreement: pcm and wav carry the same int16 samples
+    by_key = {_key(r): r for r in rows}
+    compared = mismatched = 0
+    for (engine, name, fmt, chunk_ms), r in by_key.items():
+        other = by_key.get((engine, name, "wav", chunk_ms))
+        if fmt == "pcm" and other is not None:
+            compared += 1
+            mismatched += r["snapshot"] != other["snapshot"]
+    if compared:
+        print(f"pcm vs wav snapshots differing: {mismatched}/{compared}")
+
+    # Cross-format: analysed chunks and snapshots against pcm
+    cross = {}
+    for (engine, name, fmt, chunk_ms), r in by_key.items():
+        ref = by_key.get((engine, name, "pcm", chunk_ms))
+        if fmt in ("pcm_48k", "webm") and ref is not None:
+            drift = snapshot_drift(r, ref)
+            cross.setdefault(fmt, [0, 0])[0] += 1
+            cross[fmt][1] += bool(drift)
+            if drift:
+                print(f"⚠ {engine}/{name}/{fmt}/{chunk_ms:.0f} disagrees with pcm: "
+                      + ", ".join(f"{f} {r[f] if f == 'analysed' else r['snapshot'][f]}"
+                                  f" vs {ref[f] if f == 'analysed' else ref['snapshot'][f]}"
+                                  for f in drift))
+    for fmt, (n, bad) in cross.items():
+        print(f"{fmt} vs pcm disagreeing: {bad}/{n}")
+
+    # Gap recovery: dropping one webm chunk costs at most MAX_DROP_LOSS chunks
+    drop_runs = unrecovered = 0
+    for (engine, name, fmt, chunk_ms), r in by_key.items():
+        full = by_key.get((engine, name, "webm", chunk_ms))
+        if fmt == "webm_drop" and full is not None:
+            drop_runs   += 1
+            unrecovered += full["analysed"] - r["analysed"] > MAX_DROP_LOSS
+    if drop_runs:
+        print(f"webm_drop runs losing more than {MAX_DROP_LOSS} chunks: "
+              f"{unrecovered}/{drop_runs}")
+
+    regressions = compare_baseline(rows, args.baseline, args.tolerance) if args.baseline else []
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "config":      vars(args),
+                "environment": {"python": platform.python_version(),
+                                "numpy": np.__version__, "librosa": librosa.__version__,
+                                "machine": platform.machine()},
+                "agreement":   {"compared": compared, "mismatched": mismatched,
+                                "cross_format": {f: {"compared": n, "mismatched": b}
+                                                 for f, (n, b) in cross.items()}},
+                "gap_recovery": {"runs": drop_runs, "unrecovered": unrecovered},
+                "regressions": [list(k) + [b, a] for k, b, a in regressions],
+                "results":     rows,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+bench_emotion_batching.py
+=========================
+Per-crop vs cross-session micro-batched HSEmotion inference.
+
+Simulates N concurrent interview sessions, each producing one face crop
+per processed frame, and pushes the crops through:
+  1. per-crop  : predict_emotions() straight from the worker pool (old path)
+  2. batched   : EmotionBatcher.predict() (new path)
+
+Reports throughput (crops/s) and p50 / p99 submit→result latency.
+
+Run from backend/:
+  python -m benchmarks.bench_emotion_batching --sessions 32 --fps 4
+  python -m benchmarks.bench_emotion_batching --synthetic      # no model needed
+  python -m benchmarks.bench_emotion_batching --json out.json
+
+--synthetic replaces HSEmotion with a cost model (fixed per-call overhead +
+per-crop compute, one run at a time) so batching behaviour can be checked
+on machines without the ONNX model.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.emotion_batcher import EmotionBatcher  # noqa: E402
+
+LABELS = ["Anger", "Contempt", "Disgust", "Fear",
+          "Happiness", "Neutral", "Sadness", "Surprise"]
+
+
+class SyntheticEmotionModel:
+    """Cost model of one ONNX session: overhead per run + cost per crop."""
+
+    def __init__(self, overhead_ms: float, per_crop_ms: float):
+        self.overhead = overhead_ms / 1000.0
+        self.per_crop = per_crop_ms / 1000.0
+        self._lock    = threading.Lock()   # runs contend for the same cores
+
+    def _scores(self):
+        s = np.random.rand(len(LABELS)).astype(np.float32)
+        return s / s.sum()
+
+    def predict_emotions(self, crop, logits=False):
+        with self._lock:
+            time.sleep(self.overhead + self.per_crop)
+        scores = self._scores()
+        return LABELS[int(np.argmax(scores))], scores
+
+    def predict_multi_emotions(self, crops, logits=False):
+        with self._lock:
+            time.sleep(self.overhead + self.per_crop * len(crops))
+        scores = [self._scores() for _ in crops]
+        return [LABELS[int(np.argmax(s))] for s in scores], np.stack(scores)
+
+
+def load_model(args):
+    if args.synthetic:
+        return SyntheticEmotionModel(args.overhead_ms, args.per_crop_ms)
+    from hsemotion_onnx.facial_emotions import HSEmotionRecognizer
+    return HSEmotionRecognizer(model_name="enet_b2_8")
+
+
+def run_load(predict, sessions: int, fps: float, duration: float, workers: int):
+    """Fire crops at sessions*fps per second; return (latencies, elapsed)."""
+    crop      = (np.random.rand(224, 224, 3) * 255).astype(np.uint8)
+    interval  = 1.0 / (sessions * fps)
+    total     = int(sessions * fps * duration)
+    latencies = []
+    lock      = threading.Lock()
+
+    def task(t_submit):
+        predict(crop)
+        with lock:
+            latencies.append(time.perf_counter() - t_submit)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for i in range(total):
+            target = start + i * interval
+            delay  = target - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(task, time.perf_counter())
+    elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def summarise(name, latencies, elapsed):
+    lat = np.array(latencies) * 1000.0
+    return {
+        "path":           name,
+        "crops":          len(latencies),
+        "throughput_cps": round(len(latencies) / elapsed, 1),
+        "p50_ms":         round(float(np.percentile(lat, 50)), 2),
+        "p99_ms":         round(float(np.percentile(lat, 99)), 2),
+        "max_ms":         round(float(lat.max()), 2),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sessions",     type=int,   default=32)
+    ap.add_argument("--fps",          type=float, default=2.0,
+                    help="emotion crops per session per second")
+    ap.add_argument("--duration",     type=float, default=10.0)
+    ap.add_argument("--workers",      type=int,   default=0,
+                    help="analysis threads (default: one per session)")
+    ap.add_argument("--max-batch",    type=int,   default=16)
+    ap.add_argument("--max-wait-ms",  type=float, default=4.0)
+    ap.add_argument("--synthetic",    action="store_true")
+    ap.add_argument("--overhead-ms",  type=float, default=6.0)
+    ap.add_argument("--per-crop-ms",  type=float, default=1.5)
+    ap.add_argument("--json",         help="write results to this file")
+    args = ap.parse_args()
+    args.workers = args.workers or args.sessions
+
+    model = load_model(args)
+    results = []
+
+    lat, el = run_load(lambda c: model.predict_emotions(c, logits=False),
+                       args.sessions, args.fps, args.duration, args.workers)
+    results.append(summarise("per_crop", lat, el))
+
+    batcher = EmotionBatcher(model, args.max_batch, args.max_wait_ms)
+    lat, el = run_load(batcher.predict,
+                       args.sessions, args.fps, args.duration, args.workers)
+    batched = summarise("batched", lat, el)
+    batched.update(batcher.stats())
+    batcher.close()
+    results.append(batched)
+
+    for r in results:
+        print(f"{r['path']:>9}: {r['throughput_cps']:8.1f} crops/s   "
+              f"p50 {r['p50_ms']:7.2f} ms   p99 {r['p99_ms']:8.2f} ms")
+    print(f"   batches: avg size {batched['avg_batch_size']}, "
+          f"largest {batched['largest_batch']}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+bench_landmark_geometry.py
+==========================
+Per-frame cost of the landmark geometry stage in VideoAnalyzer.
+
+Compares:
+  1. dict    : landmarks as a dict of Python (x, y, z) tuples with scalar
+               arithmetic per metric (the previous implementation, kept
+               here as a reference copy)
+  2. ndarray : landmarks gathered once into a float32 (N, 3) array, pixel
+               coords truncated during the gather; every pairwise offset
+               (EAR / gaze / head pose / tilt) comes from one fancy-index
+               gather, the bbox once per frame (VideoAnalyzer as shipped)
+
+Both paths run on the same synthetic FaceMesh results (478 jittered
+points, as the NormalizedLandmarkList protobufs FaceMesh returns), and
+their outputs are checked for agreement before timing. Reading the
+protobuf fields is most of the cost on either path. Repeats alternate
+between the two paths so clock drift does not favour one. MediaPipe
+inference itself is not run — only extraction + geometry are measured.
+
+Run from backend/:
+  python -m benchmarks.bench_landmark_geometry
+  python -m benchmarks.bench_landmark_geometry --frames 20000 --json out.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+from mediapipe.framework.formats import landmark_pb2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.video_analyzer import (  # noqa: E402
+    VideoAnalyzer, LANDMARK_INDICES, EAR_CLOSED_THRESH,
+    HEAD_HORIZ_THRESH, HEAD_VERT_DOWN_THRESH, HEAD_VERT_UP_THRESH,
+)
+
+FRAME_SHAPE = (720, 1280, 3)
+
+
+# ─────────────────────────── Synthetic FaceMesh output ───────────────────────
+
+def synthetic_faces(n: int, seed: int = 0):
+    """n FaceMesh-like results: centred face with per-frame jitter."""
+    rng  = np.random.default_rng(seed)
+    base = rng.uniform(0.35, 0.65, size=(478, 3))
+    base[:, 2] = rng.normal(0, 0.02, 478)
+    faces = []
+    for _ in range(n):
+        face = landmark_pb2.NormalizedLandmarkList()
+        for x, y, z in base + rng.normal(0, 0.004, base.shape):
+            face.landmark.add(x=x, y=y, z=z)
+        faces.append(face)
+    return faces
+
+
+# ─────────────────────────── Reference dict implementation ───────────────────
+
+def dict_extract(face_lm, image_shape):
+    h, w = image_shape[:2]
+    def g(i):
+        p = face_lm.landmark[i]
+        return (int(p.x * w), int(p.y * h), p.z)
+    return {name: g(i) for name, i in LANDMARK_INDICES.items()}
+
+
+def dict_ear(lm):
+    def one(top, bot, left, right):
+        v = abs(top[1] - bot[1])
+        h = abs(left[0] - right[0])
+        return v / h if h else 0.0
+    l = one(lm["left_eye_top"],  lm["left_eye_bottom"],
+            lm["left_eye_left"], lm["left_eye_right"])
+    r = one(lm["right_eye_top"], lm["right_eye_bottom"],
+            lm["right_eye_left"], lm["right_eye_right"])
+    return (l + r) / 2
+
+
+def dict_eye_contact(lm):
+    nx  = lm["nose_tip"][0]
+    cx  = (lm["left_face"][0] + lm["right_face"][0]) / 2
+    fw  = lm["right_face"][0] - lm["left_face"][0]
+    off = abs(nx - cx) / fw if fw else 0
+    ear = dict_ear(lm)
+    score = 0.0 if ear < EAR_CLOSED_THRESH else max(0.0, 100.0 - off * 200.0)
+    return {"score": round(score, 1), "ear": round(ear, 3)}
+
+
+def dict_head_pose(lm):
+    nx, ny, _ = lm["nose_tip"]
+    cy = lm["chin"][1]
+    lx, rx = lm["left_face"][0], lm["right_face"][0]
+    fw = rx - lx
+    h_off = (nx - (lx + rx) / 2) / fw if fw else 0
+    v_off = (ny - cy) / fw if fw else 0
+    if abs(h_off) > HEAD_HORIZ_THRESH:
+        pos = "turned_left" if h_off < 0 else "turned_right"
+    elif v_off > -HEAD_VERT_DOWN_THRESH:
+        pos = "looking_down"
+    elif v_off < -HEAD_VERT_UP_THRESH:
+        pos = "looking_up"
+    else:
+        pos = "neutral"
+    tilt = np.degrees(np.arctan2(
+        lm["mouth_right"][1] - lm["mouth_left"][1],
+        lm["mouth_right"][0] - lm["mouth_left"][0],
+    ))
+    return {"position": pos, "tilt_angle": round(tilt, 1),
+            "horizontal_offset": round(h_off, 3)}
+
+
+def dict_movement(curr, prev):
+    d = np.sqrt((curr["nose_tip"][0] - prev["nose_tip"][0]) ** 2 +
+                (curr["nose_tip"][1] - prev["nose_tip"][1]) ** 2)
+    return round(d, 2)
+
+
+def dict_bbox(lm):
+    xs = [lm[k][0] for k in lm]
+    ys = [lm[k][1] for k in lm]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def dict_frame(face_lm, prev):
+    lm = dict_extract(face_lm, FRAME_SHAPE)
+    out = (dict_eye_contact(lm), dict_head_pose(lm),
+           dict_movement(lm, prev) if prev else None, dict_bbox(lm))
+    return lm, out
+
+
+# ─────────────────────────── Shipped ndarray implementation ──────────────────
+
+def array_frame(va, face_lm, prev):
+    lm   = va._extract_landmarks(face_lm, FRAME_SHAPE)
+    geo  = va._face_geometry(lm)
+    eye  = va._analyze_eye_contact(geo)
+    pose = va._analyze_head_pose(geo)
+    out = ({"score": eye["score"], "ear": eye["ear"]},
+           {k: pose[k] for k in ("position", "tilt_angle", "horizontal_offset")},
+           va._detect_head_movement(lm, prev)["distance"] if prev is not None else None,
+           va._face_bbox(lm))
+    return lm, out
+
+
+# ─────────────────────────── Harness ─────────────────────────────────────────
+
+def run(step, faces):
+    prev, t0 = None, time.perf_counter()
+    for f in faces:
+        prev, _ = step(f, prev)
+    return (time.perf_counter() - t0) / len(faces) * 1e6   # µs / frame
+
+
+def check_agreement(va, faces):
+    mismatches, prev_d, prev_a = 0, None, None
+    for f in faces:
+        prev_d, a = dict_frame(f, prev_d)
+        prev_a, b = array_frame(va, f, prev_a)
+        if a != b:
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--frames",  type=int, default=5000)
+    ap.add_argument("--repeats", type=int, default=5)
+    ap.add_argument("--json",    help="write results to this file")
+    args = ap.parse_args()
+
+    va    = VideoAnalyzer()
+    faces = synthetic_faces(args.frames)
+
+    mismatches = check_agreement(va, faces[:1000])
+
+    dict_runs, array_runs = [], []
+    for _ in range(args.repeats):
+        dict_runs.append(run(dict_frame, faces))
+        array_runs.append(run(lambda f, p: array_frame(va, f, p), faces))
+    dict_us, array_us = min(dict_runs), min(array_runs)
+
+    results = {
+        "frames":            args.frames,
+        "dict_us_per_frame":  round(dict_us, 2),
+        "array_us_per_frame": round(array_us, 2),
+        "speedup":           round(dict_us / array_us, 2),
+        "mismatched_frames": mismatches,
+    }
+    print(f"   dict: {dict_us:8.2f} µs/frame")
+    print(f"ndarray: {array_us:8.2f} µs/frame   ({results['speedup']}x)")
+    print(f"outputs differing on {mismatches}/1000 frames")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
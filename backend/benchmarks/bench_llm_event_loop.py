@@ -0,0 +1,205 @@
+"""
+bench_llm_event_loop.py
+=======================
+Does an LLM call in flight stall every other session on the worker?
+
+A slow local stand-in for the Groq API (OpenAI-compatible
+/chat/completions, answering after --delay seconds) runs in its own
+thread. Meanwhile --sessions simulated sessions each ping every
+--ping-ms; a per-session handler task answers each ping from its control
+queue, like the websocket main loop does, and the ping → pong latency is
+recorded. Three phases:
+
+  1. idle  : no LLM call in flight (the floor)
+  2. sync  : --evaluations concurrent evaluations through the synchronous
+             groq.Groq client called inside `async def` (the previous
+             LLMService) — each round-trip blocks the event loop
+  3. async : the same evaluations through LLMService as shipped (AsyncGroq,
+             one pooled client, per-call timeout, concurrency cap)
+
+Pong latency should stay at the idle floor in phase 3. Evaluation wall
+time shows the cap: with --evaluations above llm_max_concurrency the calls
+run in waves.
+
+Run from backend/:
+  python -m benchmarks.bench_llm_event_loop
+  python -m benchmarks.bench_llm_event_loop --delay 1.0 --evaluations 16 --json out.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from groq import Groq                              # noqa: E402
+from app.config import settings                    # noqa: E402
+from app.services.llm_service import LLMService    # noqa: E402
+
+EVALUATION = json.dumps({
+    "relevance_score": 70, "clarity_score": 70, "completeness_score": 70,
+    "specificity_score": 70, "overall_score": 70, "strengths": ["clear"],
+    "improvements": ["add numbers"], "feedback": "Solid answer.",
+    "needs_follow_up": False,
+})
+
+
+# ─────────────────────────── Stand-in server ─────────────────────────────────
+
+def start_server(delay: float):
+    """Groq-compatible chat completions endpoint that answers after `delay` s."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(delay)
+            body = json.dumps({
+                "id": "bench", "object": "chat.completion", "created": int(time.time()),
+                "model": "stand-in",
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": EVALUATION}}],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+# ─────────────────────────── Sessions ────────────────────────────────────────
+
+async def session(ping_ms: float, stop: asyncio.Event, latencies: list):
+    """
+    Client pings every ping_ms on its own clock; a handler task answers
+    them from the control queue. Pings that "arrived" while the loop was
+    blocked are enqueued late, with their original send time.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def handler():
+        while True:
+            sent = await queue.get()
+            latencies.append((time.perf_counter() - sent) * 1000.0)   # "pong"
+
+    task     = asyncio.create_task(handler())
+    interval = ping_ms / 1000.0
+    next_at  = time.perf_counter()
+    while not stop.is_set():
+        now = time.perf_counter()
+        while next_at <= now:
+            queue.put_nowait(next_at)
+            next_at += interval
+        await asyncio.sleep(next_at - now)
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+
+async def sync_evaluation(client: Groq):
+    """The previous LLMService call: a blocking request inside async def."""
+    response = client.chat.completions.create(
+        messages=[{"role": "user", "content": "evaluate"}],
+        model="stand-in", temperature=0.3, max_tokens=600,
+    )
+    return json.loads(response.choices[0].message.content)
+
+
+async def phase(args, evaluations):
+    latencies: list = []
+    stop = asyncio.Event()
+    sessions = [asyncio.create_task(session(args.ping_ms, stop, latencies))
+                for _ in range(args.sessions)]
+    await asyncio.sleep(0.2)                      # settle
+
+    t = time.perf_counter()
+    if evaluations is None:
+        await asyncio.sleep(args.delay * 2)
+    else:
+        await asyncio.gather(*(evaluations() for _ in range(args.evaluations)))
+    wall = time.perf_counter() - t
+
+    await asyncio.sleep(0.2)                      # let late pongs drain
+    stop.set()
+    await asyncio.gather(*sessions)
+    lat = np.array(latencies)
+    return {
+        "evaluations_wall_s": round(wall, 3) if evaluations is not None else None,
+        "pongs":              len(lat),
+        "pong_p50_ms":        round(float(np.percentile(lat, 50)), 2),
+        "pong_p99_ms":        round(float(np.percentile(lat, 99)), 2),
+        "pong_max_ms":        round(float(lat.max()), 2),
+    }
+
+
+async def run(args, url):
+    sync_client = Groq(api_key="bench", base_url=url, max_retries=0,
+                       http_client=httpx.Client())
+    service     = LLMService()
+
+    async def async_evaluation():
+        return await service.evaluate_answer_quality(
+            question="Tell me about a time you led a team.",
+            answer="I led a team of five engineers and we shipped on time.")
+
+    results = {
+        "idle":  await phase(args, None),
+        "sync":  await phase(args, lambda: sync_evaluation(sync_client)),
+        "async": await phase(args, async_evaluation),
+    }
+    results["async"]["llm"] = service.get_timings()
+    await service.close()
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--delay",       type=float, default=0.5, help="stand-in response time (s)")
+    ap.add_argument("--sessions",    type=int,   default=20)
+    ap.add_argument("--ping-ms",     type=float, default=50.0)
+    ap.add_argument("--evaluations", type=int,   default=4)
+    ap.add_argument("--cap",         type=int,   default=None,
+                    help="override settings.llm_max_concurrency")
+    ap.add_argument("--json",        help="write results to this file")
+    args = ap.parse_args()
+
+    server, url = start_server(args.delay)
+    settings.GROQ_API_KEY = settings.GROQ_API_KEY or "bench"
+    settings.llm_base_url = url
+    if args.cap:
+        settings.llm_max_concurrency = args.cap
+
+    results = asyncio.run(run(args, url))
+    server.shutdown()
+
+    print(f"{'phase':6s} {'pong p50':>9s} {'p99':>9s} {'max':>9s}  evaluations wall")
+    for name, r in results.items():
+        wall = f"{r['evaluations_wall_s']:.2f} s" if r["evaluations_wall_s"] else "-"
+        print(f"{name:6s} {r['pong_p50_ms']:9.2f} {r['pong_p99_ms']:9.2f} "
+              f"{r['pong_max_ms']:9.2f}  {wall}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
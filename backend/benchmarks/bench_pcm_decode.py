@@ -0,0 +1,161 @@
+"""
+bench_pcm_decode.py
+===================
+Decode + resample cost per second of audio, for each client input format.
+
+For every format the same chunked stream is pushed through:
+  1. wav     : each chunk wrapped as a WAV file and read with
+               librosa.load(sr=16000) — the container path every chunk
+               used to take
+  2. librosa : raw PCM, then librosa.resample per chunk (stateless — the
+               previous raw-PCM path; same soxr filter, rebuilt per chunk)
+  3. native  : AudioAnalyzer.decode_chunk with the declared PCM codec —
+               no resampling at 16 kHz, else the session's
+               StreamingResampler (AudioAnalyzer as shipped)
+
+Agreement: the native stream is compared with soxr.resample over the
+WHOLE signal — carrying the filter state across chunks, it should match
+exactly (up to the tail still held in the filter).
+
+Run from backend/:
+  python -m benchmarks.bench_pcm_decode
+  python -m benchmarks.bench_pcm_decode --seconds 30 --chunk-ms 250 --json out.json
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+import librosa
+import numpy as np
+import soundfile as sf
+import soxr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.audio_analyzer import AudioAnalyzer, AudioSessionState  # noqa: E402
+from benchmarks.bench_pitch_engines import synthetic_utterance           # noqa: E402
+
+TARGET_SR = 16000
+
+# (name, codec, source rate, channels)
+FORMATS = [
+    ("s16_16k_mono",   "pcm_s16le", 16000, 1),
+    ("f32_16k_mono",   "pcm_f32le", 16000, 1),
+    ("s16_48k_stereo", "pcm_s16le", 48000, 2),
+    ("f32_44k1_mono",  "pcm_f32le", 44100, 1),
+    ("s16_22k05_mono", "pcm_s16le", 22050, 1),
+]
+
+
+def make_stream(rate: int, seconds: float, rng) -> np.ndarray:
+    """Synthetic speech at `rate` (generated at 16 kHz, upsampled exactly)."""
+    y, _ = synthetic_utterance(rng.uniform(90, 250), seconds, rng)
+    if rate != TARGET_SR:
+        y = librosa.resample(y, orig_sr=TARGET_SR, target_sr=rate, res_type="polyphase")
+    return np.clip(y, -0.99, 0.99).astype(np.float32)
+
+
+def encode(samples: np.ndarray, codec: str, channels: int) -> bytes:
+    x = np.repeat(samples[:, None], channels, axis=1).reshape(-1)
+    if codec == "pcm_s16le":
+        return (x * 32767).astype("<i2").tobytes()
+    return x.astype("<f4").tobytes()
+
+
+def wav_bytes(samples: np.ndarray, rate: int, codec: str, channels: int) -> bytes:
+    buf = io.BytesIO()
+    x   = np.repeat(samples[:, None], channels, axis=1)
+    sf.write(buf, x, rate, format="WAV",
+             subtype="PCM_16" if codec == "pcm_s16le" else "FLOAT")
+    return buf.getvalue()
+
+
+def decode_librosa(payload: bytes, codec: str, rate: int, channels: int) -> np.ndarray:
+    """Reference copy of the previous _decode_pcm (stateless resample)."""
+    if codec == "pcm_s16le":
+        y = np.frombuffer(payload, dtype="<i2").astype(np.float32) / 32768.0
+    else:
+        y = np.frombuffer(payload, dtype="<f4")
+    if channels > 1:
+        y = y.reshape(-1, channels).mean(axis=1)
+    if rate != TARGET_SR:
+        y = librosa.resample(y, orig_sr=rate, target_sr=TARGET_SR)
+    return y.astype(np.float32, copy=False)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--seconds",  type=float, default=20.0)
+    ap.add_argument("--chunk-ms", type=float, default=250.0)
+    ap.add_argument("--repeats",  type=int,   default=3)
+    ap.add_argument("--json",     help="write results to this file")
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    # Only the decode helpers are used — skip model loading
+    analyzer = AudioAnalyzer.__new__(AudioAnalyzer)
+
+    results = {}
+    print(f"{'format':16s} {'wav':>9s} {'librosa':>9s} {'native':>9s}   ms per audio second")
+    for name, codec, rate, channels in FORMATS:
+        stream = make_stream(rate, args.seconds, rng)
+        step   = int(rate * args.chunk_ms / 1000)
+        chunks = [stream[i:i + step] for i in range(0, len(stream), step)]
+        wavs   = [wav_bytes(c, rate, codec, channels) for c in chunks]
+        raws   = [encode(c, codec, channels) for c in chunks]
+
+        def run_wav():
+            return [librosa.load(io.BytesIO(w), sr=TARGET_SR)[0] for w in wavs]
+
+        def run_librosa():
+            return [decode_librosa(r, codec, rate, channels) for r in raws]
+
+        def run_native():
+            state = AudioSessionState()
+            return [analyzer.decode_chunk(state, r, TARGET_SR, codec, rate, channels)[0]
+                    for r in raws]
+
+        def best(fn):
+            times = []
+            for _ in range(args.repeats):
+                t = time.perf_counter()
+                out = fn()
+                times.append(time.perf_counter() - t)
+            return min(times) * 1000.0 / args.seconds, np.concatenate(out)
+
+        wav_ms,     wav_out    = best(run_wav)
+        librosa_ms, _          = best(run_librosa)
+        native_ms,  native_out = best(run_native)
+
+        # Agreement: streaming == one resample over the whole (downmixed) stream
+        mono = np.concatenate([decode_librosa(r, codec, TARGET_SR, channels) for r in raws])
+        ref  = soxr.resample(mono, rate, TARGET_SR, quality="HQ") if rate != TARGET_SR \
+            else mono
+        n       = min(len(native_out), len(ref))
+        max_err = float(np.abs(native_out[:n] - ref[:n]).max())
+
+        results[name] = {
+            "wav_ms_per_s":         round(wav_ms, 3),
+            "librosa_ms_per_s":     round(librosa_ms, 3),
+            "native_ms_per_s":      round(native_ms, 3),
+            "speedup_vs_wav":       round(wav_ms / native_ms, 1),
+            "speedup_vs_librosa":   round(librosa_ms / native_ms, 1),
+            "max_err_vs_whole_stream": max_err,
+            "held_in_filter_ms":    round((len(ref) - len(native_out)) / TARGET_SR * 1000, 1),
+        }
+        print(f"{name:16s} {wav_ms:9.3f} {librosa_ms:9.3f} {native_ms:9.3f}   "
+              f"(x{results[name]['speedup_vs_wav']} vs wav, "
+              f"x{results[name]['speedup_vs_librosa']} vs librosa, max err {max_err:.1e})")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+bench_pitch_engines.py
+======================
+Accuracy vs speed of the AudioAnalyzer pitch engines, per audio chunk.
+
+Compares:
+  1. pyin : librosa.pyin over C2–C7 (the "accurate" engine, the reference)
+  2. yin  : vectorized YIN on 8 kHz audio, speech range, energy-gated
+            frames only (app/services/pitch_tracker.py)
+
+Both engines see the same chunks and go through the same summarise_pitch(),
+so the numbers compared are exactly the mean_pitch / variation the app
+reports. Errors are given against pyin and, for synthetic audio, against
+the known F0 contour.
+
+Corpora:
+  - synthetic (always): formant-filtered glottal pulse trains with
+    declination + pitch accents, vibrato, pauses, fricative noise and
+    background noise, for low / mid / high voices.
+  - recorded (--corpus DIR): every wav / flac / ogg / mp3 / webm file under
+    DIR, loaded at the analysis rate and cut into chunks. No recordings
+    are shipped with the repo — point this at the speech you deploy for.
+
+Run from backend/:
+  python -m benchmarks.bench_pitch_engines
+  python -m benchmarks.bench_pitch_engines --corpus ~/speech --json out.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+from scipy.signal import lfilter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.pitch_tracker import PITCH_ENGINES, summarise_pitch  # noqa: E402
+
+SR           = 16000
+AUDIO_EXTS   = (".wav", ".flac", ".ogg", ".mp3", ".webm")
+VOICES       = {"low": 105.0, "mid": 150.0, "high": 220.0}
+
+
+# ─────────────────────────── Synthetic speech ────────────────────────────────
+
+def _resonator(x: np.ndarray, freq: float, bw: float) -> np.ndarray:
+    r     = np.exp(-np.pi * bw / SR)
+    theta = 2 * np.pi * freq / SR
+    return lfilter([1 - r], [1, -2 * r * np.cos(theta), r * r], x)
+
+
+def synthetic_utterance(base_f0: float, seconds: float, rng):
+    """(audio, true_f0_per_sample with NaN where unvoiced) for one speaker."""
+    n     = int(seconds * SR)
+    t     = np.arange(n) / SR
+    f0    = base_f0 * (1.15 - 0.25 * t / seconds)                # declination
+    for _ in range(int(seconds * 1.5)):                          # pitch accents
+        c = rng.uniform(0, seconds)
+        f0 *= 1 + rng.uniform(0.08, 0.25) * np.exp(-((t - c) / 0.12) ** 2)
+    f0 *= 1 + 0.01 * np.sin(2 * np.pi * 5.5 * t)                 # vibrato
+
+    # Words: voiced stretches separated by pauses and fricatives
+    voiced = np.zeros(n, dtype=bool)
+    pos = int(rng.uniform(0.05, 0.2) * SR)
+    while pos < n:
+        word = int(rng.uniform(0.15, 0.45) * SR)
+        voiced[pos:pos + word] = True
+        pos += word + int(rng.uniform(0.06, 0.3) * SR)
+
+    # Glottal pulse train → vocal tract formants
+    phase  = np.cumsum(f0 / SR)
+    pulses = np.diff(np.floor(phase), prepend=0.0) * voiced
+    source = lfilter([1.0], [1, -0.95], pulses)
+    vowel  = sum(_resonator(source, f, bw) * g for f, bw, g in
+                 ((rng.uniform(500, 800), 80, 1.0),
+                  (rng.uniform(1100, 1800), 100, 0.5),
+                  (rng.uniform(2400, 2900), 150, 0.25)))
+    vowel /= np.max(np.abs(vowel)) + 1e-9
+
+    # Fricatives at some word onsets, plus room noise at ~25 dB SNR
+    onsets = np.flatnonzero(np.diff(voiced.astype(int)) == 1)
+    for o in onsets[rng.random(len(onsets)) < 0.4]:
+        m = int(0.06 * SR)
+        s = max(0, o - m)
+        vowel[s:o] += lfilter([1, -1], [1], rng.normal(0, 0.15, o - s))
+    vowel += rng.normal(0, 0.056 * np.std(vowel), n)
+
+    return vowel.astype(np.float32), np.where(voiced, f0, np.nan)
+
+
+def synthetic_chunks(chunk_s: float, per_voice: int, seed: int = 0):
+    rng, chunks = np.random.default_rng(seed), []
+    for name, f0 in VOICES.items():
+        for _ in range(per_voice):
+            y, true_f0 = synthetic_utterance(f0 * rng.uniform(0.9, 1.1), chunk_s, rng)
+            chunks.append({"source": f"synthetic/{name}", "audio": y,
+                           "truth": summarise_pitch(true_f0)})
+    return chunks
+
+
+# ─────────────────────────── Recorded speech ─────────────────────────────────
+
+def recorded_chunks(root: str, chunk_s: float):
+    import librosa
+    chunks, step = [], int(chunk_s * SR)
+    for dirpath, _, files in os.walk(root):
+        for fname in sorted(files):
+            if not fname.lower().endswith(AUDIO_EXTS):
+                continue
+            path = os.path.join(dirpath, fname)
+            try:
+                y, _ = librosa.load(path, sr=SR, mono=True)
+            except Exception as e:
+                print(f"⚠ Skipping {path}: {e}")
+                continue
+            for s in range(0, len(y) - step + 1, step):
+                chunks.append({"source": os.path.relpath(path, root),
+                               "audio": y[s:s + step], "truth": None})
+    return chunks
+
+
+# ─────────────────────────── Measurement ─────────────────────────────────────
+
+def run_engine(engine: str, chunks):
+    track, out = PITCH_ENGINES[engine], []
+    for c in chunks:
+        t = time.perf_counter()
+        summary = summarise_pitch(track(c["audio"], SR))
+        out.append((summary, (time.perf_counter() - t) * 1000.0))
+    return out
+
+
+def compare(results, reference):
+    """Errors of `results` against `reference` summaries (both voiced only)."""
+    mean_err, rel_err, var_err, skipped = [], [], [], 0
+    for got, ref in zip(results, reference):
+        if ref is None or not ref["mean_pitch"] or not got["mean_pitch"]:
+            skipped += 1
+            continue
+        d = abs(got["mean_pitch"] - ref["mean_pitch"])
+        mean_err.append(d)
+        rel_err.append(100.0 * d / ref["mean_pitch"])
+        var_err.append(abs(got["variation"] - ref["variation"]))
+    if not mean_err:
+        return {"chunks": 0, "skipped": skipped}
+    return {
+        "chunks":                len(mean_err),
+        "skipped":               skipped,
+        "mean_pitch_mae_hz":     round(float(np.mean(mean_err)), 2),
+        "mean_pitch_p90_hz":     round(float(np.percentile(mean_err, 90)), 2),
+        "mean_pitch_mae_pct":    round(float(np.mean(rel_err)), 2),
+        "variation_mae_pts":     round(float(np.mean(var_err)), 2),
+        "variation_p90_pts":     round(float(np.percentile(var_err, 90)), 2),
+    }
+
+
+def evaluate(label: str, chunks):
+    runs = {e: run_engine(e, chunks) for e in PITCH_ENGINES}
+    pyin = [s for s, _ in runs["pyin"]]
+    truth = [c["truth"] for c in chunks]
+    has_truth = any(t is not None for t in truth)
+
+    report = {"chunks": len(chunks), "engines": {}}
+    for engine, res in runs.items():
+        summaries = [s for s, _ in res]
+        ms = np.array([m for _, m in res])
+        entry = {
+            "ms_per_chunk_mean": round(float(ms.mean()), 2),
+            "ms_per_chunk_p90":  round(float(np.percentile(ms, 90)), 2),
+            "vs_pyin":           compare(summaries, pyin) if engine != "pyin" else None,
+            "vs_truth":          compare(summaries, truth) if has_truth else None,
+        }
+        report["engines"][engine] = entry
+
+    base = report["engines"]["pyin"]["ms_per_chunk_mean"]
+    print(f"\n── {label}: {len(chunks)} chunks " + "─" * 40)
+    for engine, e in report["engines"].items():
+        speed = base / e["ms_per_chunk_mean"] if e["ms_per_chunk_mean"] else 0.0
+        print(f"{engine:>5}: {e['ms_per_chunk_mean']:8.2f} ms/chunk  ({speed:5.1f}x vs pyin)")
+        for key in ("vs_pyin", "vs_truth"):
+            err = e[key]
+            if err and err.get("chunks"):
+                print(f"       {key:<8}  mean_pitch MAE {err['mean_pitch_mae_hz']:6.2f} Hz "
+                      f"({err['mean_pitch_mae_pct']:.2f}%)  "
+                      f"variation MAE {err['variation_mae_pts']:5.2f} pts  "
+                      f"[{err['chunks']} chunks]")
+    return report
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--corpus",        help="directory of recorded speech files")
+    ap.add_argument("--chunk-seconds", type=float, default=2.0)
+    ap.add_argument("--per-voice",     type=int,   default=10,
+                    help="synthetic chunks per voice range")
+    ap.add_argument("--json",          help="write results to this file")
+    args = ap.parse_args()
+
+    results = {"synthetic": evaluate(
+        "synthetic", synthetic_chunks(args.chunk_seconds, args.per_voice))}
+
+    if args.corpus:
+        chunks = recorded_chunks(args.corpus, args.chunk_seconds)
+        if chunks:
+            results["recorded"] = evaluate(f"recorded ({args.corpus})", chunks)
+        else:
+            print(f"⚠ No audio found under {args.corpus}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
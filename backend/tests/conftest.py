@@ -0,0 +1,15 @@
+"""
+Shared setup for the backend unit tests.
+
+Run from backend/:  python -m pytest tests
+Settings() requires these; the tests never reach MongoDB or an LLM.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("MONGODB_URL",    "mongodb://localhost:27017")
+os.environ.setdefault("DATABASE_NAME",  "interview_test")
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
@@ -0,0 +1,91 @@
+"""confidence_band / evaluation_tier: band width, clamping and tier choice."""
+
+import pytest
+
+from app.config import settings
+from app.services.answer_scorer import (
+    COMPOSITE_WEIGHTS, MAX_BAND_HALF_WIDTH, MIN_BAND_HALF_WIDTH, confidence_band,
+)
+from app.services.llm_service import LLMService
+
+
+def pre_score(*components, composite=None):
+    """Pre-score dict with the six components in COMPOSITE_WEIGHTS order."""
+    score = dict(zip(COMPOSITE_WEIGHTS, components))
+    if composite is None:
+        composite = sum(score[k] * w for k, w in COMPOSITE_WEIGHTS.items())
+    score["composite_pre_score"] = composite
+    return score
+
+
+class FakeSurrogate:
+    def __init__(self, score):
+        self.score = score
+
+    def predict(self, pre_score, expected_type):
+        return self.score
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    service = LLMService()
+    service.surrogate = None
+    monkeypatch.setattr(settings, "eval_tiering", True)
+    monkeypatch.setattr(settings, "eval_local_weak_below", 45.0)
+    monkeypatch.setattr(settings, "eval_local_strong_above", 75.0)
+    return service
+
+
+def test_agreeing_components_give_the_narrowest_band():
+    assert confidence_band(pre_score(60, 60, 60, 60, 60, 60)) == \
+        (60 - MIN_BAND_HALF_WIDTH, 60 + MIN_BAND_HALF_WIDTH)
+
+
+def test_mixed_components_widen_the_band_up_to_the_clamp():
+    low, high = confidence_band(pre_score(100, 0, 100, 0, 100, 0))
+    assert high - low == pytest.approx(2 * MAX_BAND_HALF_WIDTH)
+
+    low, high = confidence_band(pre_score(90, 40, 80, 30, 70, 50))
+    assert 2 * MIN_BAND_HALF_WIDTH < high - low < 2 * MAX_BAND_HALF_WIDTH
+
+
+def test_band_is_centred_on_the_given_anchor_and_kept_in_range():
+    score = pre_score(60, 60, 60, 60, 60, 60)
+    assert confidence_band(score, centre=80) == (75.0, 85.0)
+    assert confidence_band(pre_score(2, 2, 2, 2, 2, 2)) == (0.0, 7.0)
+    assert confidence_band(pre_score(98, 98, 98, 98, 98, 98)) == (93.0, 100.0)
+
+
+def test_missing_components_count_as_zero():
+    assert confidence_band({}) == (0.0, MIN_BAND_HALF_WIDTH)
+
+
+def test_decisive_pre_scores_are_evaluated_locally(llm):
+    assert llm.evaluation_tier(pre_score(30, 30, 30, 30, 30, 30)) == "local_weak"
+    assert llm.evaluation_tier(pre_score(90, 90, 90, 90, 90, 90)) == "local_strong"
+
+
+def test_band_touching_a_threshold_goes_to_the_llm(llm):
+    # 40 ± 5 reaches 45, 80 ± 5 reaches 75: neither lies strictly outside
+    assert llm.evaluation_tier(pre_score(40, 40, 40, 40, 40, 40)) == "llm"
+    assert llm.evaluation_tier(pre_score(80, 80, 80, 80, 80, 80)) == "llm"
+    # a decisive composite with mixed components is still uncertain
+    assert llm.evaluation_tier(pre_score(100, 0, 100, 0, 100, 0, composite=30)) == "llm"
+
+
+def test_missing_or_empty_pre_score_goes_to_the_llm(llm):
+    assert llm.evaluation_tier(None) == "llm"
+    assert llm.evaluation_tier({}) == "llm"
+    assert llm.evaluation_tier(pre_score(0, 0, 0, 0, 0, 0)) == "llm"
+
+
+def test_tiering_can_be_switched_off(llm, monkeypatch):
+    monkeypatch.setattr(settings, "eval_tiering", False)
+    assert llm.evaluation_tier(pre_score(30, 30, 30, 30, 30, 30)) == "llm"
+
+
+def test_band_follows_the_surrogate_anchor(llm):
+    llm.surrogate = FakeSurrogate(90.0)
+    assert llm.evaluation_tier(pre_score(60, 60, 60, 60, 60, 60)) == "local_strong"
+    llm.surrogate = FakeSurrogate(60.0)
+    assert llm.evaluation_tier(pre_score(90, 90, 90, 90, 90, 90)) == "llm"
@@ -0,0 +1,84 @@
+"""MediaIngest: latest-frame-wins video, bounded audio ring, gap reporting."""
+
+import asyncio
+
+from app.services.media_ingest import MediaIngest
+
+
+def run_ingest(scenario, audio_ring_size=2):
+    """Run scenario(ingest, log) on one loop; returns (log, stats)."""
+    log = []
+
+    async def main():
+        release = asyncio.Event()
+
+        async def on_video(frame):
+            log.append(("video", frame))
+            await release.wait()
+
+        async def on_audio(chunk):
+            log.append(("audio", chunk))
+            await release.wait()
+
+        ingest = MediaIngest(on_video, on_audio, audio_ring_size=audio_ring_size,
+                             on_audio_gap=lambda: log.append(("gap", None)))
+        await scenario(ingest, release)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        stats = ingest.stats()
+        await ingest.close()
+        return stats
+
+    return log, asyncio.run(main())
+
+
+def test_latest_video_frame_wins():
+    async def scenario(ingest, release):
+        ingest.offer_video(1)
+        await asyncio.sleep(0)          # frame 1 is now in flight
+        for frame in (2, 3, 4):
+            ingest.offer_video(frame)
+        release.set()
+
+    log, stats = run_ingest(scenario)
+    assert log == [("video", 1), ("video", 4)]
+    assert stats["video"]["received"] == 4
+    assert stats["video"]["dropped"] == 2
+    assert stats["video"]["processed"] == 2
+
+
+def test_full_audio_ring_drops_oldest_and_reports_the_gap():
+    async def scenario(ingest, release):
+        ingest.offer_audio(1)
+        await asyncio.sleep(0)          # chunk 1 is now in flight
+        for chunk in (2, 3, 4):
+            ingest.offer_audio(chunk)
+        release.set()
+
+    log, stats = run_ingest(scenario)
+    assert log == [("audio", 1), ("gap", None), ("audio", 3), ("audio", 4)]
+    assert stats["audio"]["dropped"] == 1
+    assert stats["audio"]["processed"] == 3
+
+
+def test_handler_errors_do_not_stop_the_worker():
+    seen = []
+
+    async def main():
+        async def on_video(frame):
+            seen.append(frame)
+            if frame == 1:
+                raise RuntimeError("boom")
+
+        async def on_audio(chunk):
+            pass
+
+        ingest = MediaIngest(on_video, on_audio, audio_ring_size=2)
+        ingest.offer_video(1)
+        await asyncio.sleep(0)
+        ingest.offer_video(2)
+        await asyncio.sleep(0)
+        await ingest.close()
+
+    asyncio.run(main())
+    assert seen == [1, 2]
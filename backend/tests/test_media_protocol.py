@@ -0,0 +1,53 @@
+"""media_protocol: binary media frame header round trip and rejection."""
+
+import pytest
+
+from app.utils.media_protocol import (
+    HEADER, HEADER_SIZE, MSG_AUDIO_CHUNK, MSG_VIDEO_FRAME, MediaProtocolError,
+    build_media_packet, parse_media_packet,
+)
+
+
+def test_header_is_24_bytes():
+    assert HEADER_SIZE == 24
+
+
+def test_audio_round_trip_with_transcript():
+    frame = build_media_packet(
+        MSG_AUDIO_CHUNK, 18, b"\x01\x02\x03", seq=7, timestamp_ms=1_700_000_000_123,
+        sample_rate=48000, channels=2, transcript="héllo world",
+    )
+    packet = parse_media_packet(frame)
+    assert packet.is_audio and not packet.is_video
+    assert packet.codec == "webm_opus"
+    assert (packet.seq, packet.timestamp_ms, packet.sample_rate, packet.channels) == \
+        (7, 1_700_000_000_123, 48000, 2)
+    assert packet.transcript == "héllo world"
+    assert bytes(packet.payload) == b"\x01\x02\x03"
+
+
+def test_video_payload_is_a_view_over_the_frame():
+    frame = bytearray(build_media_packet(MSG_VIDEO_FRAME, 1, b"JPEG"))
+    packet = parse_media_packet(frame)
+    assert packet.is_video and packet.codec == "jpeg"
+    assert packet.transcript is None
+    assert packet.channels == 1
+    frame[-1] = ord("X")
+    assert bytes(packet.payload) == b"JPEX"
+
+
+def test_zero_channels_defaults_to_mono():
+    frame = build_media_packet(MSG_AUDIO_CHUNK, 16, b"", channels=0)
+    assert parse_media_packet(frame).channels == 1
+
+
+@pytest.mark.parametrize("frame, message", [
+    (b"\x01" * (HEADER_SIZE - 1), "too short"),
+    (HEADER.pack(2, MSG_VIDEO_FRAME, 1, 1, 0, 0, 0, 0, 0), "version"),
+    (HEADER.pack(1, 9, 1, 1, 0, 0, 0, 0, 0), "message type"),
+    (HEADER.pack(1, MSG_VIDEO_FRAME, 18, 1, 0, 0, 0, 0, 0), "codec"),
+    (HEADER.pack(1, MSG_AUDIO_CHUNK, 16, 1, 0, 0, 0, 5, 0) + b"abc", "exceeds"),
+])
+def test_malformed_frames_are_rejected(frame, message):
+    with pytest.raises(MediaProtocolError, match=message):
+        parse_media_packet(frame)
@@ -0,0 +1,103 @@
+"""
+RealTimeMonitor's deferred answer transcript: Whisper spans and the
+browser's cumulative Web Speech transcript joined in spoken order.
+"""
+
+import asyncio
+
+import numpy as np
+
+from app.config import settings
+from app.services.audio_analyzer import AudioAnalyzer
+from app.services.real_time_monitor import RealTimeMonitor
+from app.services.transcript_router import TranscriptRouter
+
+SR = 16000
+
+
+class FakeTranscription:
+    """TranscriptionService stand-in: one canned text per call."""
+
+    available = True
+
+    def __init__(self, texts):
+        self.texts = list(texts)
+        self.calls = 0
+
+    async def transcribe(self, y, sr):
+        self.calls += 1
+        return {"text": self.texts.pop(0), "inference_ms": 1.0, "cpu_ms": 1.0}
+
+
+class FakeEngine:
+    """InferenceEngine stand-in: real AudioAnalyzer, work run inline."""
+
+    def __init__(self, transcription):
+        self.video_analyzer = None
+        self.audio_analyzer = AudioAnalyzer()
+        self.transcription  = transcription
+        self.llm_service    = None
+
+    async def run(self, fn, *args):
+        return fn(*args)
+
+
+def voiced_pcm(seconds: float = 1.0) -> bytes:
+    t = np.arange(int(seconds * SR)) / SR
+    return (0.3 * np.sin(2 * np.pi * 150 * t) * 32767).astype("<i2").tobytes()
+
+
+def make_monitor(monkeypatch, whisper_texts, mode="answer"):
+    monkeypatch.setattr(settings, "transcription_mode", mode)
+    monitor = RealTimeMonitor(engine=FakeEngine(FakeTranscription(whisper_texts)))
+    monitor.transcripts = TranscriptRouter(mode="hybrid", whisper_available=True)
+    return monitor
+
+
+def answer(monitor, transcripts):
+    """Send one 1 s voiced chunk per transcript (None: the browser sent
+    nothing), finalize the answer and return the audio state."""
+    async def run():
+        for transcript in transcripts:
+            await monitor._analyze_audio(voiced_pcm(), transcript, "pcm_s16le", SR, 1)
+        await monitor.finalize_answer_transcript()
+    asyncio.run(run())
+    return monitor.audio_state
+
+
+def test_cumulative_browser_text_is_not_repeated(monkeypatch):
+    monitor = make_monitor(monkeypatch, ["so basically"])
+    state = answer(monitor, [
+        None,                                       # no browser text → Whisper
+        "I led the",
+        "I led the team",
+        "I led the team to ship it",
+    ])
+    assert state._answer_transcript == "so basically I led the team to ship it"
+    assert state.answer_text["word_count"] == 9
+    assert monitor.transcription.calls == 1
+
+
+def test_browser_spans_use_the_final_revision(monkeypatch):
+    monitor = make_monitor(monkeypatch, ["well", "and then"])
+    state = answer(monitor, [
+        None,
+        "I want",                                   # interim, revised below
+        None,                                       # browser silent → Whisper
+        "I went home",
+    ])
+    assert state._answer_transcript == "well I went and then home"
+
+
+def test_session_totals_count_the_answer_once(monkeypatch):
+    monitor = make_monitor(monkeypatch, ["um so"])
+    state = answer(monitor, [None, "we shipped", "we shipped it on time"])
+    assert state.total_words == 7
+    assert state.total_filler_words == 1
+
+
+def test_browser_only_answer_keeps_chunk_text(monkeypatch):
+    monitor = make_monitor(monkeypatch, [])
+    state = answer(monitor, ["hello there"])
+    assert state.answer_text is None
+    assert monitor.transcription.calls == 0
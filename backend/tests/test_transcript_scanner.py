@@ -0,0 +1,61 @@
+"""transcript_scanner: word-boundary fillers, inflected STAR phrases, counts."""
+
+from app.services.transcript_scanner import TranscriptScanner, scan_transcript
+
+
+def fillers(text):
+    return dict(scan_transcript(text).fillers)
+
+
+def test_fillers_match_whole_words_only():
+    assert fillers("It is likely right, I think") == {"right": 1}
+    assert fillers("the copyright was unlike anything") == {}
+
+
+def test_multi_word_fillers_and_case():
+    scan = scan_transcript("Um, you know, I MEAN it was, um, kind of fine")
+    assert dict(scan.fillers) == {"um": 2, "you know": 1, "kind of": 1, "i mean": 1}
+    assert scan.filler_count == 5
+
+
+def test_fillers_are_not_inflected():
+    assert fillers("she likes okays") == {}
+
+
+def test_filler_breakdown_keeps_list_order():
+    scan = scan_transcript("okay um okay")
+    assert scan.filler_breakdown() == [{"word": "um", "count": 1},
+                                       {"word": "okay", "count": 2}]
+
+
+def test_star_phrases_accept_an_inflected_last_word():
+    assert scan_transcript("the results were good").star_components == ("result",)
+    assert "task" in scan_transcript("several challenges came up").star_components
+    assert "result" in scan_transcript("it impacted sales").star_components
+
+
+def test_star_phrases_need_word_boundaries():
+    # "task" inside "multitasking", "result" inside "resultant" — no match
+    assert scan_transcript("multitasking is resultant").star_components == ()
+
+
+def test_star_multi_word_phrases_and_order():
+    scan = scan_transcript("As a result I led the effort; my role was clear")
+    assert scan.star_components == ("task", "action", "result")
+
+
+def test_word_count_ignores_punctuation_and_percent():
+    scan = scan_transcript("We cut costs by 20 %, team-wide.")
+    assert scan.word_count == 7
+    assert "%" not in scan.vocabulary
+    assert "result" in scan.star_components
+
+
+def test_keywords_drop_stopwords():
+    scan = scan_transcript("I built the data pipeline for the team")
+    assert scan.keywords() == {"built", "data", "pipeline", "team"}
+
+
+def test_empty_text():
+    scan = TranscriptScanner().scan("")
+    assert (scan.word_count, scan.fillers, scan.star_components) == (0, (), ())
@@ -0,0 +1,226 @@
+"""
+train_surrogate.py
+==================
+Fit the surrogate scoring model (services/surrogate_scorer.py) on past
+LLM evaluations and report how well it agrees with the LLM.
+
+Rows are read from MongoDB (every session's responses) or from a JSON
+export (--input: a list of session documents, or of responses). A row is
+used when it has a pre-score and an llm_score that really came from the
+LLM — evaluation_tier "llm", or no tier (stored before tiering). Local and
+fallback scores are the model's own inputs and would only teach it to
+copy composite_pre_score.
+
+Held-out split is by session (--test-fraction), so answers from one
+interview never sit on both sides. Agreement with the LLM on the held-out
+set is reported for the surrogate and for the current anchor
+(composite_pre_score) side by side, with the per-call prediction cost.
+
+Artifacts go to --out-dir:
+  surrogate_scorer-<model_version>.json : every run (versioned)
+  surrogate_scorer.json                 : the one the server loads
+                                          (settings.surrogate_model_path),
+                                          replaced only when the surrogate
+                                          beats composite_pre_score on
+                                          held-out MAE (or with --force)
+
+Run from backend/:
+  python -m training.train_surrogate
+  python -m training.train_surrogate --input export.json --alpha 3 --json report.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings                                   # noqa: E402
+from app.services.surrogate_scorer import (                       # noqa: E402
+    FEATURES, FORMAT_VERSION, SurrogateScorer, agreement, featurize, fit_ridge,
+)
+
+DEFAULT_OUT_DIR = os.path.dirname(settings.surrogate_model_path or "") or "artifacts"
+
+MIN_TRAIN_ROWS  = 30
+MIN_TYPE_ROWS   = 10   # question types rarer than this share the intercept
+LLM_TIERS       = (None, "llm")
+
+
+# ─────────────────────────── Data ────────────────────────────────────────────
+
+async def fetch_sessions():
+    """Session documents with at least one response, from MongoDB."""
+    from motor.motor_asyncio import AsyncIOMotorClient
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    try:
+        cursor = client[settings.database_name].sessions.find(
+            {"responses.0": {"$exists": True}},
+            {"responses.pre_score": 1, "responses.llm_score": 1,
+             "responses.question_type": 1, "responses.answer": 1,
+             "responses.evaluation_tier": 1},
+        )
+        return [doc async for doc in cursor]
+    finally:
+        client.close()
+
+
+def load_rows(sessions):
+    """(session_id, pre_score, question_type, word_count, llm_score) per usable response."""
+    rows = []
+    for i, doc in enumerate(sessions):
+        session_id = str(doc.get("_id", i))
+        responses  = doc["responses"] if "responses" in doc else [doc]
+        for resp in responses:
+            pre_score = resp.get("pre_score") or {}
+            llm_score = resp.get("llm_score")
+            if llm_score is None or pre_score.get("composite_pre_score", 0) <= 0:
+                continue
+            if resp.get("evaluation_tier") not in LLM_TIERS:
+                continue
+            word_count = pre_score.get("word_count_used") \
+                         or len(resp.get("answer", "").split())
+            rows.append((session_id, pre_score, resp.get("question_type", "behavioral"),
+                         word_count, float(llm_score)))
+    return rows
+
+
+def split_by_session(rows, test_fraction: float, seed: int):
+    sessions = sorted({r[0] for r in rows})
+    rng      = np.random.default_rng(seed)
+    rng.shuffle(sessions)
+    n_test   = max(1, int(round(len(sessions) * test_fraction)))
+    held_out = set(sessions[:n_test])
+    return ([r for r in rows if r[0] not in held_out],
+            [r for r in rows if r[0] in held_out])
+
+
+# ─────────────────────────── Training ────────────────────────────────────────
+
+def train(rows, args):
+    train_rows, test_rows = split_by_session(rows, args.test_fraction, args.seed)
+    if len(train_rows) < MIN_TRAIN_ROWS or not test_rows:
+        raise SystemExit(f"Need at least {MIN_TRAIN_ROWS} training rows and a held-out "
+                         f"session (have {len(train_rows)} / {len(test_rows)})")
+
+    counts = {}
+    for r in train_rows:
+        counts[r[2]] = counts.get(r[2], 0) + 1
+    question_types = sorted(t for t, n in counts.items() if n >= MIN_TYPE_ROWS)
+
+    X_train = np.array([featurize(p, t, question_types, wc) for _, p, t, wc, _ in train_rows])
+    y_train = np.array([r[4] for r in train_rows])
+    y_test  = np.array([r[4] for r in test_rows])
+
+    model_version = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    artifact = {
+        "format":         "surrogate_scorer",
+        "format_version": FORMAT_VERSION,
+        "model_version":  model_version,
+        "model":          "ridge",
+        "alpha":          args.alpha,
+        "features":       FEATURES,
+        "question_types": question_types,
+        **fit_ridge(X_train, y_train, args.alpha),
+        "trained_at":     datetime.utcnow().isoformat(),
+        "n_train":        len(train_rows),
+        "n_test":         len(test_rows),
+    }
+
+    # Held-out agreement through the serving path, vs the current anchor
+    scorer    = SurrogateScorer(artifact)
+    predicted = np.array([scorer.predict(p, t, wc) for _, p, t, wc, _ in test_rows])
+    composite = np.array([p["composite_pre_score"] for _, p, _, _, _ in test_rows])
+    artifact["metrics"] = {
+        "surrogate": agreement(predicted, y_test),
+        "composite": agreement(composite, y_test),
+        "train_mae": agreement(
+            np.array([scorer.predict(p, t, wc) for _, p, t, wc, _ in train_rows]),
+            y_train)["mae"],
+    }
+
+    # Serving cost per prediction
+    sample = [(p, t) for _, p, t, _, _ in test_rows][:256]
+    reps   = max(1, 20000 // len(sample))
+    t = time.perf_counter()
+    for _ in range(reps):
+        for p, qt in sample:
+            scorer.predict(p, qt)
+    artifact["metrics"]["predict_us"] = round(
+        (time.perf_counter() - t) / (reps * len(sample)) * 1e6, 2)
+    return artifact
+
+
+def save(artifact, out_dir: str, force: bool):
+    os.makedirs(out_dir, exist_ok=True)
+    versioned = os.path.join(out_dir, f"surrogate_scorer-{artifact['model_version']}.json")
+    with open(versioned, "w") as f:
+        json.dump(artifact, f, indent=2)
+
+    metrics  = artifact["metrics"]
+    better   = metrics["surrogate"]["mae"] < metrics["composite"]["mae"]
+    promoted = better or force
+    if promoted:
+        shutil.copyfile(versioned, os.path.join(out_dir, "surrogate_scorer.json"))
+    return versioned, promoted
+
+
+# ─────────────────────────── CLI ─────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--input",         help="JSON export instead of MongoDB")
+    ap.add_argument("--alpha",         type=float, default=1.0, help="ridge penalty")
+    ap.add_argument("--test-fraction", type=float, default=0.2, help="sessions held out")
+    ap.add_argument("--seed",          type=int,   default=0)
+    ap.add_argument("--out-dir",       default=DEFAULT_OUT_DIR)
+    ap.add_argument("--force",         action="store_true",
+                    help="promote even if it does not beat composite_pre_score")
+    ap.add_argument("--json",          help="write the report to this file")
+    args = ap.parse_args()
+
+    if args.input:
+        with open(args.input) as f:
+            sessions = json.load(f)
+    else:
+        sessions = asyncio.run(fetch_sessions())
+    rows = load_rows(sessions)
+    print(f"{len(rows)} LLM-scored responses from {len({r[0] for r in rows})} sessions")
+
+    artifact       = train(rows, args)
+    path, promoted = save(artifact, args.out_dir, args.force)
+    metrics        = artifact["metrics"]
+
+    print(f"model {artifact['model_version']}: {artifact['n_train']} train / "
+          f"{artifact['n_test']} held-out rows, question types {artifact['question_types']}")
+    print(f"{'anchor':10s} {'MAE':>6s} {'RMSE':>6s} {'bias':>6s} {'r':>6s} "
+          f"{'±5':>6s} {'±10':>6s} {'±15':>6s}")
+    for name in ("surrogate", "composite"):
+        m = metrics[name]
+        print(f"{name:10s} {m['mae']:6.2f} {m['rmse']:6.2f} {m['bias']:6.2f} "
+              f"{m['pearson_r']:6.3f} {m['within_5']:5.1f}% {m['within_10']:5.1f}% "
+              f"{m['within_15']:5.1f}%")
+    print(f"predict: {metrics['predict_us']} µs per call")
+    print(f"✓ saved {path}")
+    if promoted:
+        print(f"✓ promoted to {os.path.join(args.out_dir, 'surrogate_scorer.json')}")
+    else:
+        print("⚠  not promoted — no better than composite_pre_score on held-out MAE "
+              "(--force to promote anyway)")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "model_version": artifact["model_version"],
+                       "promoted": promoted, "metrics": metrics}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -216,10 +216,11 @@ const useMediaRecorder = () => {
         
         frameIntervalRef.current = setInterval(() => {
           if (videoRef.current && isCameraEnabled) {
-            const frameData = mediaService.captureFrame(videoRef.current);
-            if (frameData) {
-              onVideoFrame(frameData);
-            }
+            mediaService.captureFrameBlob(videoRef.current).then((frameData) => {
+              if (frameData) {
+                onVideoFrame(frameData);
+              }
+            });
           }
         }, frameInterval);
       }
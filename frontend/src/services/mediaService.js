@@ -118,6 +118,31 @@ class MediaService {
     }
   }
 
+  /**
+   * Capture video frame as a JPEG Blob (sent as a binary frame, no base64)
+   */
+  captureFrameBlob(videoElement) {
+    if (!videoElement) {
+      return Promise.reject(new Error('Video element not provided'));
+    }
+
+    return new Promise((resolve) => {
+      try {
+        const canvas = document.createElement('canvas');
+        canvas.width = VIDEO_SETTINGS.WIDTH;
+        canvas.height = VIDEO_SETTINGS.HEIGHT;
+
+        const ctx = canvas.getContext('2d');
+        ctx.drawImage(videoElement, 0, 0, canvas.width, canvas.height);
+
+        canvas.toBlob(resolve, 'image/jpeg', VIDEO_SETTINGS.QUALITY);
+      } catch (error) {
+        console.error('Error capturing frame:', error);
+        resolve(null);
+      }
+    });
+  }
+
   /**
    * 🔥 FIX: Start audio recording (removed stream check, use this.audioTrack)
    */
@@ -145,10 +170,20 @@ class MediaService {
       });
       
       this.audioChunks = [];
+
+      // WebM / Ogg Opus go out as binary frames; other containers as base64
+      const binary = /^audio\/(webm|ogg)/.test(this.mediaRecorder.mimeType);
       
       this.mediaRecorder.ondataavailable = (event) => {
         if (event.data.size > 0) {
           this.audioChunks.push(event.data);
+
+          if (binary) {
+            if (onDataAvailable) {
+              onDataAvailable(event.data);
+            }
+            return;
+          }
           
           // Convert to base64 and call callback
           const blob = new Blob([event.data], { type: event.data.type });
@@ -1,4 +1,4 @@
-import { WS_URL, WS_MESSAGE_TYPES, STORAGE_KEYS } from '../utils/constants';
+import { WS_URL, WS_MESSAGE_TYPES, STORAGE_KEYS, MEDIA_PROTOCOL } from '../utils/constants';
 
 class WebSocketService {
   constructor() {
@@ -10,6 +10,8 @@ class WebSocketService {
     this.reconnectDelay = 3000;
     this.isIntentionallyClosed = false;
     this.heartbeatInterval = null;
+    this.mediaSeq = 0;
+    this.audioSendChain = Promise.resolve();
   }
 
   /**
@@ -238,6 +240,14 @@ class WebSocketService {
    * Send video frame
    */
   sendVideoFrame(frameData) {
+    // JPEG Blob from mediaService.captureFrameBlob → binary frame
+    if (frameData instanceof Blob) {
+      frameData.arrayBuffer()
+        .then((buffer) => this.sendVideoFrameBinary(buffer))
+        .catch((error) => console.error('Error reading video frame:', error));
+      return;
+    }
+
     this.send({
       type: WS_MESSAGE_TYPES.VIDEO_FRAME,
       data: frameData,
@@ -249,6 +259,19 @@ class WebSocketService {
    * Send audio chunk
    */
   sendAudioChunk(audioData, transcript = null) {
+    // MediaRecorder Blob → binary frame. Chunks of one container stream only
+    // decode in order, so reads are chained rather than raced.
+    if (audioData instanceof Blob) {
+      const codec = audioData.type.startsWith('audio/ogg')
+        ? MEDIA_PROTOCOL.CODECS.OGG_OPUS
+        : MEDIA_PROTOCOL.CODECS.WEBM_OPUS;
+      this.audioSendChain = this.audioSendChain
+        .then(() => audioData.arrayBuffer())
+        .then((buffer) => this.sendAudioChunkBinary(buffer, transcript, codec))
+        .catch((error) => console.error('Error reading audio chunk:', error));
+      return;
+    }
+
     this.send({
       type: WS_MESSAGE_TYPES.AUDIO_CHUNK,
       data: audioData,
@@ -257,6 +280,60 @@ class WebSocketService {
     });
   }
 
+  /**
+   * Send raw media as a binary frame (no base64 / JSON).
+   * Layout: 24-byte header + optional UTF-8 transcript + payload bytes.
+   */
+  sendMedia(msgType, codec, payload, { sampleRate = 0, channels = 1, transcript = null } = {}) {
+    if (!this.isConnected()) return false;
+
+    let text = transcript ? new TextEncoder().encode(transcript) : new Uint8Array(0);
+    if (text.length > MEDIA_PROTOCOL.MAX_TEXT_BYTES) {
+      // text_len is a u16: cut at the last whole UTF-8 character that fits
+      let end = MEDIA_PROTOCOL.MAX_TEXT_BYTES;
+      while (end > 0 && (text[end] & 0xc0) === 0x80) end -= 1;
+      console.warn(`Transcript truncated to ${end} of ${text.length} bytes`);
+      text = text.subarray(0, end);
+    }
+    const body = payload instanceof ArrayBuffer ? new Uint8Array(payload) : new Uint8Array(payload.buffer, payload.byteOffset, payload.byteLength);
+    const frame = new Uint8Array(MEDIA_PROTOCOL.HEADER_SIZE + text.length + body.length);
+    const view = new DataView(frame.buffer);
+
+    view.setUint8(0, MEDIA_PROTOCOL.VERSION);
+    view.setUint8(1, msgType);
+    view.setUint8(2, codec);
+    view.setUint8(3, channels);
+    view.setUint32(4, this.mediaSeq++ >>> 0);
+    view.setBigUint64(8, BigInt(Date.now()));
+    view.setUint32(16, sampleRate);
+    view.setUint16(20, text.length);
+    view.setUint16(22, 0);
+    frame.set(text, MEDIA_PROTOCOL.HEADER_SIZE);
+    frame.set(body, MEDIA_PROTOCOL.HEADER_SIZE + text.length);
+
+    try {
+      this.ws.send(frame.buffer);
+      return true;
+    } catch (error) {
+      console.error('Error sending media frame:', error);
+      return false;
+    }
+  }
+
+  /**
+   * Send a JPEG frame (ArrayBuffer, e.g. from canvas.toBlob) as binary
+   */
+  sendVideoFrameBinary(jpegBuffer) {
+    return this.sendMedia(MEDIA_PROTOCOL.MSG_VIDEO_FRAME, MEDIA_PROTOCOL.CODECS.JPEG, jpegBuffer);
+  }
+
+  /**
+   * Send an audio chunk as binary (WebM/Opus by default, or raw PCM)
+   */
+  sendAudioChunkBinary(audioBuffer, transcript = null, codec = MEDIA_PROTOCOL.CODECS.WEBM_OPUS, sampleRate = 0, channels = 1) {
+    return this.sendMedia(MEDIA_PROTOCOL.MSG_AUDIO_CHUNK, codec, audioBuffer, { sampleRate, channels, transcript });
+  }
+
   /**
    * Send answer
    */
@@ -51,6 +51,24 @@ export const WS_MESSAGE_TYPES = {
   HEARTBEAT: 'heartbeat',
 };
 
+// Binary media protocol (mirrors backend/app/utils/media_protocol.py)
+export const MEDIA_PROTOCOL = {
+  VERSION: 1,
+  HEADER_SIZE: 24,
+  MAX_TEXT_BYTES: 0xffff, // text_len is a u16
+  MSG_VIDEO_FRAME: 1,
+  MSG_AUDIO_CHUNK: 2,
+  CODECS: {
+    JPEG: 1,
+    WEBP: 2,
+    PCM_S16LE: 16,
+    PCM_F32LE: 17,
+    WEBM_OPUS: 18,
+    OGG_OPUS: 19,
+    WAV: 20,
+  },
+};
+
 // Video Settings
 export const VIDEO_SETTINGS = {
   WIDTH: 640,